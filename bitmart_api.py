@@ -5,12 +5,83 @@ Documentation: https://developer-pro.bitmart.com/en/spot/
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
 import hashlib
 import time
 import json
-from typing import Dict, List, Optional, Tuple
+import logging
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import zlib
+import os
+from pathlib import Path
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+# Library logger: silent unless the application attaches a handler
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Try to import websocket-client for the streaming ticker (optional)
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    # Fallback to REST polling if websocket-client not installed
+    websocket = None
+    WEBSOCKET_AVAILABLE = False
+
+# Structured (column-contiguous) dtype returned by get_klines_range
+KLINE_DTYPE = np.dtype([('t', 'i8'), ('o', 'f8'), ('h', 'f8'), ('l', 'f8'), ('c', 'f8'), ('v', 'f8')])
+KLINE_PAGE_LIMIT = 200  # max candles per /spot/quotation/v3/klines call
+
+# Try to import orjson for faster JSON encode/decode (optional)
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # Fallback to stdlib json (compact separators so the signed bytes stay stable)
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+class _Flight:
+    """A GET in progress that concurrent identical callers wait on"""
+    
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _BitMartRetry(Retry):
+    """
+    Retry policy for the BitMart session.
+    
+    Idempotent GETs are retried on 429/5xx. A POST is only retried on 429,
+    where the server rejected the call outright - a 5xx on submit_order may
+    already have been executed, so it is never replayed.
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST" and status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
 
 
 class BitMartAPI:
@@ -32,114 +103,233 @@ class BitMartAPI:
         self.base_url = "https://api-cloud.bitmart.com"
         self.session = requests.Session()
         
-        # Rate limiting
-        self.last_request_time = 0
+        # Connection pool sized for bursty trading; 429 and transient 5xx are
+        # retried at the adapter layer, honoring Retry-After. raise_on_status=False
+        # hands the final response back so _send surfaces the real HTTP error.
+        retry = _BitMartRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        # Session-wide defaults; unsigned calls send no per-request headers
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "User-Agent": "ma-long/1.0",
+            "Connection": "keep-alive"
+        })
+        
+        # Pre-built signing material: the keyed HMAC state is copied per
+        # signature to skip key setup. The template itself is never updated,
+        # so copies are safe across threads.
+        self._hmac_template = hmac.new(secret_key.encode('utf-8'), b'', hashlib.sha256)
+        self._memo_part = f"#{memo}#".encode('utf-8')
+        
+        # Static part of the signed headers; Content-Type for unsigned calls
+        # comes from the session defaults above
+        self._signed_template = {"Content-Type": "application/json", "X-BM-KEY": api_key}
+        
+        # Rate limiting (lock makes the limiter safe for concurrent callers)
+        self._last_mono = 0.0  # time.monotonic() of the last reserved request slot
         self.min_request_interval = 0.2  # 200ms between requests (max 5 req/sec)
+        self._rate_lock = threading.Lock()
+        
+        # Single-flight map for shared reads (see _shared_get)
+        self._inflight: Dict[tuple, _Flight] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Symbol details cache (trading pair metadata rarely changes)
+        self._symbols_cache = None
+        self._symbols_cache_ts = 0
+        self._symbols_cache_ttl = 86400  # 1 day (memory and disk)
+        self._symbols_cache_path = Path.home() / ".ma-long" / "cache" / "bitmart_symbols.json"
+        self._symbols_index = {}
+        self._precision_index: Dict[str, Tuple[int, int]] = {}  # symbol -> (base_precision, quote_precision)
+        self._symbols_lock = threading.Lock()  # one thread refreshes, indexes and persists
+        
+        # Last-price cache (collapses repeated within-tick lookups into one ticker call)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}  # symbol -> (price, monotonic_ts)
+        self._price_ttl = 0.5  # seconds
+        
+        # Wallet index for get_balance_for_asset (dropped after order placement/cancellation)
+        self._wallet_index: Dict[str, Dict] = {}  # currency id -> wallet entry
+        self._wallet_ts = 0.0  # monotonic time of the last wallet fetch
+        self._wallet_ttl = 1.0  # seconds
+        
+        # WebSocket ticker stream (see start_ticker_stream)
+        self.ws_url = "wss://ws-manager-compress.bitmart.com/api?protocol=1.1"
+        self._last_prices: Dict[str, Tuple[float, float]] = {}  # symbol -> (price, monotonic_ts)
+        self._ws_stale_after = 10.0  # seconds without a push before falling back to REST
+        self._ws_symbols: List[str] = []
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_stop = threading.Event()
+        
+    @staticmethod
+    def _decimal_places(value: str) -> int:
+        """Count significant decimal places of a step size string (e.g. "0.001" -> 3, "1" -> 0)"""
+        if '.' not in value:
+            return 0
+        return len(value.split('.')[-1].rstrip('0'))
+    
+    @staticmethod
+    def _quantize(value, places: int, rounding: str = ROUND_DOWN) -> Decimal:
+        """Snap a float/Decimal onto the exchange's decimal step lattice (10 ** -places)"""
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return value.quantize(Decimal(1).scaleb(-places), rounding=rounding)
+    
+    def _generate_signature(self, timestamp: str, body: Union[str, bytes]) -> str:
+        """
+        Generate HMAC SHA256 signature over "timestamp#memo#body"
         
-    def _generate_signature(self, timestamp: str, body: str) -> str:
-        """Generate HMAC SHA256 signature"""
-        message = f"{timestamp}#{self.memo}#{body}"
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
-    
-    def _get_headers(self, method: str = "GET", body: str = "") -> Dict:
+        The parts are fed to the HMAC incrementally, so no joined message is
+        built; an already-serialized bytes body is hashed without re-encoding.
+        """
+        h = self._hmac_template.copy()
+        h.update(timestamp.encode('ascii'))
+        h.update(self._memo_part)
+        if body:
+            h.update(body if isinstance(body, bytes) else body.encode('utf-8'))
+        return h.hexdigest()
+    
+    def _get_headers(self, method: str = "GET", body: Union[str, bytes] = b"") -> Dict:
         """Get request headers with signature"""
         timestamp = str(int(time.time() * 1000))
         signature = self._generate_signature(timestamp, body)
         
-        headers = {
-            "Content-Type": "application/json",
-            "X-BM-KEY": self.api_key,
-            "X-BM-SIGN": signature,
-            "X-BM-TIMESTAMP": timestamp
-        }
+        headers = self._signed_template.copy()
+        headers["X-BM-SIGN"] = signature
+        headers["X-BM-TIMESTAMP"] = timestamp
         return headers
     
     def _rate_limit(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """
+        Apply rate limiting between requests
+        
+        Each caller reserves the next free slot under the lock and sleeps
+        outside it, so concurrent threads are paced without blocking each other.
+        Uses the monotonic clock so NTP adjustments cannot distort the pacing;
+        wall-clock time is only used for the signed X-BM-TIMESTAMP header.
+        """
+        with self._rate_lock:
+            current_time = time.monotonic()
+            slot = max(current_time, self._last_mono + self.min_request_interval)
+            self._last_mono = slot
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
+        sleep_time = slot - current_time
+        if sleep_time > 0:
             time.sleep(sleep_time)
+    
+    def _send(self, method: str, endpoint: str, params: Optional[Dict] = None,
+              body: Optional[bytes] = None, headers: Optional[Dict] = None) -> Dict:
+        """
+        Send a prepared request to BitMart API and unwrap the response
         
-        self.last_request_time = time.time()
+        Rate-limit (429) and transient 5xx retries are handled by the mounted
+        adapter's Retry policy, which honors the server's Retry-After header.
+        
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint
+            params: Query parameters
+            body: Pre-serialized request body (exactly the bytes that were signed)
+            headers: Per-request headers (None to use session defaults)
+            
+        Returns:
+            API response as dict
+        """
+        self._rate_limit()
+        
+        try:
+            response = self.session.request(method, f"{self.base_url}{endpoint}", params=params,
+                                            data=body, headers=headers, timeout=10)
+            response.raise_for_status()
+            result = _json_loads(response.content)
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            raise Exception(f"Request failed: {str(e)}")
+        
+        # Check BitMart API response code
+        if result.get("code") != 1000:
+            # BitMart uses 'msg' or 'message' for error messages
+            error_msg = result.get('message') or result.get('msg', 'Unknown error')
+            raise Exception(f"BitMart API Error: Code={result.get('code')}, Message={error_msg}, Data={result.get('data')}")
+        
+        return result
     
-    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
-                 data: Optional[Dict] = None, signed: bool = False, max_retries: int = 3) -> Dict:
+    def _get(self, endpoint: str, params: Optional[Dict] = None, signed: bool = False) -> Dict:
         """
-        Make HTTP request to BitMart API with retry logic
+        GET request; unsigned calls skip header and signature setup entirely
         
         Args:
-            method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             params: Query parameters
+            signed: Whether request requires signature (signed over an empty body)
+            
+        Returns:
+            API response as dict
+        """
+        headers = self._get_headers("GET", b"") if signed else None
+        return self._send("GET", endpoint, params=params, headers=headers)
+    
+    def _post_signed(self, endpoint: str, data: Dict) -> Dict:
+        """
+        Signed POST request; the body is serialized once and those exact
+        bytes are both signed and sent
+        
+        Args:
+            endpoint: API endpoint
             data: Request body
-            signed: Whether request requires signature
-            max_retries: Maximum number of retries for rate limit errors
             
         Returns:
             API response as dict
         """
-        url = f"{self.base_url}{endpoint}"
+        body = _json_dumps(data)
+        return self._send("POST", endpoint, body=body, headers=self._get_headers("POST", body))
+    
+    def _shared_get(self, endpoint: str, params: Optional[Dict] = None, signed: bool = False) -> Dict:
+        """
+        GET with single-flight coalescing
         
-        if signed:
-            body = json.dumps(data) if data else ""
-            headers = self._get_headers(method, body)
-        else:
-            headers = {"Content-Type": "application/json"}
-            body = None
+        If an identical GET is already in flight, wait for its result instead
+        of issuing a second request. Used for heavily-shared reads (ticker,
+        symbols, wallet) so concurrent callers cost one rate-limit slot.
         
-        for attempt in range(max_retries):
-            try:
-                # Apply rate limiting
-                self._rate_limit()
-                
-                if method == "GET":
-                    response = self.session.get(url, params=params, headers=headers, timeout=10)
-                elif method == "POST":
-                    response = self.session.post(url, json=data, headers=headers, timeout=10)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                # Handle rate limit (429)
-                if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        # Exponential backoff: 1s, 2s, 4s
-                        wait_time = 2 ** attempt
-                        print(f"Rate limit hit, waiting {wait_time}s before retry...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise Exception(f"Rate limit exceeded after {max_retries} retries")
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Check BitMart API response code
-                if result.get("code") != 1000:
-                    # BitMart uses 'msg' or 'message' for error messages
-                    error_msg = result.get('message') or result.get('msg', 'Unknown error')
-                    raise Exception(f"BitMart API Error: Code={result.get('code')}, Message={error_msg}, Data={result.get('data')}")
-                
-                return result
-                
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1 and "429" in str(e):
-                    # Retry on rate limit
-                    wait_time = 2 ** attempt
-                    print(f"Rate limit error, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise Exception(f"Request failed: {str(e)}")
-        
-        raise Exception(f"Request failed after {max_retries} retries")
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            signed: Whether request requires signature
+            
+        Returns:
+            API response as dict (shared between coalesced callers - do not mutate)
+        """
+        key = (endpoint, frozenset(params.items()) if params else None, signed)
+        
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = self._get(endpoint, params=params, signed=signed)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
     
     # ==================== Public Market Data ====================
     
@@ -155,7 +345,7 @@ class BitMartAPI:
         """
         endpoint = "/spot/v1/ticker"
         params = {"symbol": symbol}
-        return self._request("GET", endpoint, params=params)
+        return self._shared_get(endpoint, params=params)
     
     def get_kline(self, symbol: str, from_time: int, to_time: int, step: int = 60) -> Dict:
         """
@@ -177,14 +367,144 @@ class BitMartAPI:
             "before": to_time,
             "after": from_time,
             "step": step,
-            "limit": 200
+            "limit": KLINE_PAGE_LIMIT
         }
-        return self._request("GET", endpoint, params=params)
+        return self._get(endpoint, params=params)
+    
+    def get_klines_range(self, symbol: str, start: int, end: int, step: int = 60,
+                         max_workers: int = 5) -> np.ndarray:
+        """
+        Get klines for an arbitrary time range
+        
+        The range is split into 200-candle windows which are fetched
+        concurrently over the shared session (the rate limiter still paces
+        the actual calls) and stacked into a single structured array.
+        
+        Args:
+            symbol: Trading pair (e.g., BTC_USDT)
+            start: Start time (unix timestamp in seconds)
+            end: End time (unix timestamp in seconds)
+            step: Kline step in minutes (see get_kline)
+            max_workers: Maximum number of windows fetched in parallel
+            
+        Returns:
+            numpy structured array with KLINE_DTYPE fields t/o/h/l/c/v,
+            sorted by timestamp with duplicates removed
+        """
+        window = KLINE_PAGE_LIMIT * step * 60
+        bounds = [(t, min(t + window, end)) for t in range(start, end, window)]
+        if not bounds:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(bounds))) as pool:
+            pages = list(pool.map(lambda b: self.get_kline(symbol, b[0], b[1], step).get("data") or [], bounds))
+        
+        # V3 API format: [timestamp, open, high, low, close, volume, quote_volume]
+        rows = [kline[:6] for page in pages for kline in page]
+        out = np.empty(len(rows), dtype=KLINE_DTYPE)
+        if rows:
+            cols = np.array(rows, dtype=np.float64)
+            out['t'] = cols[:, 0]
+            for j, name in enumerate(('o', 'h', 'l', 'c', 'v'), start=1):
+                out[name] = cols[:, j]
+        
+        # Adjacent windows share their boundary candle
+        _, unique_idx = np.unique(out['t'], return_index=True)
+        return out[unique_idx]
     
     def get_symbols_details(self) -> Dict:
-        """Get all trading pairs details"""
-        endpoint = "/spot/v1/symbols/details"
-        return self._request("GET", endpoint)
+        """
+        Get all trading pairs details
+        
+        Response is cached in memory and on disk (~/.ma-long/cache) for
+        `_symbols_cache_ttl` seconds and indexed by symbol for O(1) lookups
+        in get_symbol_detail.
+        
+        Returns:
+            Symbols details response
+        """
+        if self._symbols_cache is not None and time.time() - self._symbols_cache_ts < self._symbols_cache_ttl:
+            return self._symbols_cache
+        
+        # Concurrent callers wait here and then take the cache the first one
+        # installed, so the response is indexed and written to disk only once
+        with self._symbols_lock:
+            if self._symbols_cache is not None and time.time() - self._symbols_cache_ts < self._symbols_cache_ttl:
+                return self._symbols_cache
+            
+            # Survive restarts: reuse the on-disk copy while it is younger than the TTL
+            result = self._load_symbols_from_disk()
+            if result is not None:
+                return result
+            
+            endpoint = "/spot/v1/symbols/details"
+            result = self._get(endpoint)
+            self._index_symbols(result, time.time())
+            self._save_symbols_to_disk(result)
+            return result
+    
+    def _index_symbols(self, result: Dict, fetched_at: float):
+        """Install a symbols response as the in-memory cache and build its indexes"""
+        symbols = result.get("data", {}).get("symbols", [])
+        self._symbols_index = {s.get("symbol"): s for s in symbols}
+        self._precision_index = {
+            s.get("symbol"): (
+                self._decimal_places(s.get("base_min_size", "0.00000001")),
+                self._decimal_places(s.get("quote_increment", "0.01"))
+            )
+            for s in symbols
+        }
+        self._symbols_cache = result
+        self._symbols_cache_ts = fetched_at
+    
+    def _load_symbols_from_disk(self) -> Optional[Dict]:
+        """Load the persisted symbols response if it exists and is fresh"""
+        try:
+            mtime = self._symbols_cache_path.stat().st_mtime
+            if time.time() - mtime >= self._symbols_cache_ttl:
+                return None
+            result = _json_loads(self._symbols_cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        self._index_symbols(result, mtime)
+        return result
+    
+    def _save_symbols_to_disk(self, result: Dict):
+        """Persist the symbols response atomically (best effort)"""
+        path = self._symbols_cache_path
+        # Unique per process and thread, so no writer truncates another's temp file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(_json_dumps(result))
+            os.replace(tmp, path)
+        except OSError as e:
+            log.debug("Could not persist symbols cache to %s: %s", path, e)
+    
+    def invalidate_symbols_cache(self):
+        """Force the next get_symbols_details call to refetch from the API"""
+        try:
+            self._symbols_cache_path.unlink()
+        except OSError:
+            pass
+        self._symbols_cache = None
+        self._symbols_cache_ts = 0
+        self._symbols_index = {}
+        self._precision_index = {}
+    
+    def get_symbol_precision(self, symbol: str) -> Optional[Tuple[int, int]]:
+        """
+        Get precomputed precision for a symbol
+        
+        Args:
+            symbol: Trading pair (e.g., BTC_USDT)
+            
+        Returns:
+            Tuple of (base_precision, quote_precision) or None if not found
+        """
+        self.get_symbols_details()
+        return self._precision_index.get(symbol)
     
     def get_symbol_detail(self, symbol: str) -> Optional[Dict]:
         """
@@ -196,20 +516,19 @@ class BitMartAPI:
         Returns:
             Symbol details or None if not found
         """
-        result = self.get_symbols_details()
-        symbols = result.get("data", {}).get("symbols", [])
-        
-        for sym in symbols:
-            if sym.get("symbol") == symbol:
-                return sym
-        return None
+        self.get_symbols_details()
+        return self._symbols_index.get(symbol)
     
     # ==================== Account & Wallet ====================
     
     def get_wallet_balance(self) -> Dict:
         """Get spot wallet balance"""
         endpoint = "/spot/v1/wallet"
-        return self._request("GET", endpoint, signed=True)
+        return self._shared_get(endpoint, signed=True)
+    
+    def invalidate_wallet(self):
+        """Force the next get_balance_for_asset to refetch the wallet"""
+        self._wallet_ts = 0.0
     
     def get_account_balance(self, currency: Optional[str] = None) -> Dict:
         """
@@ -223,7 +542,7 @@ class BitMartAPI:
         """
         endpoint = "/account/v1/wallet"
         params = {"currency": currency} if currency else None
-        return self._request("GET", endpoint, params=params, signed=True)
+        return self._get(endpoint, params=params, signed=True)
     
     # ==================== Trading ====================
     
@@ -242,9 +561,15 @@ class BitMartAPI:
             
         Returns:
             Order result
+            
+        Raises:
+            Exception: If the order violates the symbol's size/notional minimums
+                (checked locally, so no request is spent on a doomed submit)
         """
         endpoint = "/spot/v2/submit_order"
         
+        size, price = self._validate_order(symbol, side, size, price)
+        
         data = {
             "symbol": symbol,
             "side": side,
@@ -257,7 +582,56 @@ class BitMartAPI:
         if client_order_id:
             data["client_order_id"] = client_order_id
         
-        return self._request("POST", endpoint, data=data, signed=True)
+        result = self._post_signed(endpoint, data)
+        # Force a fresh price and wallet for post-trade PnL/stop checks
+        self.invalidate_price(symbol)
+        self.invalidate_wallet()
+        return result
+    
+    def _validate_order(self, symbol: str, side: str, size: str,
+                        price: Optional[str]) -> Tuple[str, Optional[str]]:
+        """
+        Snap size/price to the symbol's step lattice and check exchange minimums
+        
+        Uses the cached symbol details; if they cannot be loaded the inputs
+        are passed through unchanged and the exchange does the validation.
+        
+        Args:
+            symbol: Trading pair
+            side: Order side (buy, sell)
+            size: Order size
+            price: Order price (optional)
+            
+        Returns:
+            Tuple of (size, price) strings quantized to symbol precision
+        """
+        try:
+            detail = self.get_symbol_detail(symbol)
+        except Exception as e:
+            log.debug("Symbol details unavailable, skipping order validation: %s", e)
+            return size, price
+        if not detail:
+            return size, price
+        
+        size = self.format_quantity(symbol, float(size))
+        if price:
+            price = self.format_price(symbol, float(price))
+        
+        qty = Decimal(size)
+        base_min = Decimal(detail.get("base_min_size") or "0")
+        if qty <= 0 or qty < base_min:
+            raise Exception(f"Order rejected locally: size {size} below base_min_size {base_min} for {symbol}")
+        
+        if price:
+            min_notional = Decimal(detail.get(f"min_{side.lower()}_amount") or "0")
+            notional = qty * Decimal(price)
+            if notional < min_notional:
+                raise Exception(
+                    f"Order rejected locally: notional {notional} below min_{side.lower()}_amount "
+                    f"{min_notional} for {symbol}"
+                )
+        
+        return size, price
     
     def cancel_order(self, symbol: str, order_id: Optional[str] = None, 
                      client_order_id: Optional[str] = None) -> Dict:
@@ -280,7 +654,10 @@ class BitMartAPI:
         if client_order_id:
             data["client_order_id"] = client_order_id
         
-        return self._request("POST", endpoint, data=data, signed=True)
+        result = self._post_signed(endpoint, data)
+        # Cancelling releases frozen funds
+        self.invalidate_wallet()
+        return result
     
     def get_order_detail(self, symbol: str, order_id: str) -> Dict:
         """
@@ -298,7 +675,7 @@ class BitMartAPI:
             "symbol": symbol,
             "order_id": order_id
         }
-        return self._request("GET", endpoint, params=params, signed=True)
+        return self._get(endpoint, params=params, signed=True)
     
     def get_open_orders(self, symbol: Optional[str] = None) -> Dict:
         """
@@ -315,7 +692,7 @@ class BitMartAPI:
         if symbol:
             params["symbol"] = symbol
         
-        return self._request("GET", endpoint, params=params, signed=True)
+        return self._get(endpoint, params=params, signed=True)
     
     def get_order_history(self, symbol: str, offset: int = 1, limit: int = 100) -> Dict:
         """
@@ -336,7 +713,7 @@ class BitMartAPI:
             "limit": limit,
             "status": "6"  # 6 = all orders
         }
-        return self._request("GET", endpoint, params=params, signed=True)
+        return self._get(endpoint, params=params, signed=True)
     
     # ==================== Helper Methods ====================
     
@@ -350,12 +727,120 @@ class BitMartAPI:
         Returns:
             Current price as float
         """
+        # Prefer the streamed price while the WebSocket keeps it fresh
+        pushed = self._last_prices.get(symbol)
+        if pushed is not None and time.monotonic() - pushed[1] < self._ws_stale_after:
+            return pushed[0]
+        
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] < self._price_ttl:
+            return cached[0]
+        
         ticker = self.get_ticker(symbol)
         data = ticker.get("data", {})
         tickers = data.get("tickers", [])
-        if tickers:
-            return float(tickers[0].get("last_price", 0))
-        return 0.0
+        if not tickers:
+            return 0.0
+        
+        price = float(tickers[0].get("last_price", 0))
+        self._price_cache[symbol] = (price, time.monotonic())
+        return price
+    
+    def invalidate_price(self, symbol: Optional[str] = None):
+        """
+        Drop the cached price so the next get_current_price hits the ticker
+        
+        Args:
+            symbol: Trading pair to invalidate (None clears all symbols)
+        """
+        if symbol is None:
+            self._price_cache.clear()
+        else:
+            self._price_cache.pop(symbol, None)
+    
+    # ==================== WebSocket Ticker Stream ====================
+    
+    def start_ticker_stream(self, symbols: List[str]) -> bool:
+        """
+        Start a background WebSocket subscription to spot tickers
+        
+        Pushed prices are served by get_current_price, which falls back to
+        REST for symbols that have not been pushed yet or have gone stale.
+        
+        Args:
+            symbols: Trading pairs to subscribe (e.g., ["BTC_USDT"])
+            
+        Returns:
+            True if the stream was started, False if websocket-client is not installed
+        """
+        if not WEBSOCKET_AVAILABLE:
+            return False
+        
+        self._ws_symbols = list(symbols)
+        if self._ws_thread is not None and self._ws_thread.is_alive():
+            return True
+        
+        self._ws_stop.clear()
+        self._ws_thread = threading.Thread(target=self._ws_run, name="bitmart-ticker-ws", daemon=True)
+        self._ws_thread.start()
+        return True
+    
+    def stop_ticker_stream(self):
+        """Stop the WebSocket ticker stream and forget pushed prices"""
+        self._ws_stop.set()
+        if self._ws_thread is not None:
+            self._ws_thread.join(timeout=5)
+            self._ws_thread = None
+        self._last_prices.clear()
+    
+    def _ws_run(self):
+        """Connection loop: (re)connect, subscribe and consume ticker frames until stopped"""
+        backoff = 1
+        while not self._ws_stop.is_set():
+            ws = None
+            try:
+                ws = websocket.create_connection(self.ws_url, timeout=15)
+                ws.send(json.dumps({
+                    "op": "subscribe",
+                    "args": [f"spot/ticker:{s}" for s in self._ws_symbols]
+                }))
+                backoff = 1
+                
+                while not self._ws_stop.is_set():
+                    try:
+                        frame = ws.recv()
+                    except websocket.WebSocketTimeoutException:
+                        ws.send("ping")  # keepalive, server closes idle connections
+                        continue
+                    self._ws_handle_frame(frame)
+            except Exception as e:
+                # Network hiccup or server close - reconnect with capped backoff
+                log.debug("Ticker stream disconnected (%s), reconnecting in %ss", e, backoff)
+                self._ws_stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                if ws is not None:
+                    try:
+                        ws.close()
+                    except Exception:
+                        pass
+    
+    def _ws_handle_frame(self, frame):
+        """Decode a (deflate-compressed) ticker frame and record last prices"""
+        if isinstance(frame, bytes):
+            frame = zlib.decompress(frame, -zlib.MAX_WBITS)
+        if not frame or frame in ("pong", b"pong"):
+            return
+        
+        msg = _json_loads(frame)
+        if msg.get("table") != "spot/ticker":
+            return
+        
+        now = time.monotonic()
+        for tick in msg.get("data", []):
+            symbol = tick.get("symbol")
+            if symbol and tick.get("last_price"):
+                self._last_prices[symbol] = (float(tick["last_price"]), now)
     
     def get_balance_for_asset(self, asset: str) -> Tuple[float, float]:
         """
@@ -368,19 +853,19 @@ class BitMartAPI:
             Tuple of (available, frozen) balance
         """
         try:
-            wallet = self.get_wallet_balance()
-            currencies = wallet.get("data", {}).get("wallet", [])
+            if time.monotonic() - self._wallet_ts >= self._wallet_ttl:
+                wallet = self.get_wallet_balance()
+                currencies = wallet.get("data", {}).get("wallet", [])
+                self._wallet_index = {c.get("id"): c for c in currencies}
+                self._wallet_ts = time.monotonic()
             
-            for currency in currencies:
-                if currency.get("id") == asset:
-                    available = float(currency.get("available", 0))
-                    frozen = float(currency.get("frozen", 0))
-                    return available, frozen
-            
-            return 0.0, 0.0
+            currency = self._wallet_index.get(asset)
+            if currency is None:
+                return 0.0, 0.0
+            return float(currency.get("available", 0)), float(currency.get("frozen", 0))
             
         except Exception as e:
-            print(f"Error getting balance for {asset}: {e}")
+            log.warning("Error getting balance for %s: %s", asset, e)
             return 0.0, 0.0
     
     def check_order_status(self, symbol: str, order_id: str) -> str:
@@ -407,7 +892,7 @@ class BitMartAPI:
             status_code = order.get("data", {}).get("status", "0")
             return status_map.get(status_code, "unknown")
         except Exception as e:
-            print(f"Error checking order status: {e}")
+            log.warning("Error checking order status for %s: %s", order_id, e)
             return "error"
     
     def calculate_quantity(self, symbol: str, usdt_amount: float, price: float) -> float:
@@ -422,17 +907,13 @@ class BitMartAPI:
         Returns:
             Calculated quantity
         """
-        symbol_info = self.get_symbol_detail(symbol)
-        if not symbol_info:
+        precision = self.get_symbol_precision(symbol)
+        if not precision:
             return 0.0
         
-        # Get precision
-        base_precision = int(symbol_info.get("base_min_size", "0.00000001").split('.')[-1].rstrip('0').__len__())
-        quantity = usdt_amount / price
-        
-        # Round to precision
-        quantity = round(quantity, base_precision)
-        return quantity
+        # Always round down so the order never exceeds the exchange step size
+        quantity = self._quantize(Decimal(str(usdt_amount)) / Decimal(str(price)), precision[0])
+        return float(quantity)
     
     def format_price(self, symbol: str, price: float) -> str:
         """
@@ -445,14 +926,12 @@ class BitMartAPI:
         Returns:
             Formatted price string
         """
-        symbol_info = self.get_symbol_detail(symbol)
-        if not symbol_info:
+        precision = self.get_symbol_precision(symbol)
+        if not precision:
             return str(price)
         
-        quote_increment = symbol_info.get("quote_increment", "0.01")
-        precision = len(quote_increment.split('.')[-1].rstrip('0'))
-        
-        return f"{price:.{precision}f}"
+        # Nearest tick (same as before, but without binary-float half-even surprises)
+        return f"{self._quantize(price, precision[1], ROUND_HALF_UP):f}"
     
     def format_quantity(self, symbol: str, quantity: float) -> str:
         """
@@ -465,14 +944,58 @@ class BitMartAPI:
         Returns:
             Formatted quantity string
         """
-        symbol_info = self.get_symbol_detail(symbol)
-        if not symbol_info:
+        precision = self.get_symbol_precision(symbol)
+        if not precision:
             return str(quantity)
         
-        base_min_size = symbol_info.get("base_min_size", "0.00000001")
-        precision = len(base_min_size.split('.')[-1].rstrip('0'))
+        # Truncate so the formatted size never exceeds the held/affordable amount
+        return f"{self._quantize(quantity, precision[0]):f}"
+
+
+class AsyncBitMartAPI:
+    """
+    Asyncio facade over BitMartAPI
+    
+    Every public method of the wrapped client is exposed as a coroutine that
+    runs in a worker thread, so independent calls (e.g. ticker + wallet +
+    order status) can be awaited together with asyncio.gather. A semaphore
+    caps concurrency and the wrapped client's limiter keeps the combined
+    traffic inside the 5 req/sec budget.
+    
+    Example:
+        api = AsyncBitMartAPI(BitMartAPI(key, secret, memo))
+        ticker, wallet = await asyncio.gather(
+            api.get_ticker("BTC_USDT"), api.get_wallet_balance()
+        )
+    """
+    
+    def __init__(self, api: BitMartAPI, max_concurrency: int = 5):
+        """
+        Initialize async facade
+        
+        Args:
+            api: Synchronous BitMartAPI client to wrap
+            max_concurrency: Maximum number of in-flight requests
+        """
+        self.api = api
+        self._sem = asyncio.Semaphore(max_concurrency)
+    
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking client method in a worker thread under the semaphore"""
+        async with self._sem:
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self.api, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        
+        async def method(*args, **kwargs):
+            return await self._call(attr, *args, **kwargs)
         
-        return f"{quantity:.{precision}f}"
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        return method
 
 
 if __name__ == "__main__":
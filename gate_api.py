@@ -5,18 +5,98 @@ Documentation: https://www.gate.io/docs/developers/apiv4/
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hmac
 import hashlib
 import time
 import json
-from typing import Dict, List, Optional, Tuple
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from urllib.parse import urlencode
+from operator import itemgetter
+from itertools import chain
+import numpy as np
+
+# Try to import orjson for faster JSON encode/decode (optional)
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # Fallback to stdlib json
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Library logger: silent unless the application attaches a handler
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Try to import httpx for the optional HTTP/2 transport
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+
+# Try to import websocket-client for the streaming market data (optional)
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    # Fallback to REST polling if websocket-client not installed
+    websocket = None
+    WEBSOCKET_AVAILABLE = False
+
+# Bound once at import so the signing path skips module attribute lookups
+# (hashlib.sha512 is OpenSSL-backed already)
+_sha512 = hashlib.sha512
+_hmac_new = hmac.new
+_get_available_locked = itemgetter('available', 'locked')
+
+
+def iter_nonzero_balances(accounts: List[Dict]):
+    """
+    Yield (currency, available, locked) for accounts holding a balance
+    
+    Most Gate.io currencies are zero ("0"), so those rows are skipped with a
+    string check before any float conversion.
+    
+    Args:
+        accounts: Spot accounts as returned by get_spot_accounts
+        
+    Yields:
+        Tuple of (currency, available, locked) as floats
+    """
+    for acc in accounts:
+        av_s, lk_s = _get_available_locked(acc)
+        # A string made only of '0' and '.' is zero
+        if not av_s.strip('0.') and not lk_s.strip('0.'):
+            continue
+        yield acc['currency'], float(av_s), float(lk_s)
 
 
 class GateAPI:
     """Gate.io Spot API Client"""
     
-    def __init__(self, api_key: str, secret_key: str, testnet: bool = False):
+    # SHA512 of an empty payload (every GET/DELETE signs this)
+    EMPTY_BODY_HASH = "cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e"
+    
+    def __init__(self, api_key: str, secret_key: str, testnet: bool = False, use_http2: bool = False):
         """
         Initialize Gate.io API client
         
@@ -24,62 +104,262 @@ class GateAPI:
             api_key: Gate.io API key
             secret_key: Gate.io secret key
             testnet: Use testnet (True) or mainnet (False)
+            use_http2: Send requests over HTTP/2 via httpx (falls back to
+                       requests if httpx/h2 are not installed)
         """
         self.api_key = api_key
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode("utf-8")
+        # Keyed HMAC context built once and copied per signature (skips key
+        # setup); the template is never updated, so copies are thread-safe
+        self._hmac_template = _hmac_new(self._secret_bytes, b"", _sha512)
         self.base_url = "https://api-testnet.gateapi.io" if testnet else "https://api.gateio.ws"
         self.prefix = "/api/v4"
+        self._api_root = f"{self.base_url}{self.prefix}"
         self.session = requests.Session()
+        
+        # Keep-alive pool for the single API host. Only connection-setup
+        # failures are retried here (the request never reached the server);
+        # everything else is left to the app-level retry in _request.
+        retry = Retry(total=2, connect=2, read=0, status=0, other=0,
+                      backoff_factor=0.1, status_forcelist=[])
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=32, pool_block=False, max_retries=retry)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             "Accept": "application/json",
             "Content-Type": "application/json"
         })
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms between requests
+        # Optional HTTP/2 client: one multiplexed TLS connection for fan-out
+        self._client = None
+        if use_http2 and HTTPX_AVAILABLE:
+            try:
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    retries=2,  # connect retries, as on the requests adapter
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+                )
+                self._client = httpx.Client(transport=transport, headers=dict(self.session.headers), timeout=15.0)
+            except ImportError:
+                # httpx installed without the h2 extra
+                self._client = None
+        self.http2_enabled = self._client is not None
+        
+        # Rate limiting (token bucket: bursts up to capacity, 10 req/sec sustained)
+        self._capacity = 10.0
+        self._refill_rate = 10.0  # tokens per second
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Pair metadata cache (precision/limits do not change intraday)
+        self._pair_cache: Dict[str, Tuple[float, Dict]] = {}  # symbol -> (monotonic_ts, detail)
+        self.pair_cache_ttl = 3600  # 1 hour
+        
+        # Order submission is the hottest signed path: prepare its URL and
+        # session headers once and only swap body/signature per send
+        self._order_url = f"{self._api_root}/spot/orders"
+        self._order_prep = self.session.prepare_request(requests.Request("POST", self._order_url))
+        # session.send skips the environment merge that session.request does, so
+        # resolve REQUESTS_CA_BUNDLE/proxy settings for the template once here
+        self._order_send_kwargs = self.session.merge_environment_settings(
+            self._order_url, {}, None, None, None)
+        
+        # Thread-local scratch space (reused auth headers dict)
+        self._local = threading.local()
+        
+        # Ticker cache (collapses same-tick get_ticker/get_last_price calls)
+        self._ticker_cache: Dict[str, Tuple[float, Dict]] = {}  # symbol -> (monotonic_ts, ticker)
+        self._ticker_ttl = 0.25  # seconds
         
-    def _sha512_hex(self, s: str) -> str:
-        """Generate SHA512 hash"""
-        return hashlib.sha512((s or "").encode("utf-8")).hexdigest()
+        # Signature timestamp string, reused while the second doesn't change
+        self._ts_cache = (0, "")
+        
+        # WebSocket market data stream (see start_market_stream)
+        self.ws_url = "wss://ws-testnet.gate.com/v4/ws/spot" if testnet else "wss://api.gateio.ws/ws/v4/"
+        self._last_prices: Dict[str, Tuple[float, float]] = {}  # symbol -> (price, monotonic_ts)
+        # (symbol, interval) -> (monotonic_ts, {open_ts: kline row}) of the newest pushed candles
+        self._stream_candles: Dict[Tuple[str, str], Tuple[float, Dict[int, List[float]]]] = {}
+        self._ws_stale_after = 10.0  # seconds without a push before falling back to REST
+        self._ws_symbols: List[str] = []
+        self._ws_interval: Optional[str] = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_conn = None  # live connection, closed to force a resubscribe
+        self._ws_stop = threading.Event()
+        self._ws_lock = threading.Lock()
+        
+    def _sha512_hex(self, s: Union[str, bytes]) -> str:
+        """Generate SHA512 hash (bytes are hashed as-is, without re-encoding)"""
+        if isinstance(s, str):
+            s = s.encode("utf-8")
+        return _sha512(s or b"").hexdigest()
     
-    def _sign_headers(self, method: str, url_path: str, query_str: str, body_str: str) -> Dict:
+    def _sign_into(self, method: str, url_path: str, query_str: str,
+                   body_str: Union[str, bytes], out: Dict) -> Dict:
         """
-        Generate signature headers for authenticated requests
+        Write signature headers for an authenticated request into `out`
         
         Args:
             method: HTTP method (GET, POST, DELETE)
             url_path: API endpoint path
             query_str: Query string
-            body_str: Request body as string
+            body_str: Request body as sent (str or serialized bytes)
+            out: Headers dict to fill (must already contain KEY)
             
         Returns:
-            Headers dict with KEY, Timestamp, and SIGN
+            The same dict with Timestamp and SIGN set
         """
-        ts = str(int(time.time()))
-        sign_str = f"{method}\n{self.prefix}{url_path}\n{query_str}\n{self._sha512_hex(body_str)}\n{ts}"
-        sign = hmac.new(
-            self.secret_key.encode("utf-8"),
-            sign_str.encode("utf-8"),
-            hashlib.sha512
-        ).hexdigest()
+        now_i = int(time.time())
+        cached_i, ts = self._ts_cache
+        if now_i != cached_i:
+            ts = str(now_i)
+            self._ts_cache = (now_i, ts)
+        body_hash = self._sha512_hex(body_str) if body_str else self.EMPTY_BODY_HASH
+        sign_str = f"{method}\n{self.prefix}{url_path}\n{query_str}\n{body_hash}\n{ts}"
+        h = self._hmac_template.copy()
+        h.update(sign_str.encode("utf-8"))
         
-        return {
-            "KEY": self.api_key,
-            "Timestamp": ts,
-            "SIGN": sign
-        }
+        out["Timestamp"] = ts
+        out["SIGN"] = h.hexdigest()
+        return out
+    
+    def _sign_headers(self, method: str, url_path: str, query_str: str, body_str: Union[str, bytes]) -> Dict:
+        """
+        Generate signature headers for authenticated requests
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            url_path: API endpoint path
+            query_str: Query string
+            body_str: Request body as sent (str or serialized bytes)
+            
+        Returns:
+            New headers dict with KEY, Timestamp, and SIGN
+        """
+        return self._sign_into(method, url_path, query_str, body_str, {"KEY": self.api_key})
+    
+    def _auth_headers(self) -> Dict:
+        """Per-thread reusable auth headers dict (transports copy headers on send)"""
+        headers = getattr(self._local, "auth_headers", None)
+        if headers is None:
+            headers = self._local.auth_headers = {"KEY": self.api_key, "Timestamp": "", "SIGN": ""}
+        return headers
     
     def _rate_limit(self):
-        """Apply rate limiting between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """
+        Apply token-bucket rate limiting
+        
+        Independent calls go out back-to-back while tokens remain; once the
+        bucket is empty each caller reserves a future token under the lock
+        and sleeps outside it, so the sustained rate stays at _refill_rate.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+            self._last_refill = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self._refill_rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _throttle_from_headers(self, response: requests.Response):
+        """
+        Drain the token bucket when the server reports the window is nearly used up
+        
+        Args:
+            response: HTTP response carrying Gate.io rate limit headers
+        """
+        remaining = (response.headers.get("X-Gate-RateLimit-Requests-Remain")
+                     or response.headers.get("X-RateLimit-Remaining"))
+        try:
+            if remaining is not None and int(remaining) < 2:
+                with self._rate_lock:
+                    self._tokens = min(self._tokens, 0.0)
+        except ValueError:
+            pass
+    
+    def _retry_wait(self, response: Optional[requests.Response], attempt: int) -> float:
+        """
+        Seconds to wait before the next retry
+        
+        Uses the server-provided reset hint when present, otherwise
+        exponential backoff. Both get random jitter so multiple bot
+        instances do not retry in lockstep.
+        
+        Args:
+            response: Failed response (None for connection errors)
+            attempt: Zero-based attempt number
+            
+        Returns:
+            Wait time in seconds
+        """
+        if response is not None:
+            hint = response.headers.get("X-RateLimit-Reset-After") or response.headers.get("Retry-After")
+            try:
+                if hint is not None:
+                    return max(0.0, float(hint)) + random.uniform(0, 0.25)
+            except ValueError:
+                pass
+        return (2 ** attempt) + random.uniform(0, 0.5)
+    
+    def _do_request(self, method: str, url: str, query_str: str, headers: Optional[Dict], data: Optional[bytes]):
+        """
+        Send one HTTP request over the active transport (httpx or requests)
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            url: Request URL without query string
+            query_str: Encoded (already signed) query string
+            headers: Per-request headers (None to use session defaults)
+            data: Request body bytes (None for no body)
+            
+        Returns:
+            Response object exposing status_code, headers, content and text
+        """
+        if self._client is None and method == "POST" and url == self._order_url and data and not query_str:
+            return self._send_prepared(self._order_prep, data, headers)
+        
+        if self._client is not None:
+            # httpx re-parses and re-encodes a params= string, which can change
+            # reserved characters and break the signature; append it to the URL
+            if query_str:
+                url = f"{url}?{query_str}"
+            return self._client.request(method, url, headers=headers, content=data)
+        # requests appends a string params= unchanged (urlencode output is already quoted)
+        return self.session.request(method, url, params=query_str or None, headers=headers, data=data, timeout=15)
+    
+    def _send_prepared(self, prep: requests.PreparedRequest, body: bytes, headers: Dict) -> requests.Response:
+        """
+        Send a copy of a prepared request template with a new body and headers
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
+        Skips URL parsing, session header merging and cookie handling that
+        session.request would redo on every call; the environment settings
+        (verify, proxies, cert) resolved with the template are still applied.
+        The template itself is never mutated, so concurrent senders are safe.
         
-        self.last_request_time = time.time()
+        Args:
+            prep: Prepared request template
+            body: Serialized request body
+            headers: Per-request (signature) headers
+            
+        Returns:
+            HTTP response
+        """
+        p = prep.copy()
+        p.body = body
+        p.headers.update(headers)
+        p.headers["Content-Length"] = str(len(body))
+        return self.session.send(p, timeout=15, **self._order_send_kwargs)
+    
+    def warmup(self) -> bool:
+        """
+        Open the TLS connection ahead of the first real request
+        
+        Returns:
+            True if the API answered
+        """
+        return self.test_connection()
     
     def _request(self, method: str, url_path: str, params: Optional[Dict] = None,
                  body: Optional[Dict] = None, auth: bool = False, max_retries: int = 3) -> Dict:
@@ -97,43 +377,37 @@ class GateAPI:
         Returns:
             API response as dict or list
         """
-        # Build query string
-        query_str = ""
-        if params:
-            query_str = "&".join(f"{k}={v}" for k, v in params.items())
+        # Build query string once (sorted for determinism); the same string is
+        # signed and sent on the wire
+        query_str = urlencode(sorted(params.items()), doseq=True) if params else ""
         
-        # Build body string
-        body_str = json.dumps(body) if body else ""
+        # Build body string once; the same string is signed and sent
+        body_str = _json_dumps(body) if body else b""
         
         # Add authentication headers if needed
-        headers = {}
+        headers = None
         if auth:
-            headers = self._sign_headers(method, url_path, query_str, body_str)
+            headers = self._sign_into(method, url_path, query_str, body_str, self._auth_headers())
+        
+        url = f"{self._api_root}{url_path}"
         
-        # Build full URL
-        url = f"{self.base_url}{self.prefix}{url_path}"
-        if query_str:
-            url += f"?{query_str}"
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
         for attempt in range(max_retries):
             try:
                 # Apply rate limiting
                 self._rate_limit()
                 
-                if method == "GET":
-                    response = self.session.get(url, headers=headers, timeout=15)
-                elif method == "POST":
-                    response = self.session.post(url, headers=headers, data=body_str if body else None, timeout=15)
-                elif method == "DELETE":
-                    response = self.session.delete(url, headers=headers, timeout=15)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                response = self._do_request(method, url, query_str, headers, body_str if body else None)
+                
+                self._throttle_from_headers(response)
                 
                 # Handle rate limit (429)
                 if response.status_code == 429:
                     if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt
-                        print(f"Rate limit hit, waiting {wait_time}s before retry...")
+                        wait_time = self._retry_wait(response, attempt)
+                        log.warning("Rate limit hit, waiting %.2fs before retry", wait_time)
                         time.sleep(wait_time)
                         continue
                     else:
@@ -141,14 +415,15 @@ class GateAPI:
                 
                 # Handle errors
                 if response.status_code >= 400:
-                    raise RuntimeError(f"{response.status_code} | {response.text}")
+                    # Decode bytes directly; response.text may run charset detection
+                    raise RuntimeError(f"{response.status_code} | {response.content.decode('utf-8', 'replace')}")
                 
-                return response.json()
+                return _json_loads(response.content)
                 
-            except requests.exceptions.RequestException as e:
+            except (*_TRANSPORT_ERRORS, json.JSONDecodeError) as e:
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"Request error, waiting {wait_time}s before retry...")
+                    wait_time = self._retry_wait(None, attempt)
+                    log.warning("Request error (%s), waiting %.2fs before retry", e, wait_time)
                     time.sleep(wait_time)
                     continue
                 else:
@@ -167,10 +442,16 @@ class GateAPI:
             
         Returns:
             Ticker data including last price, volume, etc.
+            (cached for `_ticker_ttl` seconds per symbol)
         """
+        entry = self._ticker_cache.get(symbol)
+        if entry and time.monotonic() - entry[0] < self._ticker_ttl:
+            return entry[1]
+        
         data = self._request("GET", "/spot/tickers", params={"currency_pair": symbol})
         if not data:
             raise RuntimeError("Tickers empty")
+        self._ticker_cache[symbol] = (time.monotonic(), data[0])
         return data[0]
     
     def get_last_price(self, symbol: str) -> float:
@@ -183,6 +464,11 @@ class GateAPI:
         Returns:
             Last traded price
         """
+        # Prefer the streamed price while the WebSocket keeps it fresh
+        pushed = self._last_prices.get(symbol)
+        if pushed is not None and time.monotonic() - pushed[1] < self._ws_stale_after:
+            return pushed[0]
+        
         ticker = self.get_ticker(symbol)
         return float(ticker["last"])
     
@@ -223,17 +509,70 @@ class GateAPI:
         
         return self._request("GET", "/spot/candlesticks", params=params)
     
-    def get_pair_detail(self, symbol: str) -> Dict:
+    def get_klines_np(self, symbol: str, interval: str = "1h", limit: int = 100,
+                      from_time: Optional[int] = None, to_time: Optional[int] = None) -> np.ndarray:
+        """
+        Get candlestick data as a 2-D float64 array
+        
+        Same request as get_klines, but the rows are converted in one pass
+        into a contiguous array instead of lists of strings, which is far
+        smaller and can be fed straight into vectorized indicator math.
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTC_USDT')
+            interval: Time interval (10s, 1m, 5m, 15m, 30m, 1h, 4h, 8h, 1d, 7d, 30d)
+            limit: Number of candlesticks (max 1000)
+            from_time: Start timestamp in seconds
+            to_time: End timestamp in seconds
+            
+        Returns:
+            Array of shape (n, 7) with columns
+            [timestamp, volume, close, high, low, open, amount]
+        """
+        data = self.get_klines(symbol, interval, limit, from_time, to_time)
+        if not data:
+            return np.empty((0, 7), dtype=np.float64)
+        # Stream the fields straight into one preallocated buffer. Newer
+        # responses append a non-numeric "window closed" flag; keep the 7 numeric columns
+        n = len(data)
+        fields = chain.from_iterable(row[:7] for row in data)
+        return np.fromiter(fields, dtype=np.float64, count=n * 7).reshape(n, 7)
+    
+    def get_pair_detail(self, symbol: str, cache_ttl: Optional[float] = None) -> Dict:
         """
         Get trading pair details (precision, limits, etc.)
         
+        Results are cached per symbol for `pair_cache_ttl` seconds.
+        
         Args:
             symbol: Trading pair (e.g., 'BTC_USDT')
+            cache_ttl: Override cache TTL in seconds (0 forces a refresh)
             
         Returns:
             Pair details including precision, min/max amounts
         """
-        return self._request("GET", f"/spot/currency_pairs/{symbol}")
+        ttl = self.pair_cache_ttl if cache_ttl is None else cache_ttl
+        now = time.monotonic()
+        entry = self._pair_cache.get(symbol)
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+        
+        data = self._request("GET", f"/spot/currency_pairs/{symbol}")
+        self._pair_cache[symbol] = (now, data)
+        return data
+    
+    def preload_pair_details(self) -> int:
+        """
+        Fetch all trading pairs in one request and fill the pair cache
+        
+        Returns:
+            Number of pairs cached
+        """
+        pairs = self._request("GET", "/spot/currency_pairs")
+        now = time.monotonic()
+        for pair in pairs:
+            self._pair_cache[pair["id"]] = (now, pair)
+        return len(pairs)
     
     def get_server_time(self) -> int:
         """
@@ -245,6 +584,184 @@ class GateAPI:
         result = self._request("GET", "/spot/time")
         return int(result["server_time"])
     
+    # ==================== Bulk Market Data ====================
+    
+    def get_tickers_bulk(self, symbols: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Get tickers for several symbols in parallel
+        
+        Requests share the session's connection pool and the token bucket,
+        so wall time is roughly one round-trip per burst.
+        
+        Args:
+            symbols: Trading pairs (e.g., ['BTC_USDT', 'ETH_USDT'])
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Dict mapping symbol to ticker data
+        """
+        if not symbols:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as ex:
+            return dict(zip(symbols, ex.map(self.get_ticker, symbols)))
+    
+    def get_market_snapshot(self, symbol: str) -> Dict:
+        """
+        Get ticker, order book and pair details for a symbol in parallel
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTC_USDT')
+            
+        Returns:
+            Dict with 'ticker', 'orderbook' and 'pair' entries
+        """
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_ticker = ex.submit(self.get_ticker, symbol)
+            f_book = ex.submit(self.get_orderbook, symbol)
+            f_pair = ex.submit(self.get_pair_detail, symbol)
+            return {
+                'ticker': f_ticker.result(),
+                'orderbook': f_book.result(),
+                'pair': f_pair.result()
+            }
+    
+    # ==================== WebSocket Market Stream ====================
+    
+    def start_market_stream(self, symbols: List[str], interval: str) -> bool:
+        """
+        Start a background WebSocket subscription to tickers and candlesticks
+        
+        Pushed prices are served by get_last_price and pushed candles by
+        get_streamed_klines; both fall back to REST once the stream goes stale.
+        Calling it again while running (e.g. one bot per pair sharing this
+        client) adds the new symbols and reconnects to subscribe them.
+        
+        Args:
+            symbols: Trading pairs to subscribe (e.g., ['BTC_USDT'])
+            interval: Candlestick interval (e.g., '4h')
+            
+        Returns:
+            True if the stream is running, False if websocket-client is not installed
+        """
+        if not WEBSOCKET_AVAILABLE:
+            return False
+        
+        added = [symbol for symbol in symbols if symbol not in self._ws_symbols]
+        self._ws_symbols = self._ws_symbols + added
+        self._ws_interval = interval
+        if self._ws_thread is not None and self._ws_thread.is_alive():
+            conn = self._ws_conn
+            if added and conn is not None:
+                # The connection loop reconnects and subscribes the full list
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            return True
+        
+        self._ws_stop.clear()
+        self._ws_thread = threading.Thread(target=self._ws_run, name="gate-market-ws", daemon=True)
+        self._ws_thread.start()
+        return True
+    
+    def stop_market_stream(self):
+        """Stop the WebSocket stream and forget pushed data"""
+        self._ws_stop.set()
+        if self._ws_thread is not None:
+            self._ws_thread.join(timeout=5)
+            self._ws_thread = None
+        self._ws_symbols = []
+        with self._ws_lock:
+            self._last_prices.clear()
+            self._stream_candles.clear()
+    
+    def get_streamed_klines(self, symbol: str, interval: str, since: int) -> Optional[np.ndarray]:
+        """
+        Get pushed candles opened at or after `since`
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTC_USDT')
+            interval: Candlestick interval (e.g., '4h')
+            since: Earliest candle open time (unix seconds)
+            
+        Returns:
+            Array shaped like get_klines_np (oldest first), or None if the
+            stream is not subscribed to this pair/interval or has gone stale
+        """
+        with self._ws_lock:
+            entry = self._stream_candles.get((symbol, interval))
+            if entry is None or time.monotonic() - entry[0] >= self._ws_stale_after:
+                return None
+            rows = [row for ts, row in sorted(entry[1].items()) if ts >= since]
+        return np.array(rows, dtype=np.float64).reshape(-1, 7)
+    
+    def _ws_run(self):
+        """Connection loop: (re)connect, subscribe and consume frames until stopped"""
+        backoff = 1
+        while not self._ws_stop.is_set():
+            ws = None
+            try:
+                ws = websocket.create_connection(self.ws_url, timeout=15)
+                self._ws_conn = ws
+                now = int(time.time())
+                ws.send(json.dumps({"time": now, "channel": "spot.tickers",
+                                    "event": "subscribe", "payload": self._ws_symbols}))
+                for symbol in self._ws_symbols:
+                    ws.send(json.dumps({"time": now, "channel": "spot.candlesticks",
+                                        "event": "subscribe", "payload": [self._ws_interval, symbol]}))
+                backoff = 1
+                
+                while not self._ws_stop.is_set():
+                    try:
+                        frame = ws.recv()
+                    except websocket.WebSocketTimeoutException:
+                        # keepalive, server closes idle connections
+                        ws.send(json.dumps({"time": int(time.time()), "channel": "spot.ping"}))
+                        continue
+                    self._ws_handle_frame(frame)
+            except Exception as e:
+                # Network hiccup or server close - reconnect with capped backoff
+                log.debug("Market stream disconnected (%s), reconnecting in %ss", e, backoff)
+                self._ws_stop.wait(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                self._ws_conn = None
+                if ws is not None:
+                    try:
+                        ws.close()
+                    except Exception:
+                        pass
+    
+    def _ws_handle_frame(self, frame):
+        """Decode a ticker/candlestick update and record it"""
+        if not frame:
+            return
+        msg = _json_loads(frame)
+        if msg.get("event") != "update":
+            return
+        
+        channel = msg.get("channel")
+        result = msg.get("result") or {}
+        now = time.monotonic()
+        
+        if channel == "spot.tickers":
+            if result.get("currency_pair") and result.get("last"):
+                self._last_prices[result["currency_pair"]] = (float(result["last"]), now)
+        
+        elif channel == "spot.candlesticks":
+            # "n" is "<interval>_<pair>"; v/a are quote/base volume like the REST columns
+            interval, _, symbol = result.get("n", "").partition("_")
+            if not symbol:
+                return
+            row = [float(result[k]) for k in ("t", "v", "c", "h", "l", "o", "a")]
+            with self._ws_lock:
+                entry = self._stream_candles.get((symbol, interval))
+                candles = entry[1] if entry is not None else {}
+                candles[int(row[0])] = row
+                while len(candles) > 3:
+                    del candles[min(candles)]
+                self._stream_candles[(symbol, interval)] = (now, candles)
+    
     # ==================== Account & Balance ====================
     
     def get_spot_accounts(self, currency: Optional[str] = None) -> List[Dict]:
@@ -273,15 +790,19 @@ class GateAPI:
         Returns:
             Balance info with available and locked amounts
         """
-        accounts = self.get_spot_accounts(currency)
-        for acc in accounts:
-            if acc.get('currency', '').upper() == currency.upper():
-                return {
-                    'currency': acc['currency'],
-                    'available': float(acc.get('available', 0)),
-                    'locked': float(acc.get('locked', 0)),
-                    'total': float(acc.get('available', 0)) + float(acc.get('locked', 0))
-                }
+        currency_u = currency.upper()
+        # Filtered query returns at most the one matching account
+        accounts = self.get_spot_accounts(currency_u)
+        if accounts and accounts[0].get('currency', '').upper() == currency_u:
+            acc = accounts[0]
+            available = float(acc.get('available', 0))
+            locked = float(acc.get('locked', 0))
+            return {
+                'currency': acc['currency'],
+                'available': available,
+                'locked': locked,
+                'total': available + locked
+            }
         return {'currency': currency, 'available': 0.0, 'locked': 0.0, 'total': 0.0}
     
     # ==================== Trading - Orders ====================
@@ -480,6 +1001,48 @@ class GateAPI:
         except Exception:
             return False
     
+    def batch_health_check(self, symbol: str) -> Tuple[bool, Optional[bool], Optional[float]]:
+        """
+        Check connectivity, authentication and the last price in one round-trip
+        
+        The three requests are issued in parallel over the shared keep-alive
+        pool instead of one after another.
+        
+        Args:
+            symbol: Trading pair to price (e.g., 'BTC_USDT')
+            
+        Returns:
+            Tuple of (connected, authenticated, last_price); authenticated and
+            last_price are None when the server could not be reached, and
+            last_price is None if the ticker request failed
+        """
+        def last_price():
+            try:
+                return self.get_last_price(symbol)
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_conn = ex.submit(self.test_connection)
+            f_auth = ex.submit(self.test_auth)
+            f_price = ex.submit(last_price)
+            if not f_conn.result():
+                return False, None, None
+            return True, f_auth.result(), f_price.result()
+    
+    def close(self):
+        """Close the HTTP session(s) and release pooled connections"""
+        self.stop_market_stream()
+        if self._client is not None:
+            self._client.close()
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def format_symbol(self, base: str, quote: str) -> str:
         """
         Format symbol for Gate.io (BASE_QUOTE)
@@ -501,46 +1064,42 @@ if __name__ == "__main__":
     
     load_dotenv()
     
-    # Initialize API
-    api = GateAPI(
+    # Initialize API (closed on exit so pooled sockets are released)
+    with GateAPI(
         api_key=os.getenv("GATE_API_KEY"),
         secret_key=os.getenv("GATE_API_SECRET"),
         testnet=os.getenv("USE_TESTNET", "1") == "1"
-    )
-    
-    # Test connection
-    print("Testing connection...")
-    if api.test_connection():
-        print("✓ Connection OK")
-    else:
-        print("✗ Connection failed")
-    
-    # Test authentication
-    print("\nTesting authentication...")
-    if api.test_auth():
-        print("✓ Authentication OK")
-    else:
-        print("✗ Authentication failed")
-    
-    # Get ticker
-    symbol = "BTC_USDT"
-    print(f"\nGetting ticker for {symbol}...")
-    try:
-        ticker = api.get_ticker(symbol)
-        print(f"Last Price: {ticker['last']}")
-        print(f"24h High: {ticker['high_24h']}")
-        print(f"24h Low: {ticker['low_24h']}")
-        print(f"24h Volume: {ticker['base_volume']}")
-    except Exception as e:
-        print(f"Error: {e}")
-    
-    # Get balance (requires authentication)
-    print("\nGetting balances...")
-    try:
-        balances = api.get_spot_accounts()
-        for bal in balances:
-            total = float(bal.get('available', 0)) + float(bal.get('locked', 0))
-            if total > 0:
-                print(f"{bal['currency']}: Available={bal['available']}, Locked={bal['locked']}")
-    except Exception as e:
-        print(f"Error: {e}")
+    ) as api:
+        # Test connection
+        print("Testing connection...")
+        if api.test_connection():
+            print("✓ Connection OK")
+        else:
+            print("✗ Connection failed")
+        
+        # Test authentication
+        print("\nTesting authentication...")
+        if api.test_auth():
+            print("✓ Authentication OK")
+        else:
+            print("✗ Authentication failed")
+        
+        # Get ticker
+        symbol = "BTC_USDT"
+        print(f"\nGetting ticker for {symbol}...")
+        try:
+            ticker = api.get_ticker(symbol)
+            print(f"Last Price: {ticker['last']}")
+            print(f"24h High: {ticker['high_24h']}")
+            print(f"24h Low: {ticker['low_24h']}")
+            print(f"24h Volume: {ticker['base_volume']}")
+        except Exception as e:
+            print(f"Error: {e}")
+        
+        # Get balance (requires authentication)
+        print("\nGetting balances...")
+        try:
+            for currency, available, locked in iter_nonzero_balances(api.get_spot_accounts()):
+                print(f"{currency}: Available={available}, Locked={locked}")
+        except Exception as e:
+            print(f"Error: {e}")
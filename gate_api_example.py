@@ -5,7 +5,7 @@ Demonstrates how to use the Gate.io API client
 
 import os
 from dotenv import load_dotenv
-from gate_api import GateAPI
+from gate_api import GateAPI, iter_nonzero_balances
 
 # Load environment variables
 load_dotenv()
@@ -110,14 +110,10 @@ def main():
         
         print("✅ Account Balances:")
         has_balance = False
-        for acc in accounts:
-            available = float(acc.get('available', 0))
-            locked = float(acc.get('locked', 0))
+        for currency, available, locked in iter_nonzero_balances(accounts):
+            has_balance = True
             total = available + locked
-            
-            if total > 0:
-                has_balance = True
-                print(f"   {acc['currency']:>8} | Available: {available:>15.8f} | Locked: {locked:>15.8f} | Total: {total:>15.8f}")
+            print(f"   {currency:>8} | Available: {available:>15.8f} | Locked: {locked:>15.8f} | Total: {total:>15.8f}")
         
         if not has_balance:
             print("   No balance found (all balances are 0)")
@@ -7,11 +7,15 @@ Same strategy as BitMart version, using Gate.io API
 import os
 import sys
 import time
+import math
 import argparse
 import json
-import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple, List, Any, Callable
 from dotenv import load_dotenv
 
 # Try to import colorama for colored output (optional)
@@ -27,24 +31,198 @@ except ImportError:
         RESET_ALL = ''
     COLORAMA_AVAILABLE = False
 
-# Import bot modules
+# ANSI color codes resolved once (empty strings without colorama)
+GREEN = Fore.GREEN
+RED = Fore.RED
+YELLOW = Fore.YELLOW
+CYAN = Fore.CYAN
+WHITE = Fore.WHITE
+RESET = Style.RESET_ALL
+
+# Import bot modules (strategy/indicators pull in pandas and are imported on
+# first use, so quick --balance runs skip that cost)
 from gate_api import GateAPI
-from indicators import Indicators
-from strategy import TradingStrategy
 from risk_manager import RiskManager
 from logger_config import setup_logger
 
 # Load environment variables
 load_dotenv()
 
+# Seconds after candle close before fetching (lets the exchange finalize the candle)
+CANDLE_CLOSE_GRACE = 2
+
+# Intra-candle wakeup interval while a position is open
+POSITION_POLL_SECONDS = 30
+
+# Timeframe string -> candle length in seconds (read-only)
+_TF_SECONDS = MappingProxyType({
+    '10s': 10, '1m': 60, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '1H': 3600, '4h': 14400, '4H': 14400, '8h': 28800, '8H': 28800,
+    '1d': 86400, '1D': 86400, '7d': 604800, '7D': 604800, '30d': 2592000, '30D': 2592000
+})
+
+# Timeframe string -> Gate.io candlestick interval parameter (read-only)
+_GATE_INTERVAL = MappingProxyType({
+    '1m': '1m', '5m': '5m', '15m': '15m', '30m': '30m',
+    '1H': '1h', '1h': '1h', '4H': '4h', '4h': '4h', '8H': '8h', '8h': '8h',
+    '1D': '1d', '1d': '1d', '7D': '7d', '7d': '7d', '30D': '30d', '30d': '30d'
+})
+
+
+@dataclass(slots=True)
+class Position:
+    """
+    Open position state
+    
+    Supports item access (position['stop_loss']) so RiskManager, which is
+    shared with the BitMart bot and works on dicts, can use it unchanged.
+    """
+    side: str
+    entry_time: int
+    entry_price: float
+    stop_loss: float
+    position_size: float
+    remaining_size: float
+    risk_amount: float
+    tp1: Optional[float]
+    tp1_percent: float
+    tp2: Optional[float]
+    tp2_percent: float
+    trailing_stop: Optional[float] = None
+    order_ids: List[str] = field(default_factory=list)
+    simulated: bool = False
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in _POSITION_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def to_dict(self) -> Dict:
+        """Plain dict for JSON persistence"""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Position':
+        """Build from a saved position dict, ignoring unknown keys"""
+        return cls(**{k: v for k, v in data.items() if k in _POSITION_FIELDS})
+
+
+_POSITION_FIELDS = frozenset(f.name for f in fields(Position))
+
+
+def _weighted_position(*entries: Dict) -> Dict:
+    """
+    Size-weighted average entry and stop loss of a multi-leg entry
+    
+    Args:
+        *entries: Entry legs (price, stop_loss, position_size), e.g. entry_1, entry_2
+        
+    Returns:
+        Dict with entry_price, stop_loss, total_size and risk_amount
+    """
+    legs = np.array([(e['price'], e['stop_loss']) for e in entries], dtype=np.float64)
+    sizes = np.array([e['position_size'] for e in entries], dtype=np.float64)
+    total_size = float(sizes.sum())
+    
+    if total_size > 0:
+        # One dot product per column: sum(p_i * s_i) / sum(s_i)
+        avg_entry, avg_sl = np.dot(sizes, legs) / total_size
+    else:
+        avg_entry, avg_sl = legs.mean(axis=0)
+    
+    return {
+        'entry_price': float(avg_entry),
+        'stop_loss': float(avg_sl),
+        'total_size': total_size,
+        # USDT value at risk
+        'risk_amount': total_size * float(avg_entry)
+    }
+
+
+def _emit(lines) -> None:
+    """Write a block of terminal lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _truncate(value: float, precision: int) -> float:
+    """
+    Truncate a positive float to `precision` decimals on an integer grid
+    
+    Matches Decimal.quantize(ROUND_DOWN) for exchange precisions without
+    the Decimal parsing cost.
+    """
+    return _truncate_to_grid(value, 10 ** precision)
+
+
+def _truncate_to_grid(value: float, factor: int) -> float:
+    """Floor `value` to a multiple of 1/factor (see _truncate)"""
+    steps = math.floor(value * factor)
+    # The product can round across a grid step (0.29 * 100 = 28.999...), so
+    # settle it by comparing the value itself with the neighbouring grid points
+    if (steps + 1) / factor <= value:
+        steps += 1
+    elif steps / factor > value:
+        steps -= 1
+    return steps / factor
+
+
+def _make_order_formatter(price_precision: int, amount_precision: int) -> Callable[[float, float], Tuple[str, str]]:
+    """
+    Build a price/amount formatter specialized for one pair's precisions
+    
+    Same output as formatting each value with _truncate, with the grid
+    factors and format strings resolved once instead of on every order.
+    
+    Args:
+        price_precision: Price decimals
+        amount_precision: Amount decimals
+        
+    Returns:
+        Function (price, amount) -> (price_str, amount_str)
+    """
+    price_factor = 10 ** price_precision
+    amount_factor = 10 ** amount_precision
+    price_fmt = f"{{:.{price_precision}f}}".format
+    amount_fmt = f"{{:.{amount_precision}f}}".format
+    truncate = _truncate_to_grid
+    
+    def format_order(price: float, amount: float) -> Tuple[str, str]:
+        return price_fmt(truncate(price, price_factor)), amount_fmt(truncate(amount, amount_factor))
+    
+    return format_order
+
 
 class TradingBot:
     """Main Trading Bot Class for Gate.io"""
     
-    def __init__(self):
-        """Initialize trading bot"""
+    def __init__(self, trading_pair: Optional[str] = None, api: Optional[GateAPI] = None,
+                 per_pair_state: bool = False):
+        """
+        Initialize trading bot
+        
+        Args:
+            trading_pair: Pair to trade (default: TRADING_PAIR from .env)
+            api: Shared Gate.io client (default: build one for this bot). Bots
+                 trading several pairs on one account share a client, so they
+                 also share its connection pool and rate limiter.
+            per_pair_state: Keep the open position in position_state_<PAIR>.json
+                            (multi-pair runs) instead of position_state.json
+        """
         # Load configuration
         self.config = self._load_config()
+        if trading_pair:
+            self.config['trading_pair'] = trading_pair.replace('/', '_')
+        
+        # Timeframe lookups resolved once (Default 4H)
+        self._tf_seconds = _TF_SECONDS.get(self.config['timeframe'], 14400)
+        self._gate_interval = _GATE_INTERVAL.get(self.config['timeframe'], '4h')
         
         # Initialize logger
         self.logger = setup_logger(
@@ -55,34 +233,68 @@ class TradingBot:
         self._print_startup_info()
         
         # Initialize Gate.io API
-        self.api = GateAPI(
-            api_key=self.config['api_key'],
-            secret_key=self.config['secret_key'],
-            testnet=self.config['use_testnet']
-        )
+        self.api = api if api is not None else self.create_api(self.config)
+        self._owns_api = api is None  # a shared client is closed by whoever built it
+        
+        # Fixed fields of every entry order (gtc: good till cancelled)
+        self._order_base = {'time_in_force': 'gtc', 'account': self.config['account']}
+        
+        # Worker threads for independent REST calls issued in the same tick
+        # (created on first use, shut down by stop())
+        self._io_pool: Optional[ThreadPoolExecutor] = None
         
-        # Initialize strategy
-        self.strategy = TradingStrategy(self.config)
+        # Strategy is built on first use (see the strategy property)
+        self._strategy = None
         
         # Initialize risk manager
         self.risk_manager = RiskManager(self.config)
         
         # Bot state
         self.is_running = False
-        self.current_position = None
+        self.current_position: Optional[Position] = None
         self.trade_history = []
         self.equity = 0.0
-        self.position_file = "position_state.json"
+        # One state file per pair when several pairs run side by side
+        self.position_file = (f"position_state_{self.config['trading_pair']}.json"
+                              if per_pair_state else "position_state.json")
         
         # Data
         self.df = None
-        self.last_update = None
+        self.last_update: Optional[int] = None  # epoch seconds of the last market data fetch
+        self.last_close: float = 0.0  # close of the latest candle, kept in step with self.df
+        
+        # Order formatters: symbol -> (pair detail they were built from, formatter)
+        self._order_formatters: Dict[str, Tuple[Dict, Callable]] = {}
+        
+        # Last indicator snapshot used for intra-candle position management
+        self._last_atr: Optional[float] = None
+        self._last_candle_close_ts = 0  # unix time the latest (forming) candle closes
+        self._indicator_state: Optional[Dict] = None  # indicator state after the last closed candle
+        
+        # Short-lived ticker memo so repeated menu refreshes reuse one request
+        self._live_price: Optional[float] = None
+        self._live_price_at = 0.0  # time.monotonic() of the fetch
         
         # Load saved position if exists
         self._load_position_state()
         
         self.logger.info("Trading bot initialized successfully")
     
+    @property
+    def io_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent REST calls, (re)created on first use"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="gate-io")
+        return self._io_pool
+    
+    @property
+    def strategy(self):
+        """Trading strategy, imported and built on first access"""
+        if self._strategy is None:
+            from strategy import TradingStrategy
+            self._strategy = TradingStrategy(self.config)
+        return self._strategy
+    
     def _save_position_state(self):
         """Save current position to disk for persistence"""
         try:
@@ -92,10 +304,8 @@ class TradingBot:
                     os.remove(self.position_file)
                 return
             
-            # Convert datetime to string for JSON serialization
-            position_data = self.current_position.copy()
-            if 'entry_time' in position_data and isinstance(position_data['entry_time'], datetime):
-                position_data['entry_time'] = position_data['entry_time'].isoformat()
+            # Timestamps are epoch seconds, so the position serializes as-is
+            position_data = self.current_position.to_dict()
             
             with open(self.position_file, 'w') as f:
                 json.dump(position_data, f, indent=2)
@@ -114,18 +324,36 @@ class TradingBot:
             with open(self.position_file, 'r') as f:
                 position_data = json.load(f)
             
-            # Convert entry_time string back to datetime
+            # Files written by older versions store entry_time as an ISO string
             if 'entry_time' in position_data and isinstance(position_data['entry_time'], str):
-                position_data['entry_time'] = datetime.fromisoformat(position_data['entry_time'])
+                position_data['entry_time'] = int(datetime.fromisoformat(position_data['entry_time']).timestamp())
             
-            self.current_position = position_data
-            self.logger.info(f"Loaded saved position: {position_data['side']} @ {position_data['entry_price']:.4f}")
-            print(f"{Fore.CYAN}✓ Resumed position: {position_data['side'].upper()} @ {position_data['entry_price']:.4f}{Style.RESET_ALL}")
+            self.current_position = Position.from_dict(position_data)
+            self.logger.info(f"Loaded saved position: {self.current_position.side} @ {self.current_position.entry_price:.4f}")
+            print(f"{CYAN}✓ Resumed position: {self.current_position.side.upper()} @ {self.current_position.entry_price:.4f}{RESET}")
         except Exception as e:
             self.logger.error(f"Failed to load position state: {e}")
             self.current_position = None
     
-    def _load_config(self) -> Dict:
+    @staticmethod
+    def create_api(config: Dict) -> GateAPI:
+        """
+        Build a Gate.io client from the bot configuration
+        
+        Args:
+            config: Configuration from _load_config
+            
+        Returns:
+            GateAPI client
+        """
+        return GateAPI(
+            api_key=config['api_key'],
+            secret_key=config['secret_key'],
+            testnet=config['use_testnet']
+        )
+    
+    @staticmethod
+    def _load_config() -> Dict:
         """Load configuration from environment variables"""
         # Convert Gate.io symbol format (BTC_USDT) to internal format if needed
         trading_pair = os.getenv('TRADING_PAIR', 'BTC_USDT')
@@ -169,6 +397,8 @@ class TradingBot:
             # Bot settings
             'dry_run': os.getenv('DRY_RUN', 'false').lower() == 'true',
             'log_level': os.getenv('LOG_LEVEL', 'INFO'),
+            'live_price_ttl': float(os.getenv('LIVE_PRICE_TTL', 2)),  # seconds, 0 disables
+            'use_websocket': os.getenv('USE_WEBSOCKET', '1') == '1',
             
             # Volume filter
             'use_volume_filter': True,
@@ -180,41 +410,26 @@ class TradingBot:
     def _print_startup_info(self):
         """Print clean startup information"""
         mode = "[TESTNET]" if self.config.get('use_testnet', False) else "[MAINNET - LIVE]"
-        mode_color = Fore.YELLOW if self.config.get('use_testnet', False) else Fore.RED
-        print(f"{Fore.CYAN}{'='*60}")
-        print(f"Gate.io Trading Bot - MA Method 2")
-        print(f"{'='*60}{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}WARNING: SPOT TRADING - LONG ONLY (BUY & SELL){Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}         No SHORT SELLING or LEVERAGE{Style.RESET_ALL}\n")
-        print(f"{Fore.GREEN}Exchange:{Style.RESET_ALL} Gate.io {mode_color}{mode}{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Trading Pair:{Style.RESET_ALL} {self.config['trading_pair']}")
-        print(f"{Fore.GREEN}Timeframe:{Style.RESET_ALL} {self.config['timeframe']}")
-        print(f"{Fore.GREEN}Strategy:{Style.RESET_ALL} EMA {self.config['ema_short']}/{self.config['ema_long']} + RSI({self.config['rsi_length']}) + ADX({self.config['adx_threshold']})")
+        mode_color = YELLOW if self.config.get('use_testnet', False) else RED
+        lines = [
+            f"{CYAN}{'='*60}",
+            f"Gate.io Trading Bot - MA Method 2",
+            f"{'='*60}{RESET}",
+            f"{YELLOW}WARNING: SPOT TRADING - LONG ONLY (BUY & SELL){RESET}",
+            f"{YELLOW}         No SHORT SELLING or LEVERAGE{RESET}\n",
+            f"{GREEN}Exchange:{RESET} Gate.io {mode_color}{mode}{RESET}",
+            f"{GREEN}Trading Pair:{RESET} {self.config['trading_pair']}",
+            f"{GREEN}Timeframe:{RESET} {self.config['timeframe']}",
+            f"{GREEN}Strategy:{RESET} EMA {self.config['ema_short']}/{self.config['ema_long']} + RSI({self.config['rsi_length']}) + ADX({self.config['adx_threshold']})"
+        ]
         if self.config['max_usdt_per_trade'] > 0:
-            print(f"{Fore.GREEN}Max USDT per Trade:{Style.RESET_ALL} {self.config['max_usdt_per_trade']:.2f} USDT")
+            lines.append(f"{GREEN}Max USDT per Trade:{RESET} {self.config['max_usdt_per_trade']:.2f} USDT")
         else:
-            print(f"{Fore.GREEN}Max USDT per Trade:{Style.RESET_ALL} Unlimited (based on risk %)")
-        print(f"{Fore.GREEN}Entry Split:{Style.RESET_ALL} Entry 1 ({self.config['entry_1_percent']}%) | Entry 2 ({self.config['entry_2_percent']}%)")
-        print(f"{Fore.GREEN}Mode:{Style.RESET_ALL} {'DRY RUN (Simulation)' if self.config['dry_run'] else 'LIVE TRADING'}")
-        print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
-    
-    def _get_timeframe_seconds(self) -> int:
-        """Convert timeframe string to seconds"""
-        timeframe_map = {
-            '10s': 10, '1m': 60, '5m': 300, '15m': 900, '30m': 1800,
-            '1h': 3600, '1H': 3600, '4h': 14400, '4H': 14400, '8h': 28800, '8H': 28800,
-            '1d': 86400, '1D': 86400, '7d': 604800, '7D': 604800, '30d': 2592000, '30D': 2592000
-        }
-        return timeframe_map.get(self.config['timeframe'], 14400)  # Default 4H
-    
-    def _get_gate_interval(self) -> str:
-        """Convert timeframe to Gate.io interval parameter"""
-        interval_map = {
-            '1m': '1m', '5m': '5m', '15m': '15m', '30m': '30m',
-            '1H': '1h', '1h': '1h', '4H': '4h', '4h': '4h', '8H': '8h', '8h': '8h',
-            '1D': '1d', '1d': '1d', '7D': '7d', '7d': '7d', '30D': '30d', '30d': '30d'
-        }
-        return interval_map.get(self.config['timeframe'], '4h')  # Default 4h
+            lines.append(f"{GREEN}Max USDT per Trade:{RESET} Unlimited (based on risk %)")
+        lines.append(f"{GREEN}Entry Split:{RESET} Entry 1 ({self.config['entry_1_percent']}%) | Entry 2 ({self.config['entry_2_percent']}%)")
+        lines.append(f"{GREEN}Mode:{RESET} {'DRY RUN (Simulation)' if self.config['dry_run'] else 'LIVE TRADING'}")
+        lines.append(f"{CYAN}{'='*60}{RESET}\n")
+        _emit(lines)
     
     def fetch_market_data(self, limit: int = 200) -> bool:
         """
@@ -228,39 +443,58 @@ class TradingBot:
         """
         try:
             symbol = self.config['trading_pair']
-            interval = self._get_gate_interval()
+            interval = self._gate_interval
             
             # Calculate time range
             now = int(time.time())
-            timeframe_seconds = self._get_timeframe_seconds()
+            timeframe_seconds = self._tf_seconds
             from_time = now - (limit * timeframe_seconds)
             
-            # Fetch kline data from Gate.io
-            klines = self.api.get_klines(symbol, interval, limit, from_time, now)
+            # Within a candle of the last fetch only the newest bars changed:
+            # fetch those and step the indicators instead of recomputing 200 bars
+            if (self._indicator_state is not None and self.df is not None
+                    and now < self._last_candle_close_ts + timeframe_seconds
+                    and self._update_market_data_incremental(symbol, interval, now)):
+                self.last_update = int(time.time())
+                self._live_price = None  # new candles: don't serve a pre-fetch tick
+                return True
+            
+            # Fetch kline data from Gate.io as a float64 array
+            # Gate.io format: [timestamp, volume, close, high, low, open, amount]
+            arr = self.api.get_klines_np(symbol, interval, limit, from_time, now)
             
-            if not klines:
+            if len(arr) == 0:
                 self.logger.error("No kline data received from Gate.io")
                 return False
             
-            # Convert to DataFrame
-            # Gate.io format: [timestamp, volume, close, high, low, open, amount]
-            df_data = []
-            for kline in klines:
-                df_data.append({
-                    'timestamp': int(kline[0]),
-                    'open': float(kline[5]),
-                    'high': float(kline[3]),
-                    'low': float(kline[4]),
-                    'close': float(kline[2]),
-                    'volume': float(kline[6])  # Use amount (base currency volume)
-                })
-            
-            self.df = pd.DataFrame(df_data)
+            # Convert to DataFrame straight from the column slices
+            import pandas as pd
+            self.df = pd.DataFrame({
+                'timestamp': arr[:, 0].astype(np.int64),
+                'open': arr[:, 5],
+                'high': arr[:, 3],
+                'low': arr[:, 4],
+                'close': arr[:, 2],
+                'volume': arr[:, 6]  # Use amount (base currency volume)
+            })
             
             # Calculate indicators
             self.df = self.strategy.calculate_indicators(self.df)
             
-            self.last_update = datetime.now()
+            # State after the last closed candle (the final row is still forming)
+            self._indicator_state = self.strategy.indicator_state(self.df, row=-2)
+            
+            # Snapshot for intra-candle ticks (see _manage_position_tick)
+            self._last_atr = float(self.df['atr'].iat[-1])
+            self.last_close = float(self.df['close'].iat[-1])
+            self._last_candle_close_ts = int(arr[-1, 0]) + timeframe_seconds
+            
+            self.last_update = int(time.time())
+            self._live_price = None  # new candles: don't serve a pre-fetch tick
+            
+            # Keep the forming candle and ticker current via push from here on
+            if self.config['use_websocket']:
+                self.api.start_market_stream([symbol], interval)
             
             return True
             
@@ -268,13 +502,64 @@ class TradingBot:
             self.logger.log_exception(e, "fetch_market_data")
             return False
     
+    def _update_market_data_incremental(self, symbol: str, interval: str, now: int) -> bool:
+        """
+        Refresh the forming candle (and at most one newly opened candle) in place
+        
+        Indicators are stepped from the state after the last closed candle,
+        so only the last two klines are needed: they come from the WebSocket
+        candle stream when it is live, otherwise from REST.
+        
+        Args:
+            symbol: Trading pair
+            interval: Gate.io candlestick interval
+            now: Current unix time
+            
+        Returns:
+            True if the frame was updated, False if a full fetch is needed (gap or no data)
+        """
+        tf_seconds = self._tf_seconds
+        last_ts = self._last_candle_close_ts - tf_seconds
+        
+        arr = self.api.get_streamed_klines(symbol, interval, last_ts)
+        if arr is None:
+            arr = self.api.get_klines_np(symbol, interval, 2, now - 2 * tf_seconds, now)
+        if len(arr) == 0:
+            return False
+        
+        arr = arr[arr[:, 0] >= last_ts]
+        if len(arr) == 0 or int(arr[0, 0]) != last_ts:
+            return False
+        if len(arr) > 2 or (len(arr) == 2 and int(arr[1, 0]) != last_ts + tf_seconds):
+            return False
+        
+        # Reorder to (timestamp, open, high, low, close, volume)
+        bars = arr[:, [0, 5, 3, 4, 2, 6]]
+        self.df, self._indicator_state = self.strategy.update_frame(self.df, self._indicator_state, bars)
+        
+        self._last_atr = float(self.df['atr'].iat[-1])
+        self.last_close = float(self.df['close'].iat[-1])
+        self._last_candle_close_ts = int(arr[-1, 0]) + tf_seconds
+        return True
+    
     def get_live_price(self) -> Optional[float]:
-        """Get current live price from ticker (real-time)"""
+        """
+        Get current live price from ticker (real-time)
+        
+        A price fetched less than config['live_price_ttl'] seconds ago is reused;
+        the memo is dropped whenever fetch_market_data succeeds.
+        """
+        if (self._live_price is not None
+                and time.monotonic() - self._live_price_at < self.config['live_price_ttl']):
+            return self._live_price
+        
         try:
             symbol = self.config['trading_pair']
             live_price = self.api.get_last_price(symbol)
             
             if live_price and live_price > 0:
+                self._live_price = live_price
+                self._live_price_at = time.monotonic()
                 return live_price
             else:
                 self.logger.warning(f"Invalid live price received: {live_price}")
@@ -298,15 +583,21 @@ class TradingBot:
             self.logger.log_exception(e, "update_equity")
             return False
     
-    def check_entry_signal(self):
-        """Check for entry signals and execute trade (SPOT LONG ONLY)"""
+    def check_entry_signal(self, live_price: Optional[float] = None):
+        """
+        Check for entry signals and execute trade (SPOT LONG ONLY)
+        
+        Args:
+            live_price: Live price if already fetched (default: fetch from ticker)
+        """
         if self.current_position is not None:
             return  # Already in position
         
         # Check long entry (SPOT BUY only)
-        live_price = self.get_live_price()
         if live_price is None:
-            print(f"{Fore.RED}✗ Failed to get live price, skipping signal check{Style.RESET_ALL}")
+            live_price = self.get_live_price()
+        if live_price is None:
+            print(f"{RED}✗ Failed to get live price, skipping signal check{RESET}")
             return
         
         # Bot HANYA akan place order jika SEMUA kondisi terpenuhi (Signal = YES)
@@ -318,20 +609,24 @@ class TradingBot:
             price_change = ((live_price - candle_price) / candle_price) * 100
             
             # ✓ SIGNAL YES - Semua kondisi terpenuhi, siap place order!
-            print(f"{Fore.GREEN}✓ ENTRY SIGNAL FOUND! All conditions met.{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}  Last Candle: {candle_price:.4f} | Live: {live_price:.4f} ({price_change:+.2f}%){Style.RESET_ALL}")
-            print(f"{Fore.GREEN}  RSI: {details['rsi']:.1f} | ADX: {details['adx']:.1f}{Style.RESET_ALL}")
+            lines = [
+                f"{GREEN}✓ ENTRY SIGNAL FOUND! All conditions met.{RESET}",
+                f"{GREEN}  Last Candle: {candle_price:.4f} | Live: {live_price:.4f} ({price_change:+.2f}%){RESET}",
+                f"{GREEN}  RSI: {details['rsi']:.1f} | ADX: {details['adx']:.1f}{RESET}"
+            ]
             
             # Recalculate entry prices with live price awareness
             details = self.strategy.recalculate_with_live_price(self.df, details, live_price)
             
             # Warn if price moved significantly
             if 'warning' in details:
-                print(f"{Fore.YELLOW}⚠  {details['warning']}{Style.RESET_ALL}")
+                lines.append(f"{YELLOW}⚠  {details['warning']}{RESET}")
             
             if 'entry_status' in details:
-                status_color = Fore.GREEN if '✓' in details['entry_status'] else Fore.YELLOW
-                print(f"{status_color}  Entry Status: {details['entry_status']}{Style.RESET_ALL}")
+                status_color = GREEN if '✓' in details['entry_status'] else YELLOW
+                lines.append(f"{status_color}  Entry Status: {details['entry_status']}{RESET}")
+            
+            _emit(lines)
             
             self.logger.log_signal(
                 self.config['trading_pair'],
@@ -345,40 +640,25 @@ class TradingBot:
                 self.simulate_entry("long", details)
         else:
             # ✗ SIGNAL NO - Ada kondisi yang tidak terpenuhi, skip order
-            print(f"{Fore.YELLOW}✗ No entry signal.{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}  Live: {live_price:.4f} | Last Candle: {details['price']:.4f}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}  Reason: {details.get('reason', 'N/A')}{Style.RESET_ALL}")
+            _emit([
+                f"{YELLOW}✗ No entry signal.{RESET}",
+                f"{YELLOW}  Live: {live_price:.4f} | Last Candle: {details['price']:.4f}{RESET}",
+                f"{YELLOW}  Reason: {details.get('reason', 'N/A')}{RESET}"
+            ])
     
     def _format_order_params(self, symbol: str, price: float, amount: float):
         """Format order parameters according to Gate.io requirements"""
         try:
-            # Get pair details for precision
+            # Pair details come from the GateAPI pair cache; the formatter is
+            # rebuilt only when that cache hands back a refreshed detail dict
             pair = self.api.get_pair_detail(symbol)
-            price_precision = int(pair['precision'])
-            amount_precision = int(pair['amount_precision'])
-            
-            # Format with proper precision
-            from decimal import Decimal, ROUND_DOWN
-            
-            # Price
-            price_str = format(
-                Decimal(str(price)).quantize(
-                    Decimal(f"1e-{price_precision}"),
-                    rounding=ROUND_DOWN
-                ),
-                f".{price_precision}f"
-            )
+            entry = self._order_formatters.get(symbol)
+            if entry is None or entry[0] is not pair:
+                entry = (pair, _make_order_formatter(int(pair['precision']), int(pair['amount_precision'])))
+                self._order_formatters[symbol] = entry
             
-            # Amount
-            amount_str = format(
-                Decimal(str(amount)).quantize(
-                    Decimal(f"1e-{amount_precision}"),
-                    rounding=ROUND_DOWN
-                ),
-                f".{amount_precision}f"
-            )
-            
-            return price_str, amount_str
+            # Format with proper precision (truncate, like ROUND_DOWN)
+            return entry[1](price, amount)
             
         except Exception as e:
             self.logger.error(f"Error formatting order params: {e}")
@@ -397,6 +677,10 @@ class TradingBot:
             
             entry_1 = details['entry_1']
             entry_2 = details['entry_2']
+            order_side = 'buy' if side == 'long' else 'sell'
+            
+            # One timestamp tags both legs so they can be matched up later
+            entry_ts = int(time.time())
             
             # Execute Entry 1
             price_1_str, amount_1_str = self._format_order_params(
@@ -408,18 +692,17 @@ class TradingBot:
             
             result_1 = self.api.create_limit_order(
                 symbol=symbol,
-                side='buy' if side == 'long' else 'sell',
+                side=order_side,
                 price=float(price_1_str),
                 amount=float(amount_1_str),
-                time_in_force='gtc',  # Good till cancelled
-                account=self.config['account'],
-                text=f"t-entry1-{int(time.time())}"
+                text=f"t-entry1-{entry_ts}",
+                **self._order_base
             )
             
             if result_1.get('status') in ['open', 'closed']:
                 order_id_1 = result_1.get('id')
                 self.logger.info(f"✓ Entry 1 executed: Order ID {order_id_1} | {entry_1['position_size']:.6f} @ {entry_1['price']:.4f}")
-                print(f"{Fore.GREEN}✓ Entry 1 placed: {entry_1['position_size']:.6f} @ {entry_1['price']:.4f} ({self.config['entry_1_percent']}%){Style.RESET_ALL}")
+                print(f"{GREEN}✓ Entry 1 placed: {entry_1['position_size']:.6f} @ {entry_1['price']:.4f} ({self.config['entry_1_percent']}%){RESET}")
                 
                 # Log Entry 2 placement
                 self.logger.info(f"Placing Entry 2: {entry_2['position_size']:.6f} {symbol} @ {entry_2['price']:.4f} ({self.config['entry_2_percent']}%)")
@@ -431,51 +714,42 @@ class TradingBot:
                 
                 result_2 = self.api.create_limit_order(
                     symbol=symbol,
-                    side='buy' if side == 'long' else 'sell',
+                    side=order_side,
                     price=float(price_2_str),
                     amount=float(amount_2_str),
-                    time_in_force='gtc',
-                    account=self.config['account'],
-                    text=f"t-entry2-{int(time.time())}"
+                    text=f"t-entry2-{entry_ts}",
+                    **self._order_base
                 )
                 
                 if result_2.get('status') in ['open', 'closed']:
                     order_id_2 = result_2.get('id')
                     self.logger.info(f"✓ Entry 2 executed: Order ID {order_id_2} | {entry_2['position_size']:.6f} @ {entry_2['price']:.4f}")
-                    print(f"{Fore.GREEN}✓ Entry 2 placed: {entry_2['position_size']:.6f} @ {entry_2['price']:.4f} ({self.config['entry_2_percent']}%){Style.RESET_ALL}")
+                    print(f"{GREEN}✓ Entry 2 placed: {entry_2['position_size']:.6f} @ {entry_2['price']:.4f} ({self.config['entry_2_percent']}%){RESET}")
                     
                     # Calculate weighted averages
-                    total_size = entry_1['position_size'] + entry_2['position_size']
-                    if total_size > 0:
-                        avg_entry = (entry_1['price'] * entry_1['position_size'] + entry_2['price'] * entry_2['position_size']) / total_size
-                        avg_sl = (entry_1['stop_loss'] * entry_1['position_size'] + entry_2['stop_loss'] * entry_2['position_size']) / total_size
-                    else:
-                        avg_entry = (entry_1['price'] + entry_2['price']) / 2
-                        avg_sl = (entry_1['stop_loss'] + entry_2['stop_loss']) / 2
-                    
-                    # Calculate risk amount (USDT value at risk)
-                    risk_amount = total_size * avg_entry
+                    weighted = _weighted_position(entry_1, entry_2)
+                    avg_entry, avg_sl = weighted['entry_price'], weighted['stop_loss']
+                    total_size, risk_amount = weighted['total_size'], weighted['risk_amount']
                     
                     # Use separate TP1 and TP2 targets from strategy (not averaged)
                     tp1_price = entry_1['take_profit']  # From Entry 1 (TP1_RR = 1.0)
                     tp2_price = entry_2['take_profit']  # From Entry 2 (TP2_RR = 2.0)
                     
-                    # Store position details in flat structure for risk_manager
-                    self.current_position = {
-                        'side': side,
-                        'entry_time': datetime.now(),
-                        'entry_price': avg_entry,
-                        'stop_loss': avg_sl,
-                        'position_size': total_size,
-                        'remaining_size': total_size,
-                        'risk_amount': risk_amount,
-                        'tp1': tp1_price,
-                        'tp1_percent': self.config.get('tp1_percent', 30),
-                        'tp2': tp2_price,
-                        'tp2_percent': self.config.get('tp2_percent', 50),
-                        'trailing_stop': None,
-                        'order_ids': [order_id_1, order_id_2]
-                    }
+                    # Store position details for risk_manager
+                    self.current_position = Position(
+                        side=side,
+                        entry_time=int(time.time()),
+                        entry_price=avg_entry,
+                        stop_loss=avg_sl,
+                        position_size=total_size,
+                        remaining_size=total_size,
+                        risk_amount=risk_amount,
+                        tp1=tp1_price,
+                        tp1_percent=self.config.get('tp1_percent', 30),
+                        tp2=tp2_price,
+                        tp2_percent=self.config.get('tp2_percent', 50),
+                        order_ids=[order_id_1, order_id_2]
+                    )
                     
                     self.logger.log_trade_entry(
                         symbol=symbol,
@@ -491,15 +765,15 @@ class TradingBot:
                 else:
                     error_msg = result_2.get('message', 'Unknown error')
                     self.logger.log_order_error(symbol, side, Exception(error_msg))
-                    print(f"{Fore.RED}✗ Entry 2 failed: {error_msg}{Style.RESET_ALL}")
+                    print(f"{RED}✗ Entry 2 failed: {error_msg}{RESET}")
             else:
                 error_msg = result_1.get('message', 'Unknown error')
                 self.logger.log_order_error(symbol, side, Exception(error_msg))
-                print(f"{Fore.RED}✗ Entry 1 failed: {error_msg}{Style.RESET_ALL}")
+                print(f"{RED}✗ Entry 1 failed: {error_msg}{RESET}")
                 
         except Exception as e:
             self.logger.log_exception(e, "execute_entry")
-            print(f"{Fore.RED}✗ Execute entry error: {e}{Style.RESET_ALL}")
+            print(f"{RED}✗ Execute entry error: {e}{RESET}")
     
     def simulate_entry(self, side: str, details: Dict):
         """Simulate entry trade (DRY RUN mode) with 2 entries"""
@@ -513,37 +787,29 @@ class TradingBot:
             entry_2 = details['entry_2']
             
             # Calculate weighted averages
-            total_size = entry_1['position_size'] + entry_2['position_size']
-            if total_size > 0:
-                avg_entry = (entry_1['price'] * entry_1['position_size'] + entry_2['price'] * entry_2['position_size']) / total_size
-                avg_sl = (entry_1['stop_loss'] * entry_1['position_size'] + entry_2['stop_loss'] * entry_2['position_size']) / total_size
-            else:
-                avg_entry = (entry_1['price'] + entry_2['price']) / 2
-                avg_sl = (entry_1['stop_loss'] + entry_2['stop_loss']) / 2
-            
-            # Calculate risk amount (USDT value at risk)
-            risk_amount = total_size * avg_entry
+            weighted = _weighted_position(entry_1, entry_2)
+            avg_entry, avg_sl = weighted['entry_price'], weighted['stop_loss']
+            total_size, risk_amount = weighted['total_size'], weighted['risk_amount']
             
             # Use separate TP1 and TP2 targets from strategy (not averaged)
             tp1_price = entry_1['take_profit']  # From Entry 1 (TP1_RR = 1.0)
             tp2_price = entry_2['take_profit']  # From Entry 2 (TP2_RR = 2.0)
             
-            # Store simulated position in flat structure for risk_manager
-            self.current_position = {
-                'side': side,
-                'entry_time': datetime.now(),
-                'simulated': True,
-                'entry_price': avg_entry,
-                'stop_loss': avg_sl,
-                'position_size': total_size,
-                'remaining_size': total_size,
-                'risk_amount': risk_amount,
-                'tp1': tp1_price,
-                'tp1_percent': self.config.get('tp1_percent', 30),
-                'tp2': tp2_price,
-                'tp2_percent': self.config.get('tp2_percent', 50),
-                'trailing_stop': None
-            }
+            # Store simulated position for risk_manager
+            self.current_position = Position(
+                side=side,
+                entry_time=int(time.time()),
+                entry_price=avg_entry,
+                stop_loss=avg_sl,
+                position_size=total_size,
+                remaining_size=total_size,
+                risk_amount=risk_amount,
+                tp1=tp1_price,
+                tp1_percent=self.config.get('tp1_percent', 30),
+                tp2=tp2_price,
+                tp2_percent=self.config.get('tp2_percent', 50),
+                simulated=True
+            )
             
             # Log simulated entry
             self.logger.log_trade_entry(
@@ -558,19 +824,50 @@ class TradingBot:
             # Save position to disk
             self._save_position_state()
             
-            print(f"{Fore.YELLOW}[DRY RUN] Entry 1: {entry_1['position_size']:.6f} @ {entry_1['price']:.4f} ({self.config['entry_1_percent']}%){Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}[DRY RUN] Entry 2: {entry_2['position_size']:.6f} @ {entry_2['price']:.4f} ({self.config['entry_2_percent']}%){Style.RESET_ALL}")
+            print(f"{YELLOW}[DRY RUN] Entry 1: {entry_1['position_size']:.6f} @ {entry_1['price']:.4f} ({self.config['entry_1_percent']}%){RESET}")
+            print(f"{YELLOW}[DRY RUN] Entry 2: {entry_2['position_size']:.6f} @ {entry_2['price']:.4f} ({self.config['entry_2_percent']}%){RESET}")
             
         except Exception as e:
             self.logger.log_exception(e, "simulate_entry")
     
-    def manage_position(self):
-        """Manage open position - check SL/TP and update trailing stop"""
-        if self.current_position is None or len(self.df) == 0:
+    def _manage_position_tick(self) -> bool:
+        """
+        Manage the open position from the live ticker and the last candle's ATR
+        
+        Used between candle closes so SL/TP checks cost one ticker call
+        instead of a kline refetch and full indicator recompute.
+        
+        Returns:
+            True if the position was managed, False if no live price/ATR was available
+        """
+        if self.current_position is None or self._last_atr is None:
+            return False
+        
+        live_price = self.get_live_price()
+        if live_price is None:
+            return False
+        
+        self.manage_position(live_price, self._last_atr)
+        return True
+    
+    def manage_position(self, current_price: Optional[float] = None, current_atr: Optional[float] = None):
+        """
+        Manage open position - check SL/TP and update trailing stop
+        
+        Args:
+            current_price: Price to evaluate (default: last candle close)
+            current_atr: ATR to use for trailing stop (default: last candle ATR)
+        """
+        if self.current_position is None:
             return
         
-        current_price = self.df.iloc[-1]['close']
-        current_atr = self.df.iloc[-1]['atr']
+        if current_price is None or current_atr is None:
+            if self.df is None or len(self.df) == 0:
+                return
+            if current_price is None:
+                current_price = self.last_close
+            if current_atr is None:
+                current_atr = self.df['atr'].iat[-1]
         
         # Update position with current market data
         updated_position, action = self.risk_manager.update_position(
@@ -588,9 +885,9 @@ class TradingBot:
         if action == "stop_loss":
             self.close_position("Stop loss hit", current_price)
         elif action == "tp1":
-            print(f"{Fore.GREEN}✓ TP1 hit at {current_price:.4f}{Style.RESET_ALL}")
+            print(f"{GREEN}✓ TP1 hit at {current_price:.4f}{RESET}")
             # Calculate size to close at TP1 (based on ORIGINAL position size before reduction)
-            tp1_size = self.current_position['position_size'] * (self.current_position.get('tp1_percent', 30) / 100)
+            tp1_size = self.current_position.position_size * (self.current_position.tp1_percent / 100)
             
             # Execute partial exit if not in paper trading mode
             if not self.config.get('paper_trading', True):
@@ -598,26 +895,26 @@ class TradingBot:
                     # Place market sell order for TP1 portion
                     result = self.api.create_market_order(
                         symbol=self.config['trading_pair'],
-                        side='sell' if self.current_position['side'] == 'long' else 'buy',
+                        side='sell' if self.current_position.side == 'long' else 'buy',
                         amount=tp1_size,
                         account=self.config.get('account', 'spot')
                     )
-                    print(f"{Fore.GREEN}→ Executed TP1 exit: {tp1_size:.6f} @ {current_price:.4f}{Style.RESET_ALL}")
+                    print(f"{GREEN}→ Executed TP1 exit: {tp1_size:.6f} @ {current_price:.4f}{RESET}")
                 except Exception as e:
                     self.logger.error(f"Failed to execute TP1 order: {e}")
-                    print(f"{Fore.RED}✗ Failed to execute TP1 order: {e}{Style.RESET_ALL}")
+                    print(f"{RED}✗ Failed to execute TP1 order: {e}{RESET}")
             
             self.logger.log_partial_exit(
                 self.config['trading_pair'],
-                self.current_position['side'],
+                self.current_position.side,
                 current_price,
                 tp1_size,
                 "TP1"
             )
         elif action == "tp2":
-            print(f"{Fore.GREEN}✓ TP2 hit at {current_price:.4f}{Style.RESET_ALL}")
+            print(f"{GREEN}✓ TP2 hit at {current_price:.4f}{RESET}")
             # Calculate size to close at TP2 (based on ORIGINAL position size before reduction)
-            tp2_size = self.current_position['position_size'] * (self.current_position.get('tp2_percent', 40) / 100)
+            tp2_size = self.current_position.position_size * (self.current_position.tp2_percent / 100)
             
             # Execute partial exit if not in paper trading mode
             if not self.config.get('paper_trading', True):
@@ -625,18 +922,18 @@ class TradingBot:
                     # Place market sell order for TP2 portion
                     result = self.api.create_market_order(
                         symbol=self.config['trading_pair'],
-                        side='sell' if self.current_position['side'] == 'long' else 'buy',
+                        side='sell' if self.current_position.side == 'long' else 'buy',
                         amount=tp2_size,
                         account=self.config.get('account', 'spot')
                     )
-                    print(f"{Fore.GREEN}→ Executed TP2 exit: {tp2_size:.6f} @ {current_price:.4f}{Style.RESET_ALL}")
+                    print(f"{GREEN}→ Executed TP2 exit: {tp2_size:.6f} @ {current_price:.4f}{RESET}")
                 except Exception as e:
                     self.logger.error(f"Failed to execute TP2 order: {e}")
-                    print(f"{Fore.RED}✗ Failed to execute TP2 order: {e}{Style.RESET_ALL}")
+                    print(f"{RED}✗ Failed to execute TP2 order: {e}{RESET}")
             
             self.logger.log_partial_exit(
                 self.config['trading_pair'],
-                self.current_position['side'],
+                self.current_position.side,
                 current_price,
                 tp2_size,
                 "TP2"
@@ -655,21 +952,21 @@ class TradingBot:
             # Log trade exit
             self.logger.log_trade_exit(
                 symbol=self.config['trading_pair'],
-                side=self.current_position['side'],
+                side=self.current_position.side,
                 exit_price=exit_price,
-                size=self.current_position['remaining_size'],
+                size=self.current_position.remaining_size,
                 pnl=pnl_info['pnl'],
                 reason=reason
             )
             
             # Record trade
             trade_record = {
-                'entry_time': self.current_position.get('entry_time'),
-                'exit_time': datetime.now(),
-                'side': self.current_position['side'],
-                'entry_price': self.current_position['entry_price'],
+                'entry_time': self.current_position.entry_time,
+                'exit_time': int(time.time()),
+                'side': self.current_position.side,
+                'entry_price': self.current_position.entry_price,
                 'exit_price': exit_price,
-                'size': self.current_position['position_size'],
+                'size': self.current_position.position_size,
                 'pnl': pnl_info['pnl'],
                 'pnl_percent': pnl_info['pnl_percent'],
                 'rr_achieved': pnl_info['rr_achieved'],
@@ -678,8 +975,8 @@ class TradingBot:
             self.trade_history.append(trade_record)
             
             # Print result
-            pnl_color = Fore.GREEN if pnl_info['pnl'] >= 0 else Fore.RED
-            print(f"{pnl_color}✓ Position closed: {reason} | PnL: {pnl_info['pnl']:.4f} ({pnl_info['pnl_percent']:.2f}%){Style.RESET_ALL}")
+            pnl_color = GREEN if pnl_info['pnl'] >= 0 else RED
+            print(f"{pnl_color}✓ Position closed: {reason} | PnL: {pnl_info['pnl']:.4f} ({pnl_info['pnl_percent']:.2f}%){RESET}")
             
             # Clear position
             self.current_position = None
@@ -693,95 +990,195 @@ class TradingBot:
     def run_once(self):
         """Run one iteration of the bot"""
         try:
-            print(f"\n{Fore.CYAN}[{datetime.now().strftime('%H:%M:%S')}] Checking market...{Style.RESET_ALL}")
+            print(f"\n{CYAN}[{datetime.now().strftime('%H:%M:%S')}] Checking market...{RESET}")
+            
+            # Mid-candle with an open position: indicators cannot have changed,
+            # so only the live price is needed
+            if self.current_position is not None and time.time() < self._last_candle_close_ts:
+                if self._manage_position_tick():
+                    return
+            
+            # Klines, balance and ticker are independent: request balance and
+            # ticker on worker threads while the klines load here
+            equity_future = None if self.config['dry_run'] else self.io_pool.submit(self.update_equity)
+            price_future = None if self.current_position else self.io_pool.submit(self.get_live_price)
             
             # Fetch market data
             if not self.fetch_market_data():
-                print(f"{Fore.RED}Failed to fetch market data{Style.RESET_ALL}")
+                print(f"{RED}Failed to fetch market data{RESET}")
                 return
             
-            current_price = self.df.iloc[-1]['close']
-            print(f"{Fore.WHITE}Current Price: {current_price:.4f}{Style.RESET_ALL}")
+            current_price = self.last_close
+            print(f"{WHITE}Current Price: {current_price:.4f}{RESET}")
             
             # Update equity
-            if not self.config['dry_run']:
-                self.update_equity()
-                print(f"{Fore.WHITE}Equity: {self.equity:.2f} USDT{Style.RESET_ALL}")
+            if equity_future is not None:
+                equity_future.result()
+                print(f"{WHITE}Equity: {self.equity:.2f} USDT{RESET}")
             
             # Manage existing position
             if self.current_position:
-                print(f"{Fore.YELLOW}Managing open position...{Style.RESET_ALL}")
+                print(f"{YELLOW}Managing open position...{RESET}")
                 self.manage_position()
             else:
-                print(f"{Fore.WHITE}Scanning for entry signals...{Style.RESET_ALL}")
+                print(f"{WHITE}Scanning for entry signals...{RESET}")
                 # Check for entry signals
-                self.check_entry_signal()
+                self.check_entry_signal(price_future.result())
             
         except Exception as e:
             self.logger.log_exception(e, "run_once")
     
     def start(self):
         """Start trading bot"""
-        self.is_running = True
-        self.logger.log_bot_start(self.config)
+        run_bots([self])
+    
+    def stop(self):
+        """Stop trading bot"""
+        self.is_running = False
         
-        print(f"{Fore.GREEN}{'='*60}")
-        print(f"{Fore.GREEN}Bot started in {'DRY RUN' if self.config['dry_run'] else 'LIVE'} mode")
-        print(f"{Fore.GREEN}{'='*60}\n{Style.RESET_ALL}")
+        # Close any open positions
+        if self.current_position and not self.config['dry_run']:
+            self.close_position("Bot stopped", self.last_close)
         
-        update_interval = self._get_timeframe_seconds()
+        # Release worker threads and connections
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+        if self._owns_api:
+            self.api.close()  # also stops the market stream
+        else:
+            self.api.stop_market_stream()
+        self.logger.log_bot_stop()
+        print(f"{YELLOW}Bot stopped{RESET}")
+
+
+def run_bots(bots: List[TradingBot]):
+    """
+    Run the trading loop for one or more bots
+    
+    Each bot usually trades its own pair. A tick is run for all bots at once
+    on a thread pool, so per-pair REST latency overlaps instead of adding up.
+    
+    Args:
+        bots: Bots to run (they share the loop's candle schedule)
+    """
+    for bot in bots:
+        bot.is_running = True
+        bot.logger.log_bot_start(bot.config)
         
-        while self.is_running:
+        print(f"{GREEN}{'='*60}")
+        print(f"{GREEN}Bot started in {'DRY RUN' if bot.config['dry_run'] else 'LIVE'} mode ({bot.config['trading_pair']})")
+        print(f"{GREEN}{'='*60}\n{RESET}")
+    
+    tf_seconds = min(bot._tf_seconds for bot in bots)
+    executor = ThreadPoolExecutor(max_workers=len(bots), thread_name_prefix="gate-pair") if len(bots) > 1 else None
+    
+    def for_each(func, targets):
+        if executor is None or len(targets) == 1:
+            for target in targets:
+                func(target)
+        else:
+            list(executor.map(func, targets))
+    
+    def running():
+        return [bot for bot in bots if bot.is_running]
+    
+    try:
+        while running():
             try:
-                self.run_once()
+                for_each(TradingBot.run_once, running())
+                
+                # Wake at the next candle close; while a position is open also
+                # wake every POSITION_POLL_SECONDS to manage SL/TP intra-candle
+                next_close = (int(time.time()) // tf_seconds + 1) * tf_seconds + CANDLE_CLOSE_GRACE
+                print(f"\nWaiting for next candle close at "
+                      f"{datetime.fromtimestamp(next_close).strftime('%H:%M:%S')}... (Press Ctrl+C to stop)")
                 
-                # Wait for next candle
-                print(f"\nWaiting for next update... (Press Ctrl+C to stop)")
-                time.sleep(update_interval)
+                # Deadlines on the monotonic clock: work done inside the loop
+                # doesn't push later wakeups back and NTP steps can't skew them
+                start_mono = time.monotonic()
+                deadline = start_mono + max(0.0, next_close - time.time())
+                next_poll = start_mono + POSITION_POLL_SECONDS
+                
+                while running():
+                    in_position = [bot for bot in running() if bot.current_position is not None]
+                    wake = min(deadline, next_poll) if in_position else deadline
+                    time.sleep(max(0.0, wake - time.monotonic()))
+                    
+                    now_mono = time.monotonic()
+                    if now_mono >= deadline:
+                        break
+                    if in_position and now_mono >= next_poll:
+                        for_each(TradingBot._manage_position_tick, in_position)
+                        next_poll += POSITION_POLL_SECONDS
+                        if next_poll <= time.monotonic():
+                            # Tick overran the interval; skip the missed polls
+                            next_poll = time.monotonic() + POSITION_POLL_SECONDS
                 
             except KeyboardInterrupt:
-                print(f"\n{Fore.YELLOW}Bot stopped by user{Style.RESET_ALL}")
-                self.stop()
+                print(f"\n{YELLOW}Bot stopped by user{RESET}")
+                for bot in running():
+                    bot.stop()
                 break
             except Exception as e:
-                self.logger.log_exception(e, "Bot main loop")
+                bots[0].logger.log_exception(e, "Bot main loop")
                 time.sleep(60)  # Wait 1 minute on error
-    
-    def stop(self):
-        """Stop trading bot"""
-        self.is_running = False
-        
-        # Close any open positions
-        if self.current_position and not self.config['dry_run']:
-            current_price = self.df.iloc[-1]['close'] if self.df is not None else 0
-            self.close_position("Bot stopped", current_price)
-        
-        self.logger.log_bot_stop()
-        print(f"{Fore.YELLOW}Bot stopped{Style.RESET_ALL}")
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
 
 
 def print_header():
     """Print bot header"""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}          Gate.io Trading Bot - MA Method 2")
-    print(f"{Fore.CYAN}{'='*60}\n{Style.RESET_ALL}")
+    _emit([f"\n{CYAN}{'='*60}",
+           f"{CYAN}          Gate.io Trading Bot - MA Method 2",
+           f"{CYAN}{'='*60}\n{RESET}"])
+
+
+# The menu never changes, so it is formatted once at import
+_MENU_LINES = (
+    f"\n{CYAN}{'─'*60}",
+    f"{CYAN}MAIN MENU",
+    f"{CYAN}{'─'*60}{RESET}",
+    f"{WHITE}1. Start Trading Bot",
+    f"{WHITE}2. View Current Position",
+    f"{WHITE}3. View Strategy Status",
+    f"{WHITE}4. View Account Balance",
+    f"{WHITE}5. View Configuration",
+    f"{WHITE}6. View Trade History",
+    f"{WHITE}7. Test API Connection",
+    f"{WHITE}8. Emergency Stop All",
+    f"{WHITE}9. Exit{RESET}",
+    f"{CYAN}{'─'*60}{RESET}",
+)
 
 
 def print_menu():
     """Print main menu"""
-    print(f"\n{Fore.CYAN}{'─'*60}")
-    print(f"{Fore.CYAN}MAIN MENU")
-    print(f"{Fore.CYAN}{'─'*60}{Style.RESET_ALL}")
-    print(f"{Fore.WHITE}1. Start Trading Bot")
-    print(f"{Fore.WHITE}2. View Current Position")
-    print(f"{Fore.WHITE}3. View Strategy Status")
-    print(f"{Fore.WHITE}4. View Account Balance")
-    print(f"{Fore.WHITE}5. View Configuration")
-    print(f"{Fore.WHITE}6. View Trade History")
-    print(f"{Fore.WHITE}7. Test API Connection")
-    print(f"{Fore.WHITE}8. Emergency Stop All")
-    print(f"{Fore.WHITE}9. Exit{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}{'─'*60}{Style.RESET_ALL}")
+    _emit(_MENU_LINES)
+
+
+def _start_preamble(bot: TradingBot) -> List[str]:
+    """Lines describing what the bot will do, shown before it starts"""
+    config = bot.config
+    is_testnet = config.get('use_testnet', False)
+    mode_label = "[TESTNET]" if is_testnet else "[MAINNET - LIVE]"
+    mode_color = YELLOW if is_testnet else RED
+    trading_mode = "DRY RUN (Simulation)" if config['dry_run'] else "LIVE TRADING"
+    
+    return [
+        f"\n{CYAN}{'='*60}",
+        "START TRADING BOT",
+        f"{'='*60}{RESET}",
+        f"\n{YELLOW}Bot akan:{RESET}",
+        f"  • Monitor market setiap {config['timeframe']}",
+        "  • Cari entry signal (EMA crossover + RSI + ADX + Volume)",
+        f"  • Execute trade {'(SIMULASI SAJA)' if config['dry_run'] else '(REAL TRADE)'}",
+        "  • Manage position dengan trailing stop & take profit",
+        f"\n{GREEN}Symbol:{RESET} {config['trading_pair']}",
+        f"{GREEN}Timeframe:{RESET} {config['timeframe']}",
+        f"{GREEN}Mode:{RESET} {trading_mode} {mode_color}{mode_label}{RESET}",
+    ]
 
 
 def main():
@@ -791,54 +1188,63 @@ def main():
     parser.add_argument('--start', action='store_true', help='Start trading bot directly without menu')
     parser.add_argument('--status', action='store_true', help='Show strategy status and exit')
     parser.add_argument('--balance', action='store_true', help='Show account balance and exit')
+    parser.add_argument('--pairs', type=str, default='',
+                        help='Comma-separated pairs to trade concurrently (e.g. BTC_USDT,ETH_USDT). '
+                             'All pairs share one API client and the same USDT balance; each bot '
+                             'may commit up to MAX_USDT_PER_TRADE, so plan for N times that.')
     args = parser.parse_args()
     
     print_header()
     
+    pairs = [p.strip() for p in args.pairs.split(',') if p.strip()]
+    if len(pairs) > 1:
+        # Multi-pair: one bot per pair, ticks run concurrently. The bots trade
+        # one account, so they share a single client (one rate limiter for the
+        # API key) and each keeps its position in its own state file
+        try:
+            config = TradingBot._load_config()
+            api = TradingBot.create_api(config)
+            bots = [TradingBot(trading_pair=pair, api=api, per_pair_state=True) for pair in pairs]
+        except Exception as e:
+            print(f"{RED}✗ Failed to initialize bots: {e}{RESET}")
+            print(f"{YELLOW}Please check your .env configuration{RESET}")
+            return
+        
+        max_usdt = config['max_usdt_per_trade']
+        print(f"\n{YELLOW}Shared USDT balance: up to {len(bots)} x {max_usdt:.2f} = "
+              f"{len(bots) * max_usdt:.2f} USDT can be committed at once{RESET}")
+        print(f"\n{GREEN}Starting {len(bots)} bots: {', '.join(pairs)}. Tekan Ctrl+C untuk stop.{RESET}\n")
+        with api:
+            run_bots(bots)
+        return
+    
     # Initialize bot
     try:
-        bot = TradingBot()
+        bot = TradingBot(trading_pair=pairs[0] if pairs else None)
     except Exception as e:
-        print(f"{Fore.RED}✗ Failed to initialize bot: {e}{Style.RESET_ALL}")
-        print(f"{Fore.YELLOW}Please check your .env configuration{Style.RESET_ALL}")
+        print(f"{RED}✗ Failed to initialize bot: {e}{RESET}")
+        print(f"{YELLOW}Please check your .env configuration{RESET}")
         return
     
     # Handle command line arguments
     if args.start:
         # Start bot directly
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"START TRADING BOT")
-        print(f"{'='*60}{Style.RESET_ALL}")
-        print(f"\n{Fore.YELLOW}Bot akan:{Style.RESET_ALL}")
-        print(f"  • Monitor market setiap {bot.config['timeframe']}")
-        print(f"  • Cari entry signal (EMA crossover + RSI + ADX + Volume)")
-        print(f"  • Execute trade {'(SIMULASI SAJA)' if bot.config['dry_run'] else '(REAL TRADE)'}")
-        print(f"  • Manage position dengan trailing stop & take profit")
-        
-        is_testnet = bot.config.get('use_testnet', False)
-        mode_label = "[TESTNET]" if is_testnet else "[MAINNET - LIVE]"
-        mode_color = Fore.YELLOW if is_testnet else Fore.RED
-        trading_mode = "DRY RUN (Simulation)" if bot.config['dry_run'] else "LIVE TRADING"
-        
-        print(f"\n{Fore.GREEN}Symbol:{Style.RESET_ALL} {bot.config['trading_pair']}")
-        print(f"{Fore.GREEN}Timeframe:{Style.RESET_ALL} {bot.config['timeframe']}")
-        print(f"{Fore.GREEN}Mode:{Style.RESET_ALL} {trading_mode} {mode_color}{mode_label}{Style.RESET_ALL}")
-        print(f"\n{Fore.GREEN}Starting bot... Tekan Ctrl+C untuk stop.{Style.RESET_ALL}\n")
+        _emit(_start_preamble(bot) + [f"\n{GREEN}Starting bot... Tekan Ctrl+C untuk stop.{RESET}\n"])
         bot.start()
         return
     
     if args.status:
         # Show status and exit
-        print(f"\n{Fore.YELLOW}Fetching market data...{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Fetching market data...{RESET}")
         if bot.fetch_market_data():
-            print(f"{Fore.YELLOW}Fetching live price...{Style.RESET_ALL}")
+            print(f"{YELLOW}Fetching live price...{RESET}")
             live_price = bot.get_live_price()
             if live_price:
-                print(f"{Fore.GREEN}Live price fetched: ${live_price:.4f}{Style.RESET_ALL}")
+                print(f"{GREEN}Live price fetched: ${live_price:.4f}{RESET}")
             status = bot.strategy.get_strategy_status(bot.df, live_price)
             print(bot.strategy.format_status_for_display(status))
         else:
-            print(f"{Fore.RED}Failed to fetch market data{Style.RESET_ALL}")
+            print(f"{RED}Failed to fetch market data{RESET}")
         return
     
     if args.balance:
@@ -848,151 +1254,142 @@ def main():
     
     while True:
         print_menu()
-        choice = input(f"\n{Fore.GREEN}Select option (1-9): {Style.RESET_ALL}").strip()
+        choice = input(f"\n{GREEN}Select option (1-9): {RESET}").strip()
         
         if choice == '1':
             # Start bot
-            print(f"\n{Fore.CYAN}{'='*60}")
-            print(f"START TRADING BOT")
-            print(f"{'='*60}{Style.RESET_ALL}")
-            print(f"\n{Fore.YELLOW}Bot akan:{Style.RESET_ALL}")
-            print(f"  • Monitor market setiap {bot.config['timeframe']}")
-            print(f"  • Cari entry signal (EMA crossover + RSI + ADX + Volume)")
-            print(f"  • Execute trade {'(SIMULASI SAJA)' if bot.config['dry_run'] else '(REAL TRADE)'}")
-            print(f"  • Manage position dengan trailing stop & take profit")
-            
-            # Show testnet/mainnet mode
-            is_testnet = bot.config.get('use_testnet', False)
-            mode_label = "[TESTNET]" if is_testnet else "[MAINNET - LIVE]"
-            mode_color = Fore.YELLOW if is_testnet else Fore.RED
-            trading_mode = "DRY RUN (Simulation)" if bot.config['dry_run'] else "LIVE TRADING"
-            
-            print(f"\n{Fore.GREEN}Symbol:{Style.RESET_ALL} {bot.config['trading_pair']}")
-            print(f"{Fore.GREEN}Timeframe:{Style.RESET_ALL} {bot.config['timeframe']}")
-            print(f"{Fore.GREEN}Mode:{Style.RESET_ALL} {trading_mode} {mode_color}{mode_label}{Style.RESET_ALL}")
-            
-            confirm = input(f"\n{Fore.YELLOW}Mulai bot? (yes/no): {Style.RESET_ALL}").lower()
+            _emit(_start_preamble(bot))
+            
+            confirm = input(f"\n{YELLOW}Mulai bot? (yes/no): {RESET}").lower()
             if confirm == 'yes':
-                print(f"\n{Fore.GREEN}Bot started! Tekan Ctrl+C untuk stop.{Style.RESET_ALL}\n")
+                print(f"\n{GREEN}Bot started! Tekan Ctrl+C untuk stop.{RESET}\n")
                 bot.start()
             else:
-                print(f"{Fore.YELLOW}Cancelled{Style.RESET_ALL}")
+                print(f"{YELLOW}Cancelled{RESET}")
         
         elif choice == '2':
             # View position
             if bot.current_position:
-                current_price = bot.df.iloc[-1]['close'] if bot.df is not None else 0
+                current_price = bot.last_close
                 print(bot.risk_manager.format_position_for_display(bot.current_position, current_price))
             else:
-                print(f"\n{Fore.YELLOW}No open position{Style.RESET_ALL}")
+                print(f"\n{YELLOW}No open position{RESET}")
         
         elif choice == '3':
             # View strategy status
-            print(f"\n{Fore.YELLOW}Fetching market data...{Style.RESET_ALL}")
+            print(f"\n{YELLOW}Fetching market data...{RESET}")
             if bot.fetch_market_data():
                 # Get live price for accurate status
-                print(f"{Fore.YELLOW}Fetching live price...{Style.RESET_ALL}")
+                print(f"{YELLOW}Fetching live price...{RESET}")
                 live_price = bot.get_live_price()
                 if live_price:
-                    print(f"{Fore.GREEN}Live price fetched: ${live_price:.4f}{Style.RESET_ALL}")
+                    print(f"{GREEN}Live price fetched: ${live_price:.4f}{RESET}")
                 else:
-                    print(f"{Fore.YELLOW}Warning: Could not fetch live price{Style.RESET_ALL}")
+                    print(f"{YELLOW}Warning: Could not fetch live price{RESET}")
                 status = bot.strategy.get_strategy_status(bot.df, live_price)
                 print(bot.strategy.format_status_for_display(status))
             else:
-                print(f"{Fore.RED}Failed to fetch market data{Style.RESET_ALL}")
+                print(f"{RED}Failed to fetch market data{RESET}")
         
         elif choice == '4':
             # View balance
-            print(f"\n{Fore.YELLOW}Fetching account balance...{Style.RESET_ALL}")
+            print(f"\n{YELLOW}Fetching account balance...{RESET}")
             if bot.update_equity():
-                print(f"\n{Fore.GREEN}Total Equity (USDT): {bot.equity:.2f}{Style.RESET_ALL}")
+                print(f"\n{GREEN}Total Equity (USDT): {bot.equity:.2f}{RESET}")
             else:
-                print(f"{Fore.RED}Failed to fetch balance{Style.RESET_ALL}")
+                print(f"{RED}Failed to fetch balance{RESET}")
         
         elif choice == '5':
             # View configuration
-            mode = "[TESTNET]" if bot.config.get('use_testnet', False) else "[MAINNET - LIVE]"
-            mode_color = Fore.YELLOW if bot.config.get('use_testnet', False) else Fore.RED
-            print(f"\n{Fore.CYAN}{'='*60}")
-            print(f"CONFIGURATION")
-            print(f"{'='*60}{Style.RESET_ALL}")
-            print(f"Exchange: Gate.io {mode_color}{mode}{Style.RESET_ALL}")
-            print(f"Trading Pair: {bot.config['trading_pair']}")
-            print(f"Timeframe: {bot.config['timeframe']}")
-            print(f"EMA: {bot.config['ema_short']}/{bot.config['ema_long']}")
-            print(f"RSI: {bot.config['rsi_length']} (range: {bot.config['rsi_min']}-{bot.config['rsi_max']})")
-            print(f"ADX Threshold: {bot.config['adx_threshold']}")
-            print(f"Max USDT per Trade: {bot.config['max_usdt_per_trade']:.2f} USDT")
-            print(f"Entry Split: Entry 1 ({bot.config['entry_1_percent']}%) | Entry 2 ({bot.config['entry_2_percent']}%)")
-            print(f"SL ATR Multiplier: {bot.config['sl_atr_multiplier']}")
-            print(f"TP1: {bot.config['tp1_rr']}R ({bot.config['tp1_percent']}%)")
-            print(f"TP2: {bot.config['tp2_rr']}R ({bot.config['tp2_percent']}%)")
-            print(f"Mode: {'DRY RUN' if bot.config['dry_run'] else 'LIVE'}")
+            config = bot.config
+            is_testnet = config.get('use_testnet', False)
+            mode = "[TESTNET]" if is_testnet else "[MAINNET - LIVE]"
+            mode_color = YELLOW if is_testnet else RED
+            _emit([
+                f"\n{CYAN}{'='*60}",
+                "CONFIGURATION",
+                f"{'='*60}{RESET}",
+                f"Exchange: Gate.io {mode_color}{mode}{RESET}",
+                f"Trading Pair: {config['trading_pair']}",
+                f"Timeframe: {config['timeframe']}",
+                f"EMA: {config['ema_short']}/{config['ema_long']}",
+                f"RSI: {config['rsi_length']} (range: {config['rsi_min']}-{config['rsi_max']})",
+                f"ADX Threshold: {config['adx_threshold']}",
+                f"Max USDT per Trade: {config['max_usdt_per_trade']:.2f} USDT",
+                f"Entry Split: Entry 1 ({config['entry_1_percent']}%) | Entry 2 ({config['entry_2_percent']}%)",
+                f"SL ATR Multiplier: {config['sl_atr_multiplier']}",
+                f"TP1: {config['tp1_rr']}R ({config['tp1_percent']}%)",
+                f"TP2: {config['tp2_rr']}R ({config['tp2_percent']}%)",
+                f"Mode: {'DRY RUN' if config['dry_run'] else 'LIVE'}",
+            ])
         
         elif choice == '6':
             # View trade history
             if bot.trade_history:
-                print(f"\n{Fore.CYAN}{'='*60}")
+                print(f"\n{CYAN}{'='*60}")
                 print(f"TRADE HISTORY ({len(bot.trade_history)} trades)")
-                print(f"{'='*60}{Style.RESET_ALL}")
+                print(f"{'='*60}{RESET}")
                 
                 for i, trade in enumerate(bot.trade_history[-10:], 1):  # Show last 10
-                    pnl_color = Fore.GREEN if trade['pnl'] >= 0 else Fore.RED
+                    pnl_color = GREEN if trade['pnl'] >= 0 else RED
                     print(f"{i}. {trade['side'].upper()} | Entry: {trade['entry_price']:.4f} | "
                           f"Exit: {trade['exit_price']:.4f} | "
-                          f"{pnl_color}PnL: {trade['pnl']:.4f} ({trade['pnl_percent']:.2f}%){Style.RESET_ALL} | "
+                          f"{pnl_color}PnL: {trade['pnl']:.4f} ({trade['pnl_percent']:.2f}%){RESET} | "
                           f"Reason: {trade['reason']}")
             else:
-                print(f"\n{Fore.YELLOW}No trade history{Style.RESET_ALL}")
+                print(f"\n{YELLOW}No trade history{RESET}")
         
         elif choice == '7':
             # Test API connection
-            print(f"\n{Fore.YELLOW}Testing Gate.io API connection...{Style.RESET_ALL}")
+            print(f"\n{YELLOW}Testing Gate.io API connection...{RESET}")
             try:
-                if bot.api.test_connection():
-                    print(f"{Fore.GREEN}✓ API connection successful{Style.RESET_ALL}")
-                    if bot.api.test_auth():
-                        print(f"{Fore.GREEN}✓ Authentication successful{Style.RESET_ALL}")
-                        price = bot.api.get_last_price(bot.config['trading_pair'])
-                        print(f"{Fore.GREEN}Current price: {price:.4f}{Style.RESET_ALL}")
+                connected, authed, price = bot.api.batch_health_check(bot.config['trading_pair'])
+                if connected:
+                    print(f"{GREEN}✓ API connection successful{RESET}")
+                    if authed:
+                        print(f"{GREEN}✓ Authentication successful{RESET}")
+                        if price is None:
+                            raise Exception("could not fetch last price")
+                        print(f"{GREEN}Current price: {price:.4f}{RESET}")
                     else:
-                        print(f"{Fore.RED}✗ Authentication failed{Style.RESET_ALL}")
+                        print(f"{RED}✗ Authentication failed{RESET}")
                 else:
-                    print(f"{Fore.RED}✗ API connection failed{Style.RESET_ALL}")
+                    print(f"{RED}✗ API connection failed{RESET}")
             except Exception as e:
-                print(f"{Fore.RED}✗ API test failed: {e}{Style.RESET_ALL}")
+                print(f"{RED}✗ API test failed: {e}{RESET}")
         
         elif choice == '8':
             # Emergency stop
-            print(f"\n{Fore.RED}{'='*60}")
+            print(f"\n{RED}{'='*60}")
             print(f"EMERGENCY STOP")
-            print(f"{'='*60}{Style.RESET_ALL}")
-            confirm = input(f"{Fore.RED}Close all positions and stop bot? (yes/no): {Style.RESET_ALL}").lower()
+            print(f"{'='*60}{RESET}")
+            confirm = input(f"{RED}Close all positions and stop bot? (yes/no): {RESET}").lower()
             if confirm == 'yes':
                 bot.stop()
-                print(f"{Fore.GREEN}✓ All operations stopped{Style.RESET_ALL}")
+                print(f"{GREEN}✓ All operations stopped{RESET}")
         
         elif choice == '9':
             # Exit
-            print(f"\n{Fore.YELLOW}Exiting...{Style.RESET_ALL}")
+            print(f"\n{YELLOW}Exiting...{RESET}")
             if bot.is_running:
                 bot.stop()
-            print(f"{Fore.GREEN}Goodbye!{Style.RESET_ALL}")
+            else:
+                bot.api.close()
+            print(f"{GREEN}Goodbye!{RESET}")
             break
         
         else:
-            print(f"{Fore.RED}Invalid option. Please select 1-9.{Style.RESET_ALL}")
+            print(f"{RED}Invalid option. Please select 1-9.{RESET}")
         
-        input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
+        input(f"\n{CYAN}Press Enter to continue...{RESET}")
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW}Program interrupted by user{Style.RESET_ALL}")
+        print(f"\n{YELLOW}Program interrupted by user{RESET}")
         sys.exit(0)
     except Exception as e:
-        print(f"\n{Fore.RED}Fatal error: {e}{Style.RESET_ALL}")
+        print(f"\n{RED}Fatal error: {e}{RESET}")
         sys.exit(1)
@@ -6,14 +6,10 @@ Run this script to verify your Gate.io API configuration
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-def check_env_variable(var_name, required=True):
-    """Check if environment variable exists and is not empty"""
-    value = os.getenv(var_name)
+def check_env_variable(var_name, env, required=True):
+    """Check if environment variable exists and is not empty (env: os.environ snapshot)"""
+    value = env.get(var_name)
     
     if value is None or value == "":
         status = "❌ MISSING"
@@ -36,6 +32,10 @@ def check_env_variable(var_name, required=True):
 
 def main():
     """Main verification function"""
+    # Load environment variables (imported here so importing this module stays cheap)
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     print("="*80)
     print("Gate.io API Setup Verification")
     print("="*80)
@@ -76,17 +76,18 @@ def main():
         ("GATE_ACCOUNT", False),
     ]
     
-    print("\nRequired Variables:")
-    for var_name, required in required_vars:
-        success, status = check_env_variable(var_name, required)
-        print(f"  {var_name:<25} {status}")
-        if not success:
-            all_good = False
-    
-    print("\nOptional Variables:")
-    for var_name, required in optional_vars:
-        success, status = check_env_variable(var_name, required)
-        print(f"  {var_name:<25} {status}")
+    # Snapshot the environment once and run every check against it
+    env = os.environ.copy()
+    results = [(var_name, required, *check_env_variable(var_name, env, required))
+               for var_name, required in required_vars + optional_vars]
+    
+    required_lines = [f"  {name:<25} {status}" for name, required, _, status in results if required]
+    optional_lines = [f"  {name:<25} {status}" for name, required, _, status in results if not required]
+    print("\nRequired Variables:\n" + "\n".join(required_lines))
+    print("\nOptional Variables:\n" + "\n".join(optional_lines))
+    
+    if not all(success for _, required, success, _ in results if required):
+        all_good = False
     
     print()
     print("-"*80)
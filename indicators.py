@@ -3,10 +3,273 @@ Technical Indicators Calculator
 Calculate EMA, RSI, ADX, ATR for trading strategy
 """
 
+import os
 import pandas as pd
 import numpy as np
+import threading
+from collections import OrderedDict, namedtuple
 from typing import Tuple, Optional
 
+# Numba JIT (optional - falls back to the pandas implementation)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# TA-Lib (optional - C implementations of the indicator primitives)
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# TA-Lib seeds EMA/RSI with an SMA and smooths ATR/ADX with Wilder's alpha, so its
+# values differ from ours during warm-up (and for ATR/ADX throughout). It is only
+# used when explicitly selected with INDICATOR_BACKEND=talib.
+if TALIB_AVAILABLE and os.getenv('INDICATOR_BACKEND', '').lower() == 'talib':
+    _BACKEND = 'talib'
+elif NUMBA_AVAILABLE:
+    _BACKEND = 'numba'
+else:
+    _BACKEND = 'pandas'
+
+
+# ==================== JIT Kernels ====================
+
+# Kernels carry explicit signatures, so numba compiles them eagerly at import
+# (loading from the on-disk cache after the first run) instead of on the first
+# indicator call. fastmath stays off: the kernels rely on NaN self-comparison.
+_KERNEL_SIGNATURE = ('UniTuple(float64[:], 8)(float64[:], float64[:], float64[:], float64[:], '
+                     'int64, int64, int64, int64, int64, int64)')
+
+@njit('float64[:](float64[:], float64)', cache=True)
+def _ewm(values, alpha):
+    """
+    Recursive EMA identical to pandas ewm(alpha=alpha, adjust=False).mean()
+    
+    NaN inputs are skipped the same way pandas does (ignore_na=False):
+    the previous value is carried and its weight keeps decaying.
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        cur = values[i]
+        if weighted == weighted:
+            old_wt *= 1.0 - alpha
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit('float64(float64, float64)', cache=True)
+def _div(num, den):
+    """Float division with numpy semantics for a zero denominator"""
+    if den != 0.0:
+        return num / den
+    if num != num or num == 0.0:
+        return np.nan
+    return np.inf if num > 0.0 else -np.inf
+
+
+@njit('float64[:](float64[:], int64)', cache=True)
+def _rsi_kernel(close, period):
+    """
+    Wilder RSI in a single pass
+    
+    Average gain/loss use Wilder smoothing, avg = (avg * (period - 1) + x) / period,
+    seeded from the first bar like the pandas path.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    out[0] = np.nan  # no change yet: 0/0
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+        avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+        out[i] = 100.0 - 100.0 / (1.0 + _div(avg_gain, avg_loss))
+    return out
+
+
+@njit('UniTuple(float64, 2)(float64, float64, float64, float64)', cache=True)
+def _ewm_step(weighted, old_wt, cur, alpha):
+    """One step of _ewm: returns the updated (weighted, old_wt)"""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            old_wt = 1.0
+    elif cur == cur:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(_KERNEL_SIGNATURE, cache=True)
+def _indicator_kernel(high, low, close, volume, ema_short, ema_long, rsi_period,
+                      atr_period, adx_period, volume_ma_period):
+    """
+    All strategy indicators fused into one pass over the OHLCV arrays
+    
+    Every recurrence (EMAs, Wilder RSI, ATR, +DM/-DM smoothing, ADX) and the
+    trailing volume sum advance together per bar, so TR and DM are never
+    materialized as arrays. Pass an empty volume array to skip the volume MA.
+    
+    Returns:
+        Tuple of (ema_short, ema_long, rsi, atr, adx, plus_di, minus_di, volume_ma) arrays
+    """
+    n = close.shape[0]
+    ema_s = np.empty(n)
+    ema_l = np.empty(n)
+    rsi = np.empty(n)
+    atr = np.empty(n)
+    adx = np.empty(n)
+    plus_di = np.empty(n)
+    minus_di = np.empty(n)
+    has_volume = volume.shape[0] == n
+    volume_ma = np.empty(n if has_volume else 0)
+    
+    a_short = 2.0 / (ema_short + 1)
+    a_long = 2.0 / (ema_long + 1)
+    a_rsi = 1.0 / rsi_period
+    a_atr = 2.0 / (atr_period + 1)
+    a_adx = 2.0 / (adx_period + 1)
+    shared_atr = adx_period == atr_period
+    
+    # (value, weight) state of each ewm-style recurrence
+    es, es_w = np.nan, 1.0
+    el, el_w = np.nan, 1.0
+    at, at_w = np.nan, 1.0
+    adx_at, adx_at_w = np.nan, 1.0
+    ap, ap_w = np.nan, 1.0
+    am, am_w = np.nan, 1.0
+    ax, ax_w = np.nan, 1.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    vol_sum = 0.0
+    vol_nans = 0
+    
+    for i in range(n):
+        if i == 0:
+            tr = high[0] - low[0]
+            plus_dm = 0.0
+            minus_dm = 0.0
+            rsi[0] = np.nan  # no change yet: 0/0
+        else:
+            prev_close = close[i - 1]
+            tr = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+            
+            up = high[i] - high[i - 1]
+            down = low[i - 1] - low[i]
+            plus_dm = up if up > down and up > 0 else 0.0
+            minus_dm = down if down > up and down > 0 else 0.0
+            
+            delta = close[i] - prev_close
+            avg_gain = (1.0 - a_rsi) * avg_gain + a_rsi * (delta if delta > 0 else 0.0)
+            avg_loss = (1.0 - a_rsi) * avg_loss + a_rsi * (-delta if delta < 0 else 0.0)
+            rsi[i] = 100.0 - 100.0 / (1.0 + _div(avg_gain, avg_loss))
+        
+        es, es_w = _ewm_step(es, es_w, close[i], a_short)
+        el, el_w = _ewm_step(el, el_w, close[i], a_long)
+        at, at_w = _ewm_step(at, at_w, tr, a_atr)
+        if shared_atr:
+            adx_at = at
+        else:
+            adx_at, adx_at_w = _ewm_step(adx_at, adx_at_w, tr, a_adx)
+        ap, ap_w = _ewm_step(ap, ap_w, plus_dm, a_adx)
+        am, am_w = _ewm_step(am, am_w, minus_dm, a_adx)
+        
+        pdi = 100.0 * _div(ap, adx_at)
+        mdi = 100.0 * _div(am, adx_at)
+        dx = 100.0 * _div(abs(pdi - mdi), pdi + mdi)
+        ax, ax_w = _ewm_step(ax, ax_w, dx, a_adx)
+        
+        ema_s[i] = es
+        ema_l[i] = el
+        atr[i] = at
+        plus_di[i] = pdi
+        minus_di[i] = mdi
+        adx[i] = ax
+        
+        if has_volume:
+            v = volume[i]
+            if v == v:
+                vol_sum += v
+            else:
+                vol_nans += 1
+            if i >= volume_ma_period:
+                old = volume[i - volume_ma_period]
+                if old == old:
+                    vol_sum -= old
+                else:
+                    vol_nans -= 1
+            if i + 1 >= volume_ma_period and vol_nans == 0:
+                volume_ma[i] = vol_sum / volume_ma_period
+            else:
+                volume_ma[i] = np.nan
+    
+    return ema_s, ema_l, rsi, atr, adx, plus_di, minus_di, volume_ma
+
+
+_KERNEL_COLUMNS = ('ema_short', 'ema_long', 'rsi', 'atr', 'adx', 'plus_di', 'minus_di', 'volume_ma')
+
+
+# ==================== Latest Bar ====================
+
+# Plain-float snapshot of the last row, so callers read attributes instead of
+# going through pandas indexing for every value
+LatestBar = namedtuple('LatestBar', ['close', 'ema_short', 'ema_long', 'rsi', 'atr', 'adx',
+                                     'plus_di', 'minus_di', 'volume', 'volume_ma'])
+
+
+# ==================== Result Cache ====================
+
+# calculate_all_indicators results keyed by the exact input data
+_INDICATOR_CACHE_SIZE = 4
+_indicator_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_indicator_cache_lock = threading.Lock()
+
+
+def _indicator_cache_key(df: pd.DataFrame, params: tuple) -> Optional[tuple]:
+    """
+    Cache key for a frame: parameters, shape, index bounds and raw column bytes
+    
+    Keyed on the full data rather than just the last timestamp, so an updated
+    forming candle is never served from the cache. Returns None (no caching)
+    for empty frames or non-numeric columns.
+    """
+    if len(df) == 0:
+        return None
+    chunks = []
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if values.dtype.kind not in 'fiub':
+            return None
+        chunks.append(np.ascontiguousarray(values).tobytes())
+    return (params, tuple(df.columns), len(df), df.index[0], df.index[-1], b''.join(chunks))
+
 
 class Indicators:
     """Technical indicators calculator"""
@@ -23,6 +286,12 @@ class Indicators:
         Returns:
             EMA series
         """
+        if _BACKEND == 'talib':
+            return pd.Series(talib.EMA(data.to_numpy(np.float64), timeperiod=period), index=data.index)
+        if _BACKEND == 'numba':
+            values = np.ascontiguousarray(data.to_numpy(np.float64))
+            return pd.Series(_ewm(values, 2.0 / (period + 1)), index=data.index)
+        
         return data.ewm(span=period, adjust=False).mean()
     
     @staticmethod
@@ -42,7 +311,7 @@ class Indicators:
     @staticmethod
     def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
         """
-        Calculate Relative Strength Index
+        Calculate Relative Strength Index (Wilder smoothing)
         
         Args:
             data: Price data series
@@ -51,16 +320,18 @@ class Indicators:
         Returns:
             RSI series
         """
-        # Calculate price changes
-        delta = data.diff()
+        if _BACKEND == 'talib':
+            return pd.Series(talib.RSI(data.to_numpy(np.float64), timeperiod=period), index=data.index)
+        if _BACKEND == 'numba':
+            values = np.ascontiguousarray(data.to_numpy(np.float64))
+            return pd.Series(_rsi_kernel(values, period), index=data.index)
         
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        # Separate gains and losses of the bar-to-bar price changes
+        gain, loss = Indicators.gains_losses(data)
         
-        # Calculate average gain and loss
-        avg_gain = gain.ewm(span=period, adjust=False).mean()
-        avg_loss = loss.ewm(span=period, adjust=False).mean()
+        # Calculate average gain and loss (Wilder: alpha = 1/period)
+        avg_gain = gain.ewm(alpha=1 / period, adjust=False).mean()
+        avg_loss = loss.ewm(alpha=1 / period, adjust=False).mean()
         
         # Calculate RS and RSI
         rs = avg_gain / avg_loss
@@ -68,6 +339,67 @@ class Indicators:
         
         return rsi
     
+    @staticmethod
+    def gains_losses(data: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Split bar-to-bar price changes into gains and losses
+        
+        Args:
+            data: Price data series
+            
+        Returns:
+            Tuple of (gain, loss) series, both non-negative (first bar is 0)
+        """
+        delta = np.diff(data.to_numpy(np.float64), prepend=np.nan)
+        gain = np.where(delta > 0.0, delta, 0.0)
+        loss = np.where(delta < 0.0, -delta, 0.0)
+        return pd.Series(gain, index=data.index), pd.Series(loss, index=data.index)
+    
+    @staticmethod
+    def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+        """
+        Calculate True Range with elementwise ufuncs (no temporary DataFrame)
+        
+        Args:
+            high: High price series
+            low: Low price series
+            close: Close price series
+            
+        Returns:
+            True Range series (first bar is high - low)
+        """
+        h = high.to_numpy(np.float64)
+        l = low.to_numpy(np.float64)
+        prev_close = np.empty_like(h)
+        prev_close[:1] = np.nan
+        prev_close[1:] = close.to_numpy(np.float64)[:-1]
+        
+        # fmax skips NaN like DataFrame.max(axis=1), so bar 0 falls back to high - low
+        tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+        return pd.Series(tr, index=high.index)
+    
+    @staticmethod
+    def directional_movement(high: pd.Series, low: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        Calculate +DM and -DM with branchless numpy masks
+        
+        Args:
+            high: High price series
+            low: Low price series
+            
+        Returns:
+            Tuple of (+DM, -DM) series (first bar is 0)
+        """
+        h = high.to_numpy(np.float64)
+        l = low.to_numpy(np.float64)
+        up = np.diff(h, prepend=np.nan)
+        down = -np.diff(l, prepend=np.nan)
+        
+        # NaN on the first bar fails both comparisons, so it blends to 0
+        plus_dm = np.where((up > down) & (up > 0.0), up, 0.0)
+        minus_dm = np.where((down > up) & (down > 0.0), down, 0.0)
+        return pd.Series(plus_dm, index=high.index), pd.Series(minus_dm, index=high.index)
+    
     @staticmethod
     def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
         """
@@ -82,21 +414,22 @@ class Indicators:
         Returns:
             ATR series
         """
-        # Calculate True Range components
-        high_low = high - low
-        high_close = (high - close.shift()).abs()
-        low_close = (low - close.shift()).abs()
+        if _BACKEND == 'talib':
+            atr = talib.ATR(high.to_numpy(np.float64), low.to_numpy(np.float64),
+                            close.to_numpy(np.float64), timeperiod=period)
+            return pd.Series(atr, index=high.index)
         
-        # True Range is the maximum of the three
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+        # True Range is the maximum of high-low, |high-prev close|, |low-prev close|
+        true_range = Indicators.true_range(high, low, close)
         
         # Calculate ATR as moving average of True Range
-        atr = true_range.ewm(span=period, adjust=False).mean()
+        atr = Indicators.calculate_ema(true_range, period)
         
         return atr
     
     @staticmethod
-    def calculate_adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    def calculate_adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14,
+                      atr: Optional[pd.Series] = None) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """
         Calculate Average Directional Index (ADX), +DI, -DI
         
@@ -105,29 +438,35 @@ class Indicators:
             low: Low price series
             close: Close price series
             period: ADX period (default 14)
+            atr: Precomputed ATR for the same period (computed here if None)
             
         Returns:
             Tuple of (ADX, +DI, -DI) series
         """
-        # Calculate +DM and -DM
-        high_diff = high.diff()
-        low_diff = -low.diff()
+        if _BACKEND == 'talib':
+            h = high.to_numpy(np.float64)
+            l = low.to_numpy(np.float64)
+            c = close.to_numpy(np.float64)
+            return (pd.Series(talib.ADX(h, l, c, timeperiod=period), index=high.index),
+                    pd.Series(talib.PLUS_DI(h, l, c, timeperiod=period), index=high.index),
+                    pd.Series(talib.MINUS_DI(h, l, c, timeperiod=period), index=high.index))
         
-        plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
-        minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
+        # Calculate +DM and -DM
+        plus_dm, minus_dm = Indicators.directional_movement(high, low)
         
-        # Calculate ATR
-        atr = Indicators.calculate_atr(high, low, close, period)
+        # Calculate ATR unless the caller already has it
+        if atr is None:
+            atr = Indicators.calculate_atr(high, low, close, period)
         
         # Calculate +DI and -DI
-        plus_di = 100 * (plus_dm.ewm(span=period, adjust=False).mean() / atr)
-        minus_di = 100 * (minus_dm.ewm(span=period, adjust=False).mean() / atr)
+        plus_di = 100 * (Indicators.calculate_ema(plus_dm, period) / atr)
+        minus_di = 100 * (Indicators.calculate_ema(minus_dm, period) / atr)
         
         # Calculate DX
         dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di)
         
         # Calculate ADX
-        adx = dx.ewm(span=period, adjust=False).mean()
+        adx = Indicators.calculate_ema(dx, period)
         
         return adx, plus_di, minus_di
     
@@ -151,59 +490,62 @@ class Indicators:
         Check for EMA crossover (bullish or bearish)
         
         Args:
-            ema_short: Short EMA series
-            ema_long: Long EMA series
+            ema_short: Short EMA series (or ndarray)
+            ema_long: Long EMA series (or ndarray)
             lookback: How many candles back to check (default 2)
             
         Returns:
             Tuple of (bullish_crossover, bearish_crossover)
         """
-        if len(ema_short) < lookback + 1 or len(ema_long) < lookback + 1:
+        short = np.asarray(ema_short, dtype=np.float64)
+        long = np.asarray(ema_long, dtype=np.float64)
+        if short.shape[0] < lookback + 1 or long.shape[0] < lookback + 1:
             return False, False
         
-        # Current: short > long
-        current_bullish = ema_short.iloc[-1] > ema_long.iloc[-1]
-        # Previous: short < long
-        previous_bearish = ema_short.iloc[-lookback] < ema_long.iloc[-lookback]
-        
-        bullish_crossover = current_bullish and previous_bearish
-        
-        # Current: short < long
-        current_bearish = ema_short.iloc[-1] < ema_long.iloc[-1]
-        # Previous: short > long
-        previous_bullish = ema_short.iloc[-lookback] > ema_long.iloc[-lookback]
+        return Indicators.ema_crossover_values(short[-1], long[-1], short[-lookback], long[-lookback])
+    
+    @staticmethod
+    def ema_crossover_values(short_now: float, long_now: float,
+                             short_prev: float, long_prev: float) -> Tuple[bool, bool]:
+        """
+        Check for EMA crossover from plain floats (e.g. two LatestBar snapshots)
         
-        bearish_crossover = current_bearish and previous_bullish
+        Args:
+            short_now: Current short EMA
+            long_now: Current long EMA
+            short_prev: Short EMA at the lookback candle
+            long_prev: Long EMA at the lookback candle
+            
+        Returns:
+            Tuple of (bullish_crossover, bearish_crossover)
+        """
+        # Bullish: short was below long and is now above; bearish is the mirror
+        bullish_crossover = short_now > long_now and short_prev < long_prev
+        bearish_crossover = short_now < long_now and short_prev > long_prev
         
-        return bullish_crossover, bearish_crossover
+        return bool(bullish_crossover), bool(bearish_crossover)
     
     @staticmethod
-    def is_trend_aligned(close: pd.Series, ema_short: pd.Series, ema_long: pd.Series, trend: str = "bullish") -> bool:
+    def is_trend_aligned(bar: LatestBar, trend: str = "bullish") -> bool:
         """
         Check if price and EMAs are aligned with trend
         
         Args:
-            close: Close price series
-            ema_short: Short EMA series
-            ema_long: Long EMA series
+            bar: Latest bar snapshot (see latest_bar)
             trend: "bullish" or "bearish"
             
         Returns:
             True if aligned, False otherwise
         """
-        if len(close) == 0 or len(ema_short) == 0 or len(ema_long) == 0:
+        if bar is None:
             return False
         
-        current_price = close.iloc[-1]
-        current_short = ema_short.iloc[-1]
-        current_long = ema_long.iloc[-1]
-        
         if trend == "bullish":
             # Price > Short EMA > Long EMA
-            return current_price > current_short and current_short > current_long
+            return bar.close > bar.ema_short and bar.ema_short > bar.ema_long
         elif trend == "bearish":
             # Price < Short EMA < Long EMA
-            return current_price < current_short and current_short < current_long
+            return bar.close < bar.ema_short and bar.ema_short < bar.ema_long
         
         return False
     
@@ -226,6 +568,51 @@ class Indicators:
         Returns:
             DataFrame with all indicators added
         """
+        # Repeated calls on identical data (e.g. status polls between candle
+        # closes) return a copy of the memoized result
+        params = (ema_short, ema_long, rsi_period, atr_period, adx_period, volume_ma_period)
+        key = _indicator_cache_key(df, params)
+        if key is not None:
+            with _indicator_cache_lock:
+                cached = _indicator_cache.get(key)
+                if cached is not None:
+                    _indicator_cache.move_to_end(key)
+                    return cached.copy()
+        
+        result = Indicators._calculate_all_indicators(df, *params)
+        
+        if key is not None:
+            with _indicator_cache_lock:
+                _indicator_cache[key] = result.copy()
+                while len(_indicator_cache) > _INDICATOR_CACHE_SIZE:
+                    _indicator_cache.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def clear_cache():
+        """Drop memoized calculate_all_indicators results"""
+        with _indicator_cache_lock:
+            _indicator_cache.clear()
+    
+    @staticmethod
+    def _calculate_all_indicators(df: pd.DataFrame, ema_short: int, ema_long: int, rsi_period: int,
+                                  atr_period: int, adx_period: int, volume_ma_period: int) -> pd.DataFrame:
+        """Uncached implementation of calculate_all_indicators"""
+        if _BACKEND == 'numba':
+            has_volume = 'volume' in df.columns
+            volume = df['volume'].to_numpy(np.float64) if has_volume else np.empty(0)
+            arrays = _indicator_kernel(
+                np.ascontiguousarray(df['high'].to_numpy(np.float64)),
+                np.ascontiguousarray(df['low'].to_numpy(np.float64)),
+                np.ascontiguousarray(df['close'].to_numpy(np.float64)),
+                np.ascontiguousarray(volume),
+                ema_short, ema_long, rsi_period, atr_period, adx_period, volume_ma_period
+            )
+            columns = _KERNEL_COLUMNS if has_volume else _KERNEL_COLUMNS[:-1]
+            # assign() returns a new frame, so the input is left untouched
+            return df.assign(**dict(zip(columns, arrays)))
+        
         df = df.copy()
         
         # Calculate EMAs
@@ -239,7 +626,9 @@ class Indicators:
         df['atr'] = Indicators.calculate_atr(df['high'], df['low'], df['close'], atr_period)
         
         # Calculate ADX, +DI, -DI
-        adx, plus_di, minus_di = Indicators.calculate_adx(df['high'], df['low'], df['close'], adx_period)
+        # Reuse the ATR column when ADX smooths over the same period
+        atr = df['atr'] if adx_period == atr_period else None
+        adx, plus_di, minus_di = Indicators.calculate_adx(df['high'], df['low'], df['close'], adx_period, atr)
         df['adx'] = adx
         df['plus_di'] = plus_di
         df['minus_di'] = minus_di
@@ -250,6 +639,220 @@ class Indicators:
         
         return df
     
+    # ==================== Incremental Updates ====================
+    
+    @staticmethod
+    def get_indicator_state(df: pd.DataFrame, row: int = -1, rsi_period: int = 14,
+                            atr_period: int = 14, adx_period: int = 14,
+                            volume_ma_period: int = 20) -> Optional[dict]:
+        """
+        Capture the smoothed values needed to extend indicators past one bar
+        
+        Args:
+            df: DataFrame with OHLCV data and indicators from calculate_all_indicators
+            row: Position of the bar the state is taken after (default last)
+            rsi_period: RSI period
+            atr_period: ATR period
+            adx_period: ADX period
+            volume_ma_period: Volume MA period
+            
+        Returns:
+            State dict for update_last, or None if the state is not usable yet
+            (always None with the TA-Lib backend)
+        """
+        # update_last steps our span-EMA/Wilder recurrences; TA-Lib columns use
+        # different smoothing and seeding, so callers fall back to a full recompute
+        if _BACKEND == 'talib':
+            return None
+        
+        end = len(df) + row + 1 if row < 0 else row + 1
+        if end < 1 or end > len(df):
+            return None
+        
+        part = df.iloc[:end]
+        high, low, close = part['high'], part['low'], part['close']
+        
+        # Smoothed components that calculate_all_indicators does not keep as columns
+        gain, loss = Indicators.gains_losses(close)
+        avg_gain = gain.ewm(alpha=1 / rsi_period, adjust=False).mean().iat[-1]
+        avg_loss = loss.ewm(alpha=1 / rsi_period, adjust=False).mean().iat[-1]
+        
+        true_range = Indicators.true_range(high, low, close)
+        plus_dm, minus_dm = Indicators.directional_movement(high, low)
+        
+        state = {
+            'high': float(high.iat[-1]),
+            'low': float(low.iat[-1]),
+            'close': float(close.iat[-1]),
+            'ema_short': float(part['ema_short'].iat[-1]),
+            'ema_long': float(part['ema_long'].iat[-1]),
+            'avg_gain': float(avg_gain),
+            'avg_loss': float(avg_loss),
+            'atr': float(part['atr'].iat[-1]),
+            'adx_atr': float(true_range.ewm(span=adx_period, adjust=False).mean().iat[-1]),
+            'avg_plus_dm': float(plus_dm.ewm(span=adx_period, adjust=False).mean().iat[-1]),
+            'avg_minus_dm': float(minus_dm.ewm(span=adx_period, adjust=False).mean().iat[-1]),
+            'adx': float(part['adx'].iat[-1])
+        }
+        if any(np.isnan(v) for v in state.values()):
+            return None
+        
+        if 'volume' in part.columns and volume_ma_period > 1:
+            state['volumes'] = tuple(part['volume'].iloc[-(volume_ma_period - 1):].tolist())
+        elif 'volume' in part.columns:
+            state['volumes'] = ()
+        else:
+            state['volumes'] = None
+        
+        return state
+    
+    @staticmethod
+    def update_last(state: dict, high: float, low: float, close: float, volume: float = 0.0,
+                    ema_short: int = 9, ema_long: int = 21, rsi_period: int = 14,
+                    atr_period: int = 14, adx_period: int = 14,
+                    volume_ma_period: int = 20) -> Tuple[dict, dict]:
+        """
+        Extend indicators by one bar in O(1) from a previous state
+        
+        Uses the same recurrences as calculate_all_indicators, so the values
+        match a full recompute over the same history.
+        
+        Args:
+            state: State after the previous bar (get_indicator_state or a prior update_last)
+            high: Bar high
+            low: Bar low
+            close: Bar close
+            volume: Bar volume
+            ema_short: Short EMA period
+            ema_long: Long EMA period
+            rsi_period: RSI period
+            atr_period: ATR period
+            adx_period: ADX period
+            volume_ma_period: Volume MA period
+            
+        Returns:
+            Tuple of (state after this bar, indicator values for this bar)
+        """
+        prev_close = state['close']
+        delta = close - prev_close
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        up = high - state['high']
+        down = state['low'] - low
+        plus_dm = up if up > down and up > 0 else 0.0
+        minus_dm = down if down > up and down > 0 else 0.0
+        
+        a_short = 2.0 / (ema_short + 1)
+        a_long = 2.0 / (ema_long + 1)
+        a_rsi = 1.0 / rsi_period  # Wilder
+        a_atr = 2.0 / (atr_period + 1)
+        a_adx = 2.0 / (adx_period + 1)
+        
+        avg_gain = (1 - a_rsi) * state['avg_gain'] + a_rsi * max(delta, 0.0)
+        avg_loss = (1 - a_rsi) * state['avg_loss'] + a_rsi * max(-delta, 0.0)
+        adx_atr = (1 - a_adx) * state['adx_atr'] + a_adx * true_range
+        avg_plus_dm = (1 - a_adx) * state['avg_plus_dm'] + a_adx * plus_dm
+        avg_minus_dm = (1 - a_adx) * state['avg_minus_dm'] + a_adx * minus_dm
+        
+        plus_di = 100.0 * _div(avg_plus_dm, adx_atr)
+        minus_di = 100.0 * _div(avg_minus_dm, adx_atr)
+        dx = 100.0 * _div(abs(plus_di - minus_di), plus_di + minus_di)
+        
+        new_state = {
+            'high': high,
+            'low': low,
+            'close': close,
+            'ema_short': (1 - a_short) * state['ema_short'] + a_short * close,
+            'ema_long': (1 - a_long) * state['ema_long'] + a_long * close,
+            'avg_gain': avg_gain,
+            'avg_loss': avg_loss,
+            'atr': (1 - a_atr) * state['atr'] + a_atr * true_range,
+            'adx_atr': adx_atr,
+            'avg_plus_dm': avg_plus_dm,
+            'avg_minus_dm': avg_minus_dm,
+            # NaN DX leaves ADX unchanged, as ewm does
+            'adx': state['adx'] if dx != dx else (1 - a_adx) * state['adx'] + a_adx * dx,
+            'volumes': None
+        }
+        
+        values = {
+            'ema_short': new_state['ema_short'],
+            'ema_long': new_state['ema_long'],
+            'rsi': 100.0 - 100.0 / (1.0 + _div(avg_gain, avg_loss)),
+            'atr': new_state['atr'],
+            'adx': new_state['adx'],
+            'plus_di': plus_di,
+            'minus_di': minus_di
+        }
+        
+        if state['volumes'] is not None:
+            window = state['volumes'] + (volume,)
+            values['volume_ma'] = sum(window) / volume_ma_period if len(window) >= volume_ma_period else np.nan
+            new_state['volumes'] = window[-(volume_ma_period - 1):] if volume_ma_period > 1 else ()
+        
+        return new_state, values
+    
+    @staticmethod
+    def update_frame(df: pd.DataFrame, state: dict, bars, ema_short: int = 9, ema_long: int = 21,
+                     rsi_period: int = 14, atr_period: int = 14, adx_period: int = 14,
+                     volume_ma_period: int = 20) -> Tuple[pd.DataFrame, dict]:
+        """
+        Apply the newest bars to an indicator frame with update_last
+        
+        Args:
+            df: DataFrame from calculate_all_indicators (with a timestamp column)
+            state: State after the bar preceding df's last row
+            bars: Rows of (timestamp, open, high, low, close, volume). The first
+                  row refreshes df's last bar; each further row is the next bar
+                  and rolls the window forward by one.
+            ema_short: Short EMA period
+            ema_long: Long EMA period
+            rsi_period: RSI period
+            atr_period: ATR period
+            adx_period: ADX period
+            volume_ma_period: Volume MA period
+            
+        Returns:
+            Tuple of (updated DataFrame, state after the bar preceding the new last row)
+        """
+        periods = (ema_short, ema_long, rsi_period, atr_period, adx_period, volume_ma_period)
+        
+        for i, (ts, open_, high, low, close, volume) in enumerate(bars):
+            new_state, values = Indicators.update_last(state, high, low, close, volume, *periods)
+            values.update(timestamp=int(ts), open=open_, high=high, low=low, close=close, volume=volume)
+            
+            if i == 0:
+                # Same bar as the cached last row: overwrite it
+                last_idx = df.index[-1]
+                for col, value in values.items():
+                    if col in df.columns:
+                        df.at[last_idx, col] = value
+            else:
+                # New bar: roll the window forward by one
+                df = pd.concat([df.iloc[1:], pd.DataFrame([values])], ignore_index=True)
+            
+            if i < len(bars) - 1:
+                state = new_state  # this bar has closed
+        
+        return df, state
+    
+    @staticmethod
+    def latest_bar(df: pd.DataFrame) -> Optional[LatestBar]:
+        """
+        Snapshot the last row as plain floats
+        
+        Args:
+            df: DataFrame with indicators
+            
+        Returns:
+            LatestBar (missing columns read as 0), or None if df is empty
+        """
+        if len(df) == 0:
+            return None
+        
+        positions = df.columns.get_indexer(LatestBar._fields)
+        row = df.iloc[-1].to_numpy()
+        return LatestBar._make(float(row[i]) if i >= 0 else 0.0 for i in positions)
+    
     @staticmethod
     def get_latest_indicators(df: pd.DataFrame) -> dict:
         """
@@ -261,22 +864,11 @@ class Indicators:
         Returns:
             Dictionary with latest indicator values
         """
-        if len(df) == 0:
+        bar = Indicators.latest_bar(df)
+        if bar is None:
             return {}
         
-        latest = df.iloc[-1]
-        indicators = {
-            'price': latest.get('close', 0),
-            'ema_short': latest.get('ema_short', 0),
-            'ema_long': latest.get('ema_long', 0),
-            'rsi': latest.get('rsi', 0),
-            'atr': latest.get('atr', 0),
-            'adx': latest.get('adx', 0),
-            'plus_di': latest.get('plus_di', 0),
-            'minus_di': latest.get('minus_di', 0),
-            'volume': latest.get('volume', 0),
-            'volume_ma': latest.get('volume_ma', 0)
-        }
+        indicators = dict(zip(('price',) + LatestBar._fields[1:], bar))
         
         return indicators
     
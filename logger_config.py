@@ -3,23 +3,253 @@ Logging Configuration
 Setup logging for trading bot activity and trade execution
 """
 
+import atexit
+import io
 import logging
+import operator
 import os
-from datetime import datetime
+import queue
+import sys
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import List
+
+_SEP = '=' * 60
+_PERF_KEYS = ('total_trades', 'wins', 'losses', 'win_rate', 'total_pnl',
+              'avg_win', 'avg_loss', 'best_trade', 'worst_trade', 'avg_rr')
+_PERF_DEFAULTS = dict.fromkeys(_PERF_KEYS, 0)
+_perf_values = operator.itemgetter(*_PERF_KEYS)
+_PERF_TMPL = (
+    "\n" + _SEP + "\n"
+    "PERFORMANCE SUMMARY\n"
+    + _SEP + "\n"
+    "Total Trades: %s\n"
+    "Wins: %s | Losses: %s\n"
+    "Win Rate: %.2f%%\n"
+    "Total PnL: %.4f\n"
+    "Average Win: %.4f\n"
+    "Average Loss: %.4f\n"
+    "Best Trade: %.4f\n"
+    "Worst Trade: %.4f\n"
+    "Average R:R: %.2f\n"
+    + _SEP
+)
+
+
+class _SinkQueueHandler(QueueHandler):
+    """QueueHandler that tags each record with the logger (sink) it was sent to"""
+    
+    def __init__(self, log_queue, sink: str):
+        super().__init__(log_queue)
+        self.sink = sink
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.sink = self.sink
+        return record
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter for the fixed file layout '%(asctime)s | %(levelname)-8s | %(message)s'
+    
+    The 'YYYY-MM-DD HH:MM:' prefix is built with strftime once per minute
+    and the seconds come from integer math on record.created, so a burst of
+    records costs no strftime calls.
+    """
+    
+    def __init__(self):
+        super().__init__('%(asctime)s | %(levelname)-8s | %(message)s',
+                         datefmt='%Y-%m-%d %H:%M:%S')
+        self._minute = None
+        self._minute_prefix = ''
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        seconds = int(record.created)
+        minute = seconds // 60
+        if minute != self._minute:
+            self._minute_prefix = time.strftime('%Y-%m-%d %H:%M:', self.converter(minute * 60))
+            self._minute = minute
+        return '%s%02d' % (self._minute_prefix, seconds % 60)
+    
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record)
+        s = '%s | %-8s | %s' % (record.asctime, record.levelname, record.message)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = s + '\n' + record.exc_text
+        if record.stack_info:
+            s = s + '\n' + self.formatStack(record.stack_info)
+        return s
+
+
+class BufferedFileHandler(logging.Handler):
+    """
+    File handler that batches writes in a 64 KiB buffer
+    
+    Records are written to the buffer and reach the file when it fills, every
+    `flush_interval` seconds, or immediately for ERROR and above.
+    
+    One shared flusher thread serves every open handler, so the periodic
+    flushes of all log files are issued together in a single pass.
+    """
+    
+    _open_handlers: "weakref.WeakSet[BufferedFileHandler]" = weakref.WeakSet()
+    _registry_lock = threading.Lock()
+    _flusher: "threading.Thread | None" = None
+    _FLUSH_TICK = 1.0  # seconds between flusher passes
+    
+    def __init__(self, filename, flush_interval: float = 30.0,
+                 buffer_size: int = 65536, encoding: str = 'utf-8', delay: bool = False):
+        """
+        Args:
+            filename: Log file path (opened for append)
+            flush_interval: Seconds between background flushes
+            buffer_size: Write buffer size in bytes
+            encoding: Text encoding of the log file
+            delay: Defer opening the file until the first record is written
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._buf = None if delay else self._open()
+        self._closed = False
+        self._dirty = False  # buffered bytes not yet flushed
+        self._next_flush = time.monotonic() + flush_interval
+        
+        cls = BufferedFileHandler
+        with cls._registry_lock:
+            cls._open_handlers.add(self)
+            if cls._flusher is None:
+                cls._flusher = threading.Thread(target=cls._flush_loop, name="log-flush", daemon=True)
+                cls._flusher.start()
+    
+    def _open(self) -> io.BufferedWriter:
+        return io.BufferedWriter(open(self.baseFilename, 'ab', buffering=0), self.buffer_size)
+    
+    def emit(self, record: logging.LogRecord):
+        # Handler.handle already holds self.lock here
+        try:
+            if self._buf is None:
+                self._buf = self._open()
+            self._buf.write((self.format(record) + '\n').encode(self.encoding))
+            self._dirty = True
+            if record.levelno >= logging.ERROR:
+                self._flush_locked()
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_locked(self):
+        """Flush with self.lock held"""
+        if self._buf is not None and not self._closed:
+            self._buf.flush()
+        self._dirty = False
+        self._next_flush = time.monotonic() + self.flush_interval
+    
+    def flush(self):
+        self.acquire()
+        try:
+            self._flush_locked()
+        finally:
+            self.release()
+    
+    @classmethod
+    def _flush_loop(cls):
+        """Shared flusher: flush every handler whose interval has elapsed"""
+        while True:
+            time.sleep(cls._FLUSH_TICK)
+            now = time.monotonic()
+            with cls._registry_lock:
+                handlers = list(cls._open_handlers)
+            for handler in handlers:
+                if handler._dirty and now >= handler._next_flush:
+                    handler.flush()
+    
+    def close(self):
+        with BufferedFileHandler._registry_lock:
+            BufferedFileHandler._open_handlers.discard(self)
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                if self._buf is not None:
+                    self._buf.close()  # flushes what is left
+        finally:
+            self.release()
+        super().close()
+
+
+class DailyBufferedFileHandler(BufferedFileHandler):
+    """
+    BufferedFileHandler writing to '<prefix>_YYYYMMDD.log' and switching to a
+    new file at local midnight
+    
+    Files from earlier days are left in place.
+    """
+    
+    def __init__(self, log_dir, file_prefix: str, day: str = None, **kwargs):
+        """
+        Args:
+            log_dir: Directory for log files
+            file_prefix: Prefix for log file names
+            day: Current day as YYYYMMDD (defaults to today)
+            **kwargs: Passed to BufferedFileHandler
+        """
+        self.log_dir = Path(log_dir)
+        self.file_prefix = file_prefix
+        day = day or datetime.now().strftime('%Y%m%d')
+        super().__init__(self._path_for(day), **kwargs)
+        self._rollover_at = self._next_midnight(day)
+    
+    def _path_for(self, day: str) -> Path:
+        return self.log_dir / f"{self.file_prefix}_{day}.log"
+    
+    @staticmethod
+    def _next_midnight(day: str) -> float:
+        return (datetime.strptime(day, '%Y%m%d') + timedelta(days=1)).timestamp()
+    
+    def emit(self, record: logging.LogRecord):
+        if record.created >= self._rollover_at:
+            try:
+                self._rollover(record.created)
+            except Exception:
+                self.handleError(record)
+                return
+        super().emit(record)
+    
+    def _rollover(self, now: float):
+        """Close today's file and start the file for the day of `now`"""
+        if self._buf is not None:
+            self._buf.close()
+            self._buf = None
+        day = datetime.fromtimestamp(now).strftime('%Y%m%d')
+        self.baseFilename = os.path.abspath(self._path_for(day))
+        self._rollover_at = self._next_midnight(day)
 
 
 class BotLogger:
     """Trading bot logger with separate files for trades and errors"""
     
-    def __init__(self, log_dir: str = "logs", log_level: str = "INFO"):
+    def __init__(self, log_dir: str = "logs", log_level: str = "INFO", console: bool = None):
         """
         Initialize logger
         
         Args:
             log_dir: Directory for log files
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            console: Echo all records to the console (default: BOT_LOG_CONSOLE=1)
         """
+        if console is None:
+            console = os.environ.get("BOT_LOG_CONSOLE", "0") == "1"
+        self.console = console
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         
@@ -32,16 +262,63 @@ class BotLogger:
             "CRITICAL": logging.CRITICAL
         }
         self.log_level = level_map.get(log_level.upper(), logging.INFO)
+        self._refresh_level_cache()
+        self._today = datetime.now().strftime('%Y%m%d')
+        
+        # Log calls only enqueue the record; one background listener owns the
+        # file/console handlers, so the trading thread never blocks on I/O
+        self._queue = queue.SimpleQueue()
+        self._handlers: List[logging.Handler] = []
+        self._listener = None
+        
+        # Formatters and the console handler are shared by all loggers
+        self._file_fmt = FastFormatter()
+        self._console_fmt = logging.Formatter(
+            '%(asctime)s | %(levelname)-8s | %(message)s',
+            datefmt='%H:%M:%S'
+        )
+        self._console_handler = logging.StreamHandler()
+        self._console_handler.setLevel(self.log_level)
+        self._console_handler.setFormatter(self._console_fmt)
+        self._error_console = None
         
         # Create loggers
         self.trade_logger = self._setup_logger("trade", "trading")
         self.error_logger = self._setup_logger("error", "errors")
         self.bot_logger = self._setup_logger("bot", "bot")
         self.strategy_logger = self._setup_logger("strategy", "strategy")
+        
+        if self._handlers:
+            if self.console:
+                # One console handler serves every logger, so it needs no sink filter
+                self._handlers.append(self._console_handler)
+            else:
+                # Headless: only errors still reach stderr
+                self._error_console = logging.StreamHandler(sys.stderr)
+                self._error_console.setLevel(logging.ERROR)
+                self._error_console.setFormatter(self._console_fmt)
+                self._error_console.addFilter(lambda record: getattr(record, 'sink', None) == "error")
+                self._handlers.append(self._error_console)
+            self._listener = QueueListener(self._queue, *self._handlers, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self.stop)
+        
+        # API client libraries log through the standard logging module and
+        # stay silent by default; route their warnings into the error log
+        for api_name in ("bitmart_api", "gate_api"):
+            api_logger = logging.getLogger(api_name)
+            for handler in self.error_logger.handlers:
+                if handler not in api_logger.handlers:
+                    api_logger.addHandler(handler)
+            api_logger.propagate = False
     
     def _setup_logger(self, name: str, file_prefix: str) -> logging.Logger:
         """
-        Setup individual logger with file and console handlers
+        Setup individual logger with its own file handler
+        
+        The logger itself only gets a queue handler; its file handler is
+        served by the listener and only accepts records sent to this logger.
+        Console output goes through the shared console handler.
         
         Args:
             name: Logger name
@@ -57,143 +334,153 @@ class BotLogger:
         if logger.handlers:
             return logger
         
-        # Create formatters
-        file_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
-        console_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        
         # File handler
-        log_file = self.log_dir / f"{file_prefix}_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Dated file that rolls over at midnight; opened on the first record
+        file_handler = DailyBufferedFileHandler(self.log_dir, file_prefix, day=self._today,
+                                                encoding='utf-8', delay=True)
         file_handler.setLevel(self.log_level)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(self._file_fmt)
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(self.log_level)
-        console_handler.setFormatter(console_formatter)
+        # Route queued records back to this logger's file only
+        file_handler.addFilter(lambda record: getattr(record, 'sink', None) == name)
+        self._handlers.append(file_handler)
         
-        # Add handlers
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(_SinkQueueHandler(self._queue, name))
+        logger.propagate = False
         
         return logger
     
+    def _refresh_level_cache(self):
+        """Cache level checks used to skip per-tick debug calls entirely"""
+        self._debug_enabled = self.log_level <= logging.DEBUG
+        self._info_enabled = self.log_level <= logging.INFO
+    
+    def set_level(self, log_level: str):
+        """
+        Change the level of all bot loggers and their handlers
+        
+        Args:
+            log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        """
+        self.log_level = logging.getLevelName(log_level.upper())
+        if not isinstance(self.log_level, int):
+            self.log_level = logging.INFO
+        for logger in (self.trade_logger, self.error_logger, self.bot_logger, self.strategy_logger):
+            logger.setLevel(self.log_level)
+        for handler in self._handlers:
+            if handler is not self._error_console:
+                handler.setLevel(self.log_level)
+        self._refresh_level_cache()
+    
+    def stop(self):
+        """Write out queued records and stop the background listener"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
     # ==================== Trade Logging ====================
     
     def log_trade_entry(self, symbol: str, side: str, entry_price: float, 
                        size: float, stop_loss: float, take_profits: dict):
         """Log trade entry"""
-        msg = (
-            f"ENTRY | {symbol} | {side.upper()} | "
-            f"Price: {entry_price:.4f} | Size: {size:.6f} | "
-            f"SL: {stop_loss:.4f} | TP1: {take_profits.get('tp1', 0):.4f} | "
-            f"TP2: {take_profits.get('tp2', 0):.4f}"
+        # %-style args: formatting is deferred until a handler emits the record
+        self.trade_logger.info(
+            "ENTRY | %s | %s | Price: %.4f | Size: %.6f | SL: %.4f | TP1: %.4f | TP2: %.4f",
+            symbol, side.upper(), entry_price, size, stop_loss,
+            take_profits.get('tp1', 0), take_profits.get('tp2', 0)
         )
-        self.trade_logger.info(msg)
     
     def log_trade_exit(self, symbol: str, side: str, exit_price: float, 
                       size: float, pnl: float, reason: str):
         """Log trade exit"""
-        pnl_sign = "+" if pnl >= 0 else ""
-        msg = (
-            f"EXIT | {symbol} | {side.upper()} | "
-            f"Price: {exit_price:.4f} | Size: {size:.6f} | "
-            f"PnL: {pnl_sign}{pnl:.4f} | Reason: {reason}"
+        self.trade_logger.info(
+            "EXIT | %s | %s | Price: %.4f | Size: %.6f | PnL: %+.4f | Reason: %s",
+            symbol, side.upper(), exit_price, size, pnl, reason
         )
-        self.trade_logger.info(msg)
     
     def log_partial_exit(self, symbol: str, side: str, exit_price: float, 
                         size: float, reason: str):
         """Log partial position exit"""
-        msg = (
-            f"PARTIAL EXIT | {symbol} | {side.upper()} | "
-            f"Price: {exit_price:.4f} | Size: {size:.6f} | Reason: {reason}"
+        self.trade_logger.info(
+            "PARTIAL EXIT | %s | %s | Price: %.4f | Size: %.6f | Reason: %s",
+            symbol, side.upper(), exit_price, size, reason
         )
-        self.trade_logger.info(msg)
     
     def log_stop_loss_update(self, symbol: str, old_sl: float, new_sl: float, reason: str):
         """Log stop loss update"""
-        msg = (
-            f"SL UPDATE | {symbol} | "
-            f"Old: {old_sl:.4f} -> New: {new_sl:.4f} | Reason: {reason}"
+        self.trade_logger.info(
+            "SL UPDATE | %s | Old: %.4f -> New: %.4f | Reason: %s",
+            symbol, old_sl, new_sl, reason
         )
-        self.trade_logger.info(msg)
     
     def log_signal(self, symbol: str, signal_type: str, details: dict):
         """Log trading signal"""
-        msg = f"SIGNAL | {symbol} | {signal_type} | {details}"
-        self.trade_logger.info(msg)
+        # The details dict repr is only built if the record is emitted
+        self.trade_logger.info("SIGNAL | %s | %s | %s", symbol, signal_type, details)
     
     # ==================== Bot Activity Logging ====================
     
     def log_bot_start(self, config: dict):
         """Log bot startup"""
-        msg = f"Bot started with config: {config}"
-        self.bot_logger.info(msg)
+        self.bot_logger.info("Bot started with config: %s", config)
     
     def log_bot_stop(self, reason: str = "User requested"):
         """Log bot shutdown"""
-        msg = f"Bot stopped: {reason}"
-        self.bot_logger.info(msg)
+        self.bot_logger.info("Bot stopped: %s", reason)
     
     def log_api_call(self, endpoint: str, status: str):
         """Log API call"""
-        msg = f"API | {endpoint} | Status: {status}"
-        self.bot_logger.debug(msg)
+        if not self._debug_enabled:
+            return
+        self.bot_logger.debug("API | %s | Status: %s", endpoint, status)
     
     def log_market_data_update(self, symbol: str, price: float, indicators: dict):
         """Log market data update"""
-        msg = (
-            f"MARKET | {symbol} | Price: {price:.4f} | "
-            f"RSI: {indicators.get('rsi', 0):.1f} | "
-            f"ADX: {indicators.get('adx', 0):.1f}"
+        # Called every tick: skip the call (and the dict lookups) unless DEBUG is on
+        if not self._debug_enabled:
+            return
+        self.bot_logger.debug(
+            "MARKET | %s | Price: %.4f | RSI: %.1f | ADX: %.1f",
+            symbol, price, indicators.get('rsi', 0), indicators.get('adx', 0)
         )
-        self.bot_logger.debug(msg)
     
     def log_balance_update(self, asset: str, available: float, frozen: float):
         """Log balance update"""
-        msg = f"BALANCE | {asset} | Available: {available:.4f} | Frozen: {frozen:.4f}"
-        self.bot_logger.info(msg)
+        self.bot_logger.info("BALANCE | %s | Available: %.4f | Frozen: %.4f", asset, available, frozen)
     
     # ==================== Error Logging ====================
     
     def log_error(self, error_type: str, message: str, details: str = ""):
         """Log error"""
-        msg = f"{error_type} | {message}"
         if details:
-            msg += f" | Details: {details}"
-        self.error_logger.error(msg)
+            self.error_logger.error("%s | %s | Details: %s", error_type, message, details)
+        else:
+            self.error_logger.error("%s | %s", error_type, message)
     
     def log_api_error(self, endpoint: str, error: Exception):
         """Log API error"""
-        msg = f"API ERROR | {endpoint} | {str(error)}"
-        self.error_logger.error(msg)
+        self.error_logger.error("API ERROR | %s | %s", endpoint, error)
     
     def log_order_error(self, symbol: str, side: str, error: Exception):
         """Log order placement error"""
-        msg = f"ORDER ERROR | {symbol} | {side} | {str(error)}"
-        self.error_logger.error(msg)
+        self.error_logger.error("ORDER ERROR | %s | %s | %s", symbol, side, error)
     
     def log_exception(self, exception: Exception, context: str = ""):
         """Log exception with traceback"""
-        msg = f"EXCEPTION | {context} | {str(exception)}"
-        self.error_logger.exception(msg)
+        self.error_logger.exception("EXCEPTION | %s | %s", context, exception)
     
     # ==================== Info Logging ====================
     
     def info(self, message: str):
         """Log info message"""
+        if not self._info_enabled:
+            return
         self.bot_logger.info(message)
     
     def debug(self, message: str):
         """Log debug message"""
+        if not self._debug_enabled:
+            return
         self.bot_logger.debug(message)
     
     def warning(self, message: str):
@@ -208,46 +495,30 @@ class BotLogger:
     
     def log_performance_summary(self, stats: dict):
         """Log trading performance summary"""
-        msg = (
-            f"\n{'='*60}\n"
-            f"PERFORMANCE SUMMARY\n"
-            f"{'='*60}\n"
-            f"Total Trades: {stats.get('total_trades', 0)}\n"
-            f"Wins: {stats.get('wins', 0)} | Losses: {stats.get('losses', 0)}\n"
-            f"Win Rate: {stats.get('win_rate', 0):.2f}%\n"
-            f"Total PnL: {stats.get('total_pnl', 0):.4f}\n"
-            f"Average Win: {stats.get('avg_win', 0):.4f}\n"
-            f"Average Loss: {stats.get('avg_loss', 0):.4f}\n"
-            f"Best Trade: {stats.get('best_trade', 0):.4f}\n"
-            f"Worst Trade: {stats.get('worst_trade', 0):.4f}\n"
-            f"Average R:R: {stats.get('avg_rr', 0):.2f}\n"
-            f"{'='*60}"
-        )
-        self.trade_logger.info(msg)
+        # One C-level merge over the zero defaults, then all values in template order
+        self.trade_logger.info(_PERF_TMPL, *_perf_values({**_PERF_DEFAULTS, **stats}))
     
     def log_daily_summary(self, date: str, stats: dict):
         """Log daily trading summary"""
-        msg = (
-            f"\nDAILY SUMMARY - {date}\n"
-            f"Trades: {stats.get('trades', 0)} | "
-            f"PnL: {stats.get('pnl', 0):.4f} | "
-            f"Win Rate: {stats.get('win_rate', 0):.2f}%"
+        self.trade_logger.info(
+            "\nDAILY SUMMARY - %s\nTrades: %s | PnL: %.4f | Win Rate: %.2f%%",
+            date, stats.get('trades', 0), stats.get('pnl', 0), stats.get('win_rate', 0)
         )
-        self.trade_logger.info(msg)
 
 
-def setup_logger(log_dir: str = "logs", log_level: str = "INFO") -> BotLogger:
+def setup_logger(log_dir: str = "logs", log_level: str = "INFO", console: bool = None) -> BotLogger:
     """
     Setup and return bot logger instance
     
     Args:
         log_dir: Directory for log files
         log_level: Logging level
+        console: Echo all records to the console (default: BOT_LOG_CONSOLE=1)
         
     Returns:
         BotLogger instance
     """
-    return BotLogger(log_dir, log_level)
+    return BotLogger(log_dir, log_level, console)
 
 
 if __name__ == "__main__":
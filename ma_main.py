@@ -6,6 +6,7 @@ Main script with Interactive Terminal UI
 import os
 import sys
 import time
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, Dict
@@ -73,6 +74,7 @@ class TradingBot:
         # Data
         self.df = None
         self.last_update = None
+        self._indicator_state: Optional[Dict] = None  # indicator state after the last closed candle
         
         self.logger.info("Trading bot initialized successfully")
     
@@ -113,6 +115,7 @@ class TradingBot:
             # Bot settings
             'dry_run': os.getenv('DRY_RUN', 'true').lower() == 'true',
             'log_level': os.getenv('LOG_LEVEL', 'INFO'),
+            'use_websocket': os.getenv('USE_WEBSOCKET', '1') == '1',
             
             # Volume filter
             'use_volume_filter': True,
@@ -176,6 +179,13 @@ class TradingBot:
             timeframe_seconds = self._get_timeframe_seconds()
             from_time = now - (limit * timeframe_seconds)
             
+            # Within a candle of the last fetch only the newest bars changed:
+            # fetch those and step the indicators instead of recomputing 200 bars
+            if (self._indicator_state is not None and self.df is not None
+                    and self._update_market_data_incremental(symbol, step, now, timeframe_seconds)):
+                self.last_update = datetime.now()
+                return True
+            
             # Fetch kline data
             response = self.api.get_kline(symbol, from_time, now, step)
             
@@ -209,14 +219,58 @@ class TradingBot:
             # Calculate indicators
             self.df = self.strategy.calculate_indicators(self.df)
             
+            # State after the last closed candle (the final row is still forming)
+            self._indicator_state = self.strategy.indicator_state(self.df, row=-2)
+            
             self.last_update = datetime.now()
             
+            # Serve live prices from pushed tickers from here on
+            if self.config['use_websocket']:
+                self.api.start_ticker_stream([symbol])
+            
             return True
             
         except Exception as e:
             self.logger.log_exception(e, "fetch_market_data")
             return False
     
+    def _update_market_data_incremental(self, symbol: str, step: int, now: int, timeframe_seconds: int) -> bool:
+        """
+        Refresh the forming candle (and at most one newly opened candle) in place
+        
+        Indicators are stepped from the state after the last closed candle,
+        so only the newest klines are requested.
+        
+        Args:
+            symbol: Trading pair
+            step: BitMart kline step
+            now: Current unix time
+            timeframe_seconds: Candle length in seconds
+            
+        Returns:
+            True if the frame was updated, False if a full fetch is needed (gap or no data)
+        """
+        last_ts = int(self.df['timestamp'].iat[-1])
+        if now >= last_ts + 2 * timeframe_seconds:
+            return False
+        
+        response = self.api.get_kline(symbol, last_ts, now, step)
+        klines = response.get('data') if response.get('code') == 1000 else None
+        if not klines:
+            return False
+        
+        # V3 API format: [timestamp, open, high, low, close, volume, quote_volume]
+        arr = np.array([kline[:6] for kline in klines], dtype=np.float64)
+        arr = arr[np.argsort(arr[:, 0])]
+        arr = arr[arr[:, 0] >= last_ts]
+        if len(arr) == 0 or int(arr[0, 0]) != last_ts:
+            return False
+        if len(arr) > 2 or (len(arr) == 2 and int(arr[1, 0]) != last_ts + timeframe_seconds):
+            return False
+        
+        self.df, self._indicator_state = self.strategy.update_frame(self.df, self._indicator_state, arr)
+        return True
+    
     def get_live_price(self) -> Optional[float]:
         """Get current live price from ticker (real-time)"""
         try:
@@ -596,6 +650,7 @@ class TradingBot:
             current_price = self.df.iloc[-1]['close'] if self.df is not None else 0
             self.close_position("Bot stopped", current_price)
         
+        self.api.stop_ticker_stream()
         self.logger.log_bot_stop()
         print(f"{Fore.YELLOW}Bot stopped")
     
@@ -718,26 +773,23 @@ class TradingBot:
                     )
                     
                     # Validate indicators (check for NaN in last row)
-                    last_row = df.iloc[-1]
-                    required_indicators = ['ema_short', 'ema_long', 'rsi', 'adx', 'atr']
-                    if any(pd.isna(last_row[ind]) for ind in required_indicators):
+                    latest = Indicators.latest_bar(df)
+                    if any(np.isnan((latest.ema_short, latest.ema_long, latest.rsi, latest.adx, latest.atr))):
                         errors.append(f"{symbol}: Incomplete indicators (NaN)")
                         continue
                     
                     # Check signal using strategy (returns tuple: bool, dict)
                     signal, details = self.strategy.check_long_entry(df)
                     
-                    current_price = df.iloc[-1]['close']
-                    
                     result = {
                         'symbol': symbol,
-                        'price': current_price,
-                        'ema_short': df.iloc[-1]['ema_short'],
-                        'ema_long': df.iloc[-1]['ema_long'],
-                        'rsi': df.iloc[-1]['rsi'],
-                        'adx': df.iloc[-1]['adx'],
-                        'volume': df.iloc[-1]['volume'],
-                        'volume_ma': df.iloc[-1].get('volume_ma', 0),
+                        'price': latest.close,
+                        'ema_short': latest.ema_short,
+                        'ema_long': latest.ema_long,
+                        'rsi': latest.rsi,
+                        'adx': latest.adx,
+                        'volume': latest.volume,
+                        'volume_ma': latest.volume_ma,
                         'signal': signal,
                         'reason': details.get('reason', '')
                     }
@@ -4,7 +4,6 @@ Handle position sizing, stop loss, take profit, and trailing stops
 """
 
 from typing import Dict, Optional, Tuple
-import pandas as pd
 
 
 class RiskManager:
@@ -122,6 +122,61 @@ class TradingStrategy:
             volume_ma_period=self.volume_ma_period
         )
     
+    def indicator_state(self, df: pd.DataFrame, row: int = -1) -> Optional[Dict]:
+        """
+        Get incremental indicator state after a bar (see Indicators.get_indicator_state)
+        
+        Args:
+            df: DataFrame with indicators
+            row: Position of the bar (default last)
+            
+        Returns:
+            State dict, or None if not usable
+        """
+        return Indicators.get_indicator_state(
+            df,
+            row=row,
+            rsi_period=self.rsi_length,
+            atr_period=self.atr_period,
+            adx_period=self.adx_period,
+            volume_ma_period=self.volume_ma_period
+        )
+    
+    def update_indicators(self, state: Dict, high: float, low: float, close: float,
+                          volume: float) -> Tuple[Dict, Dict]:
+        """
+        Extend indicators by one bar from a previous state (see Indicators.update_last)
+        
+        Returns:
+            Tuple of (new state, indicator values for the bar)
+        """
+        return Indicators.update_last(
+            state, high, low, close, volume,
+            ema_short=self.ema_short,
+            ema_long=self.ema_long,
+            rsi_period=self.rsi_length,
+            atr_period=self.atr_period,
+            adx_period=self.adx_period,
+            volume_ma_period=self.volume_ma_period
+        )
+    
+    def update_frame(self, df: pd.DataFrame, state: Dict, bars) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Apply the newest OHLCV bars to an indicator frame (see Indicators.update_frame)
+        
+        Returns:
+            Tuple of (updated DataFrame, state after the bar preceding the new last row)
+        """
+        return Indicators.update_frame(
+            df, state, bars,
+            ema_short=self.ema_short,
+            ema_long=self.ema_long,
+            rsi_period=self.rsi_length,
+            atr_period=self.atr_period,
+            adx_period=self.adx_period,
+            volume_ma_period=self.volume_ma_period
+        )
+    
     def check_long_entry(self, df: pd.DataFrame) -> Tuple[bool, Dict]:
         """
         Check if long entry conditions are met
@@ -135,72 +190,72 @@ class TradingStrategy:
         if len(df) < max(self.ema_long, self.rsi_length, self.atr_period, self.volume_ma_period):
             return False, {"reason": "Insufficient data"}
         
-        latest = df.iloc[-1]
+        latest = Indicators.latest_bar(df)
         details = {
-            "price": latest['close'],
-            "ema_short": latest['ema_short'],
-            "ema_long": latest['ema_long'],
-            "rsi": latest['rsi'],
-            "adx": latest['adx'],
-            "atr": latest['atr'],
-            "volume": latest.get('volume', 0),
-            "volume_ma": latest.get('volume_ma', 0)
+            "price": latest.close,
+            "ema_short": latest.ema_short,
+            "ema_long": latest.ema_long,
+            "rsi": latest.rsi,
+            "adx": latest.adx,
+            "atr": latest.atr,
+            "volume": latest.volume,
+            "volume_ma": latest.volume_ma
         }
         
         # Condition 1: EMA alignment (Price > EMA_short > EMA_long)
         ema_condition = (
-            latest['close'] > latest['ema_short'] and
-            latest['ema_short'] > latest['ema_long']
+            latest.close > latest.ema_short and
+            latest.ema_short > latest.ema_long
         )
         details['ema_aligned'] = ema_condition
         
         # Condition 2: RSI in range
-        rsi_condition = self.rsi_min <= latest['rsi'] <= self.rsi_max
+        rsi_condition = self.rsi_min <= latest.rsi <= self.rsi_max
         details['rsi_valid'] = rsi_condition
         
         # Condition 3: ADX above threshold
-        adx_condition = latest['adx'] >= self.adx_threshold
+        adx_condition = latest.adx >= self.adx_threshold
         details['adx_valid'] = adx_condition
         
         # Condition 4: Volume filter (optional)
         volume_condition = True
         volume_ratio = 0.0
         if self.use_volume_filter and 'volume' in df.columns:
-            volume_ma = latest.get('volume_ma', 1)
-            volume_ratio = latest.get('volume', 0) / volume_ma if volume_ma > 0 else 0
-            volume_condition = latest.get('volume', 0) >= volume_ma
+            volume_ma = latest.volume_ma
+            volume_ratio = latest.volume / volume_ma if volume_ma > 0 else 0
+            volume_condition = latest.volume >= volume_ma
         details['volume_valid'] = volume_condition
         details['volume_ratio'] = volume_ratio
         
         # Log detailed condition checks
         # Condition 1: EMA Trend Alignment
-        price_above_short = latest['close'] > latest['ema_short']
-        short_above_long = latest['ema_short'] > latest['ema_long']
+        price_above_short = latest.close > latest.ema_short
+        short_above_long = latest.ema_short > latest.ema_long
         self.logger.info(
             f"{'✓' if ema_condition else '✗'} Condition 1: EMA Trend - "
             f"Price>{self.ema_short}EMA: {price_above_short}, "
             f"{self.ema_short}EMA>{self.ema_long}EMA: {short_above_long} "
-            f"(Price: {latest['close']:.4f}, EMA{self.ema_short}: {latest['ema_short']:.4f}, "
-            f"EMA{self.ema_long}: {latest['ema_long']:.4f})"
+            f"(Price: {latest.close:.4f}, EMA{self.ema_short}: {latest.ema_short:.4f}, "
+            f"EMA{self.ema_long}: {latest.ema_long:.4f})"
         )
         
         # Condition 2: RSI Range
         self.logger.info(
             f"{'✓' if rsi_condition else '✗'} Condition 2: RSI in range - "
-            f"RSI: {latest['rsi']:.2f} (Target: {self.rsi_min}-{self.rsi_max})"
+            f"RSI: {latest.rsi:.2f} (Target: {self.rsi_min}-{self.rsi_max})"
         )
         
         # Condition 3: ADX Strength
         self.logger.info(
             f"{'✓' if adx_condition else '✗'} Condition 3: ADX strength - "
-            f"ADX: {latest['adx']:.2f} (Threshold: >={self.adx_threshold})"
+            f"ADX: {latest.adx:.2f} (Threshold: >={self.adx_threshold})"
         )
         
         # Condition 4: Volume
         if self.use_volume_filter:
             self.logger.info(
                 f"{'✓' if volume_condition else '✗'} Condition 4: Volume - "
-                f"{latest.get('volume', 0):.2f} vs MA: {latest.get('volume_ma', 0):.2f} "
+                f"{latest.volume:.2f} vs MA: {latest.volume_ma:.2f} "
                 f"(Ratio: {volume_ratio:.2f}x)"
             )
         else:
@@ -210,15 +265,15 @@ class TradingStrategy:
         
         # Market State Summary
         self.logger.info(
-            f"Market State - Price: {latest['close']:.4f}, "
-            f"RSI: {latest['rsi']:.2f}, ADX: {latest['adx']:.2f}, "
-            f"EMA{self.ema_short}: {latest['ema_short']:.4f}, "
-            f"EMA{self.ema_long}: {latest['ema_long']:.4f}, "
+            f"Market State - Price: {latest.close:.4f}, "
+            f"RSI: {latest.rsi:.2f}, ADX: {latest.adx:.2f}, "
+            f"EMA{self.ema_short}: {latest.ema_short:.4f}, "
+            f"EMA{self.ema_long}: {latest.ema_long:.4f}, "
             f"Volume: {volume_ratio:.2f}x" if self.use_volume_filter else 
-            f"Market State - Price: {latest['close']:.4f}, "
-            f"RSI: {latest['rsi']:.2f}, ADX: {latest['adx']:.2f}, "
-            f"EMA{self.ema_short}: {latest['ema_short']:.4f}, "
-            f"EMA{self.ema_long}: {latest['ema_long']:.4f}"
+            f"Market State - Price: {latest.close:.4f}, "
+            f"RSI: {latest.rsi:.2f}, ADX: {latest.adx:.2f}, "
+            f"EMA{self.ema_short}: {latest.ema_short:.4f}, "
+            f"EMA{self.ema_long}: {latest.ema_long:.4f}"
         )
         
         # ⚠️ ALL CONDITIONS MUST BE MET (AND logic)
@@ -242,7 +297,7 @@ class TradingStrategy:
                 details['reason'] = "MAX_USDT_PER_TRADE must be > 0 in .env file"
                 return False, details
             
-            max_position_size = self.max_usdt_per_trade / latest['close']  # Convert USDT to position size
+            max_position_size = self.max_usdt_per_trade / latest.close  # Convert USDT to position size
             
             # Get percentage from config
             entry_1_percent = self.config.get('entry_1_percent', 30) / 100  # Convert to decimal
@@ -250,10 +305,10 @@ class TradingStrategy:
             
             # Calculate entry prices for scale-in strategy
             # Entry based on EMA support levels, NOT current price
-            current_price = latest['close']
-            atr = latest['atr']
-            ema_short = latest['ema_short']
-            ema_long = latest['ema_long']
+            current_price = latest.close
+            atr = latest.atr
+            ema_short = latest.ema_short
+            ema_long = latest.ema_long
             
             # Entry 1: At EMA Short (first support level for pullback entry)
             # This is the primary entry point when price retraces to EMA short
@@ -292,7 +347,7 @@ class TradingStrategy:
             # If entry_signal is False, show message and don't calculate entries
             details['entry_1'] = {"price": 0, "position_size": 0, "stop_loss": 0, "take_profit": 0, "risk_reward": 0}
             details['entry_2'] = {"price": 0, "position_size": 0, "stop_loss": 0, "take_profit": 0, "risk_reward": 0}
-            details['reason'] = f"Trade analysis not available: Failed: EMA alignment, RSI ({latest['rsi']}), Volume"
+            details['reason'] = f"Trade analysis not available: Failed: EMA alignment, RSI ({latest.rsi}), Volume"
         
         return entry_signal, details
 
@@ -311,37 +366,37 @@ class TradingStrategy:
         if len(df) < max(self.ema_long, self.rsi_length, self.atr_period, self.volume_ma_period):
             return False, {"reason": "Insufficient data"}
         
-        latest = df.iloc[-1]
+        latest = Indicators.latest_bar(df)
         details = {
-            "price": latest['close'],
-            "ema_short": latest['ema_short'],
-            "ema_long": latest['ema_long'],
-            "rsi": latest['rsi'],
-            "adx": latest['adx'],
-            "atr": latest['atr']
+            "price": latest.close,
+            "ema_short": latest.ema_short,
+            "ema_long": latest.ema_long,
+            "rsi": latest.rsi,
+            "adx": latest.adx,
+            "atr": latest.atr
         }
         
         # Condition 1: EMA alignment (Price < EMA_short < EMA_long)
         ema_condition = (
-            latest['close'] < latest['ema_short'] and
-            latest['ema_short'] < latest['ema_long']
+            latest.close < latest.ema_short and
+            latest.ema_short < latest.ema_long
         )
         details['ema_aligned'] = ema_condition
         
         # Condition 2: RSI in range (for short, use inverted range)
         rsi_min_short = 100 - self.rsi_max # e.g., if max=70, min_short=30
         rsi_max_short = 100 - self.rsi_min # e.g., if min=40, max_short=60
-        rsi_condition = rsi_min_short <= latest['rsi'] <= rsi_max_short
+        rsi_condition = rsi_min_short <= latest.rsi <= rsi_max_short
         details['rsi_valid'] = rsi_condition
         
         # Condition 3: ADX above threshold
-        adx_condition = latest['adx'] >= self.adx_threshold
+        adx_condition = latest.adx >= self.adx_threshold
         details['adx_valid'] = adx_condition
         
         # Condition 4: Volume filter (optional)
         volume_condition = True
         if self.use_volume_filter and 'volume' in df.columns:
-            volume_condition = latest.get('volume', 0) >= latest.get('volume_ma', 0)
+            volume_condition = latest.volume >= latest.volume_ma
         details['volume_valid'] = volume_condition
         
         # All conditions must be met
@@ -366,16 +421,16 @@ class TradingStrategy:
         if len(df) < 2:
             return False, ""
         
-        latest = df.iloc[-1]
+        latest = Indicators.latest_bar(df)
         
         if position_side == "long":
             # Exit long if price closes below EMA_short
-            if latest['close'] < latest['ema_short']:
+            if latest.close < latest.ema_short:
                 return True, "Price closed below EMA short"
         
         elif position_side == "short":
             # Exit short if price closes above EMA_short
-            if latest['close'] > latest['ema_short']:
+            if latest.close > latest.ema_short:
                 return True, "Price closed above EMA short"
         
         return False, ""
@@ -415,18 +470,18 @@ class TradingStrategy:
         Returns:
             Updated details dict with live price info
         """
-        latest = df.iloc[-1]
+        latest = Indicators.latest_bar(df)
         
         # Validate live price movement since last candle
-        price_change_pct = ((live_price - latest['close']) / latest['close']) * 100
+        price_change_pct = ((live_price - latest.close) / latest.close) * 100
         
         # Warn if price moved significantly (>5%)
         if abs(price_change_pct) > 5:
             details['warning'] = f"Price moved {price_change_pct:+.2f}% since last candle. High volatility!"
         
         # Get EMA levels (these are our entry targets)
-        ema_short = latest['ema_short']
-        # ema_long = latest['ema_long']
+        ema_short = latest.ema_short
+        # ema_long = latest.ema_long
         
         # Check if live price is in good entry zone
         if live_price < ema_short:
@@ -440,7 +495,7 @@ class TradingStrategy:
         # These are already set in check_long_entry
         # Just add live price info for monitoring
         details['live_price'] = live_price
-        details['last_candle_price'] = latest['close']
+        details['last_candle_price'] = latest.close
         details['price_change_pct'] = price_change_pct
         
         return details
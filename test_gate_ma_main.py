@@ -0,0 +1,27 @@
+"""
+Test order price/amount truncation against Decimal.quantize(ROUND_DOWN)
+"""
+
+from decimal import Decimal, ROUND_DOWN
+
+import pytest
+
+from gate_ma_main import _truncate
+
+
+def decimal_truncate(value, precision):
+    """Reference: truncate the shortest repr of `value` with Decimal"""
+    step = Decimal(1).scaleb(-precision)
+    return float(Decimal(repr(value)).quantize(step, rounding=ROUND_DOWN))
+
+
+@pytest.mark.parametrize("value, precision, expected", [
+    (0.29, 2, 0.29),
+    (0.12345678999999, 8, 0.12345678),
+    (1234567.8999999, 1, 1234567.8),
+    (999999.99999999, 2, 999999.99),
+])
+def test_truncate_matches_decimal(value, precision, expected):
+    """Values a rounding error below a step snap up; anything smaller rounds down"""
+    assert _truncate(value, precision) == expected
+    assert _truncate(value, precision) == decimal_truncate(value, precision)
@@ -0,0 +1,54 @@
+"""
+Test incremental indicator updates against a full recompute
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators import Indicators
+
+PERIODS = dict(ema_short=9, ema_long=21, rsi_period=14, atr_period=14, adx_period=14,
+               volume_ma_period=20)
+
+
+def create_test_data(n=200, seed=7):
+    """Random-walk OHLCV bars"""
+    rng = np.random.default_rng(seed)
+    close = 60000 + np.cumsum(rng.normal(0, 50, n))
+    return pd.DataFrame({
+        'high': close + np.abs(rng.normal(0, 30, n)),
+        'low': close - np.abs(rng.normal(0, 30, n)),
+        'close': close,
+        'volume': rng.uniform(10, 100, n)
+    })
+
+
+@pytest.mark.parametrize("backend", ["pandas", "numba"])
+def test_update_last_matches_full_recompute(monkeypatch, backend):
+    """One update_last step equals recomputing the whole frame"""
+    monkeypatch.setattr(indicators, "_BACKEND", backend)
+    Indicators.clear_cache()
+    df = create_test_data()
+
+    previous = Indicators.calculate_all_indicators(df.iloc[:-1], **PERIODS)
+    full = Indicators.calculate_all_indicators(df, **PERIODS)
+    Indicators.clear_cache()
+
+    state = Indicators.get_indicator_state(previous, rsi_period=14, atr_period=14, adx_period=14,
+                                           volume_ma_period=20)
+    assert state is not None
+
+    bar = df.iloc[-1]
+    _, values = Indicators.update_last(state, bar['high'], bar['low'], bar['close'], bar['volume'],
+                                       **PERIODS)
+    for column, value in values.items():
+        assert value == pytest.approx(full[column].iat[-1], rel=1e-9), column
+
+
+def test_no_incremental_state_with_talib(monkeypatch):
+    """TA-Lib columns use other smoothing, so the bots must fully recompute"""
+    df = Indicators.calculate_all_indicators(create_test_data(), **PERIODS)
+    monkeypatch.setattr(indicators, "_BACKEND", "talib")
+    assert Indicators.get_indicator_state(df) is None